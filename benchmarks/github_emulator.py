@@ -0,0 +1,564 @@
+"""
+Local stand-in for the GitHub REST API endpoints used by the scripts.
+
+It serves a synthetic organization of a configurable size, e.g., 10,000 repositories
+and 1,000,000 commits, with the Link, ETag and X-RateLimit-* headers of GitHub.
+Nothing is stored: every item is computed from its index when a page is requested,
+so the size of the organization does not change the memory of the emulator.
+
+Endpoints:
+    /orgs/{org}, /orgs/{org}/members, /orgs/{org}/repos,
+    /repos/{owner}/{repo}, /repos/{owner}/{repo}/contributors,
+    /repos/{owner}/{repo}/commits, /repos/{owner}/{repo}/issues, /users/{login}
+    /_stats and /_reset for the benchmarks, e.g., the number of requests and bytes sent
+
+e.g., python3 benchmarks/github_emulator.py --repos 1000 --commits 100000 --latency-ms 20 --port 8000
+      and set "api-url": "http://127.0.0.1:8000" in config.json
+"""
+
+import argparse
+import datetime
+import hashlib
+import json
+import re
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+##############################################################################
+# Constants
+DEFAULT_ORG_NAME = "emulated-org"
+DEFAULT_REPOS = 10
+DEFAULT_COMMITS = 10000
+DEFAULT_ISSUES_PER_REPO = 30
+DEFAULT_CONTRIBUTORS_PER_REPO = 10
+DEFAULT_USERS = 500
+DEFAULT_MEMBERS = 100
+DEFAULT_RATE_LIMIT = 5000
+DEFAULT_RATE_LIMIT_WINDOW = 3600
+# Commits and issues are spread over a year from this date
+DATA_START = datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc)
+DATA_SPAN_SECONDS = 365 * 24 * 60 * 60
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+DEFAULT_PER_PAGE = 30
+MAX_PER_PAGE = 100
+
+
+def to_timestamp(seconds):
+    """Returns the timestamp of seconds after DATA_START."""
+    return (DATA_START + datetime.timedelta(seconds=seconds)).strftime(TIMESTAMP_FORMAT)
+
+
+def to_seconds(timestamp):
+    """Returns the seconds after DATA_START of a timestamp or a date, e.g., "2023-01-01"."""
+    if "T" not in timestamp:
+        timestamp += "T00:00:00Z"
+    moment = datetime.datetime.strptime(timestamp, TIMESTAMP_FORMAT).replace(tzinfo=datetime.timezone.utc)
+    return int((moment - DATA_START).total_seconds())
+
+
+class SyntheticSeries:
+    """
+    Items spread evenly over DATA_SPAN_SECONDS, e.g., the commits of a repository.
+
+    The time of an item is computed from its index,
+    so the items in a period are found by a binary search without storing them.
+    """
+
+    def __init__(self, count):
+        self.count = count
+
+    def seconds(self, index):
+        return index * DATA_SPAN_SECONDS // max(self.count, 1)
+
+    def first_index_at_or_after(self, seconds):
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            if self.seconds(middle) < seconds:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def index_range(self, since=None, until=None):
+        """Returns the range of indexes of the items from since until until (inclusive)."""
+        start = 0 if since is None else self.first_index_at_or_after(to_seconds(since))
+        stop = self.count if until is None else self.first_index_at_or_after(to_seconds(until) + 1)
+        return range(start, max(start, stop))
+
+
+class SyntheticOrg:
+    """A synthetic organization, whose items are computed from their indexes."""
+
+    def __init__(
+        self,
+        name=DEFAULT_ORG_NAME,
+        repos=DEFAULT_REPOS,
+        commits=DEFAULT_COMMITS,
+        issues_per_repo=DEFAULT_ISSUES_PER_REPO,
+        contributors_per_repo=DEFAULT_CONTRIBUTORS_PER_REPO,
+        users=DEFAULT_USERS,
+        members=DEFAULT_MEMBERS,
+    ):
+        self.name = name
+        self.repos = repos
+        self.commits = commits
+        self.issues_per_repo = issues_per_repo
+        self.contributors_per_repo = min(contributors_per_repo, users)
+        self.users = users
+        self.members = members
+        # Seconds of the commits pushed to a repository by push_commits(), by repository index
+        self.pushed_commits = {}
+
+    def repo_name(self, index):
+        return f"repo-{index:05d}"
+
+    def repo_index(self, repo_name):
+        match = re.fullmatch(r"repo-(\d+)", repo_name)
+        if match is None or int(match.group(1)) >= self.repos:
+            return None
+        return int(match.group(1))
+
+    def commit_series(self, repo_index):
+        # The commits are divided among the repositories as evenly as possible
+        count = self.commits // self.repos + (1 if repo_index < self.commits % self.repos else 0)
+        return SyntheticSeries(count)
+
+    def push_commits(self, repo_index, timestamps):
+        """
+        Pushes commits to a repository after the series, e.g., to test a later run.
+
+        :param repo_index: Index of the repository.
+        :param timestamps: Committer dates of the commits, which can be older than the latest one,
+                           e.g., of a merged branch.
+        """
+        self.pushed_commits.setdefault(repo_index, []).extend(to_seconds(timestamp) for timestamp in timestamps)
+
+    def get_pushed_commits(self, repo_index, since=None, until=None):
+        """Returns the pairs of seconds and index of the pushed commits from since until until (inclusive)."""
+        count = self.commit_series(repo_index).count
+        commits = []
+        for offset, seconds in enumerate(self.pushed_commits.get(repo_index, [])):
+            if since is not None and seconds < to_seconds(since):
+                continue
+            if until is not None and seconds > to_seconds(until):
+                continue
+            # The indexes of the pushed commits follow the ones of the series
+            commits.append((seconds, count + offset))
+        return commits
+
+    def user_login(self, index):
+        return f"user-{index:05d}"
+
+    def user_type(self, index):
+        return "Bot" if index % 97 == 0 else "User"
+
+    def get_org(self, base_url):
+        return {
+            "login": self.name,
+            "id": 1,
+            "name": self.name,
+            "public_repos": self.repos,
+            "repos_url": f"{base_url}/orgs/{self.name}/repos",
+            "members_url": f"{base_url}/orgs/{self.name}/members{{/member}}",
+            "html_url": f"https://github.com/{self.name}",
+        }
+
+    def get_repo(self, base_url, index):
+        name = self.repo_name(index)
+        full_name = f"{self.name}/{name}"
+        return {
+            "id": 1000 + index,
+            "name": name,
+            "full_name": full_name,
+            "private": False,
+            "html_url": f"https://github.com/{full_name}",
+            "description": f"Synthetic repository {index}",
+            "fork": False,
+            "url": f"{base_url}/repos/{full_name}",
+            "contributors_url": f"{base_url}/repos/{full_name}/contributors",
+            "commits_url": f"{base_url}/repos/{full_name}/commits{{/sha}}",
+            "issues_url": f"{base_url}/repos/{full_name}/issues{{/number}}",
+            "created_at": to_timestamp(0),
+            "updated_at": to_timestamp(DATA_SPAN_SECONDS),
+            "pushed_at": to_timestamp(DATA_SPAN_SECONDS),
+            "stargazers_count": index * 7 % 500,
+            "watchers_count": index * 7 % 500,
+            "forks_count": index * 3 % 50,
+            "open_issues_count": 0,
+            "default_branch": "main",
+        }
+
+    def get_user(self, base_url, index, full=False):
+        login = self.user_login(index)
+        user = {
+            "login": login,
+            "id": 10000 + index,
+            "url": f"{base_url}/users/{login}",
+            "html_url": f"https://github.com/{login}",
+            "type": self.user_type(index),
+            "site_admin": False,
+        }
+        if full:
+            user.update(
+                {
+                    "name": f"User {index}",
+                    "email": f"{login}@example.com" if index % 3 == 0 else None,
+                    "company": None,
+                    "location": None,
+                    "public_repos": index % 30,
+                    "followers": index % 100,
+                    "created_at": to_timestamp(0),
+                }
+            )
+        return user
+
+    def get_commit(self, base_url, repo_index, index, seconds):
+        full_name = f"{self.name}/{self.repo_name(repo_index)}"
+        sha = hashlib.sha1(f"{full_name}/{index}".encode()).hexdigest()
+        date = to_timestamp(seconds)
+        author = self.get_user(base_url, (repo_index * 3 + index) % self.users)
+        person = {"name": author["login"], "email": f"{author['login']}@example.com", "date": date}
+        return {
+            "sha": sha,
+            "node_id": f"C_{sha[:20]}",
+            "commit": {
+                "author": person,
+                "committer": person,
+                "message": f"Change {index} of {full_name}",
+                "tree": {"sha": sha[::-1], "url": f"{base_url}/repos/{full_name}/git/trees/{sha[::-1]}"},
+                "url": f"{base_url}/repos/{full_name}/git/commits/{sha}",
+                "comment_count": 0,
+                "verification": {"verified": False, "reason": "unsigned", "signature": None, "payload": None},
+            },
+            "url": f"{base_url}/repos/{full_name}/commits/{sha}",
+            "html_url": f"https://github.com/{full_name}/commit/{sha}",
+            "comments_url": f"{base_url}/repos/{full_name}/commits/{sha}/comments",
+            "author": author,
+            "committer": author,
+            "parents": [],
+        }
+
+    def get_issue(self, base_url, repo_index, series, index):
+        full_name = f"{self.name}/{self.repo_name(repo_index)}"
+        date = to_timestamp(series.seconds(index))
+        issue = {
+            "id": 100000 + index,
+            "number": index + 1,
+            "title": f"Issue {index + 1}",
+            "state": "closed",
+            "url": f"{base_url}/repos/{full_name}/issues/{index + 1}",
+            "html_url": f"https://github.com/{full_name}/issues/{index + 1}",
+            "user": self.get_user(base_url, (repo_index + index) % self.users),
+            "created_at": date,
+            "updated_at": date,
+            "closed_at": date,
+            "comments": 0,
+        }
+        # Every third one is a pull request
+        if index % 3 == 0:
+            issue["pull_request"] = {"url": f"{base_url}/repos/{full_name}/pulls/{index + 1}"}
+        return issue
+
+    def get_contributor_indexes(self, repo_index):
+        return [(repo_index * 3 + offset) % self.users for offset in range(self.contributors_per_repo)]
+
+
+class EmulatorState:
+    """Rate limits per access token and the statistics of the requests."""
+
+    def __init__(self, rate_limit, rate_limit_window, latency):
+        self.rate_limit = rate_limit
+        self.rate_limit_window = rate_limit_window
+        self.latency = latency
+        self.remaining = {}
+        self.reset_at = {}
+        self.requests = 0
+        self.bytes_sent = 0
+        self.not_modified = 0
+        self.rate_limited = 0
+        self.lock = threading.Lock()
+
+    def take(self, token):
+        """Takes a request from the rate limit of a token, returns the remaining and the reset time."""
+        with self.lock:
+            now = int(time.time())
+            if self.reset_at.get(token, 0) <= now:
+                self.reset_at[token] = now + self.rate_limit_window
+                self.remaining[token] = self.rate_limit
+            if self.remaining[token] > 0:
+                self.remaining[token] -= 1
+                return self.remaining[token], self.reset_at[token], True
+            self.rate_limited += 1
+            return 0, self.reset_at[token], False
+
+    def give_back(self, token):
+        """A 304 Not Modified response does not count against the rate limit."""
+        with self.lock:
+            self.remaining[token] += 1
+            self.not_modified += 1
+
+    def count(self, size):
+        with self.lock:
+            self.requests += 1
+            self.bytes_sent += size
+
+    def get_stats(self):
+        with self.lock:
+            return {
+                "requests": self.requests,
+                "bytes_sent": self.bytes_sent,
+                "not_modified": self.not_modified,
+                "rate_limited": self.rate_limited,
+            }
+
+    def reset(self):
+        with self.lock:
+            self.requests = 0
+            self.bytes_sent = 0
+            self.not_modified = 0
+            self.rate_limited = 0
+            self.remaining = {}
+            self.reset_at = {}
+
+
+class EmulatorHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Set by create_server()
+    org = None
+    state = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def base_url(self):
+        return f"http://{self.headers['Host']}"
+
+    def send_json(self, status, payload, extra_headers=None, rate_limit=None):
+        body = json.dumps(payload).encode()
+        etag = '"%s"' % hashlib.md5(body).hexdigest()
+
+        headers = {"Content-Type": "application/json; charset=utf-8", "ETag": etag}
+        headers.update(extra_headers or {})
+        if rate_limit is not None:
+            token, remaining, reset_at = rate_limit
+            headers.update(
+                {
+                    "X-RateLimit-Limit": str(self.state.rate_limit),
+                    "X-RateLimit-Remaining": str(remaining),
+                    "X-RateLimit-Reset": str(reset_at),
+                    "X-RateLimit-Resource": "core",
+                }
+            )
+
+        if status == 200 and self.headers.get("If-None-Match") == etag:
+            if rate_limit is not None:
+                self.state.give_back(rate_limit[0])
+            status, body = 304, b""
+
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+        self.state.count(len(body))
+
+    def send_page(self, url, query, total, get_item, rate_limit):
+        """Sends a page of items, get_item(position) returns the item at a position of the list."""
+        per_page = min(int(query.get("per_page", DEFAULT_PER_PAGE)), MAX_PER_PAGE)
+        page = max(int(query.get("page", 1)), 1)
+        last_page = max((total + per_page - 1) // per_page, 1)
+
+        start = (page - 1) * per_page
+        items = [get_item(position) for position in range(start, min(start + per_page, total))]
+
+        def page_url(number):
+            return self.base_url() + url.path + "?" + urllib.parse.urlencode(dict(query, page=number))
+
+        links = []
+        if page < last_page:
+            links.append(f'<{page_url(page + 1)}>; rel="next"')
+            links.append(f'<{page_url(last_page)}>; rel="last"')
+        if page > 1:
+            links.append(f'<{page_url(1)}>; rel="first"')
+            links.append(f'<{page_url(page - 1)}>; rel="prev"')
+
+        self.send_json(200, items, {"Link": ", ".join(links)} if links else None, rate_limit)
+
+    def do_GET(self):
+        url = urllib.parse.urlparse(self.path)
+        query = dict(urllib.parse.parse_qsl(url.query))
+        path = url.path.rstrip("/")
+
+        if path == "/_stats":
+            return self.send_json(200, self.state.get_stats())
+        if path == "/_reset":
+            self.state.reset()
+            return self.send_json(200, {})
+
+        if self.state.latency:
+            time.sleep(self.state.latency)
+
+        token = self.headers.get("Authorization", "")
+        remaining, reset_at, allowed = self.state.take(token)
+        rate_limit = (token, remaining, reset_at)
+        if not allowed:
+            message = {"message": "API rate limit exceeded", "documentation_url": "https://docs.github.com/rest"}
+            return self.send_json(403, message, rate_limit=rate_limit)
+
+        self.route(url, query, path, rate_limit)
+
+    def route(self, url, query, path, rate_limit):
+        org = self.org
+        base_url = self.base_url()
+
+        if path == f"/orgs/{org.name}":
+            return self.send_json(200, org.get_org(base_url), rate_limit=rate_limit)
+
+        if path == f"/orgs/{org.name}/members":
+            return self.send_page(
+                url, query, org.members, lambda position: org.get_user(base_url, position % org.users), rate_limit
+            )
+
+        if path == f"/orgs/{org.name}/repos":
+            return self.send_page(url, query, org.repos, lambda position: org.get_repo(base_url, position), rate_limit)
+
+        match = re.fullmatch(r"/users/([^/]+)", path)
+        if match:
+            user_match = re.fullmatch(r"user-(\d+)", match.group(1))
+            if user_match and int(user_match.group(1)) < org.users:
+                user = org.get_user(base_url, int(user_match.group(1)), full=True)
+                return self.send_json(200, user, rate_limit=rate_limit)
+            return self.send_json(404, {"message": "Not Found"}, rate_limit=rate_limit)
+
+        match = re.fullmatch(r"/repos/([^/]+)/([^/]+)(/[a-z]+)?", path)
+        repo_index = org.repo_index(match.group(2)) if match and match.group(1) == org.name else None
+        if repo_index is None:
+            return self.send_json(404, {"message": "Not Found"}, rate_limit=rate_limit)
+
+        endpoint = match.group(3)
+        if endpoint is None:
+            return self.send_json(200, org.get_repo(base_url, repo_index), rate_limit=rate_limit)
+
+        if endpoint == "/contributors":
+            indexes = org.get_contributor_indexes(repo_index)
+
+            def get_contributor(position):
+                contributor = org.get_user(base_url, indexes[position])
+                contributor["contributions"] = len(indexes) - position
+                return contributor
+
+            return self.send_page(url, query, len(indexes), get_contributor, rate_limit)
+
+        if endpoint == "/commits":
+            series = org.commit_series(repo_index)
+            indexes = series.index_range(query.get("since"), query.get("until"))
+            pushed_commits = org.get_pushed_commits(repo_index, query.get("since"), query.get("until"))
+
+            # The newest commit first
+            def get_commit(position):
+                index = indexes[len(indexes) - 1 - position]
+                return org.get_commit(base_url, repo_index, index, series.seconds(index))
+
+            if not pushed_commits:
+                return self.send_page(url, query, len(indexes), get_commit, rate_limit)
+
+            # The pushed commits are listed by their dates among the ones of the series
+            commits = sorted([(series.seconds(index), index) for index in indexes] + pushed_commits, reverse=True)
+
+            def get_listed_commit(position):
+                seconds, index = commits[position]
+                return org.get_commit(base_url, repo_index, index, seconds)
+
+            return self.send_page(url, query, len(commits), get_listed_commit, rate_limit)
+
+        if endpoint == "/issues":
+            series = SyntheticSeries(org.issues_per_repo)
+            # Every issue is closed, so no issue is open
+            if query.get("state", "open") == "open":
+                indexes = range(0)
+            else:
+                indexes = series.index_range(query.get("since"))
+
+            def get_issue(position):
+                return org.get_issue(base_url, repo_index, series, indexes[len(indexes) - 1 - position])
+
+            return self.send_page(url, query, len(indexes), get_issue, rate_limit)
+
+        self.send_json(404, {"message": "Not Found"}, rate_limit=rate_limit)
+
+
+def create_server(
+    org,
+    host="127.0.0.1",
+    port=0,
+    latency_ms=0,
+    rate_limit=DEFAULT_RATE_LIMIT,
+    rate_limit_window=DEFAULT_RATE_LIMIT_WINDOW,
+):
+    """
+    Creates an emulator server of a synthetic organization.
+
+    :param org: SyntheticOrg to serve.
+    :param host: Host to listen on.
+    :param port: Port to listen on, 0 for a free port.
+    :param latency_ms: Latency added to each request in milliseconds.
+    :param rate_limit: Requests per window of an access token.
+    :param rate_limit_window: Seconds until the rate limit is reset.
+    :return: ThreadingHTTPServer, call serve_forever() to start it.
+    """
+    handler = type(
+        "Handler",
+        (EmulatorHandler,),
+        {"org": org, "state": EmulatorState(rate_limit, rate_limit_window, latency_ms / 1000)},
+    )
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def add_org_arguments(parser):
+    """Adds the arguments of the size of a synthetic organization to an argparse.ArgumentParser."""
+    parser.add_argument("--org", default=DEFAULT_ORG_NAME, help="name of the organization")
+    parser.add_argument("--repos", type=int, default=DEFAULT_REPOS, help="number of repositories")
+    parser.add_argument("--commits", type=int, default=DEFAULT_COMMITS, help="total number of commits")
+    parser.add_argument("--issues-per-repo", type=int, default=DEFAULT_ISSUES_PER_REPO, help="closed issues and PRs")
+    parser.add_argument("--contributors-per-repo", type=int, default=DEFAULT_CONTRIBUTORS_PER_REPO)
+    parser.add_argument("--users", type=int, default=DEFAULT_USERS, help="number of users contributing")
+    parser.add_argument("--members", type=int, default=DEFAULT_MEMBERS, help="number of members")
+    parser.add_argument("--latency-ms", type=float, default=0, help="latency added to each request")
+    parser.add_argument("--rate-limit", type=int, default=DEFAULT_RATE_LIMIT, help="requests per window of a token")
+    parser.add_argument("--rate-limit-window", type=int, default=DEFAULT_RATE_LIMIT_WINDOW, help="seconds")
+
+
+def create_org(args):
+    """Creates a SyntheticOrg from the arguments of add_org_arguments()."""
+    return SyntheticOrg(
+        args.org, args.repos, args.commits, args.issues_per_repo, args.contributors_per_repo, args.users, args.members
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a synthetic organization of the GitHub REST API.")
+    add_org_arguments(parser)
+    parser.add_argument("--host", default="127.0.0.1", help="host to listen on")
+    parser.add_argument("--port", type=int, default=8000, help="port to listen on, 0 for a free port")
+    args = parser.parse_args()
+
+    server = create_server(
+        create_org(args), args.host, args.port, args.latency_ms, args.rate_limit, args.rate_limit_window
+    )
+    # The benchmarks read the URL from the first line
+    print(f"http://{args.host}:{server.server_port}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
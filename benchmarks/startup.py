@@ -0,0 +1,92 @@
+"""
+Measures the cold start of the commands, each in a fresh interpreter.
+
+A command is measured by importing its module, which is what every run pays
+before the first request. The modules must not import the heavy libraries,
+e.g., pandas, which are imported only on the code paths that need them.
+
+e.g., python3 benchmarks/startup.py --runs 10 --target-ms 250
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+##############################################################################
+# Constants
+ROOT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Modules of the commands
+COMMAND_MODULES = [
+    "github_influence.orgs",
+    "github_influence.count_unique_contributors",
+    "github_influence.get_org_repos",
+    "github_influence.commit_store",
+]
+# Libraries that must not be imported at startup
+HEAVY_MODULES = ["pandas", "numpy", "dateutil"]
+DEFAULT_RUNS = 10
+DEFAULT_TARGET_MS = 250
+
+# Prints the import time in milliseconds and the heavy modules imported
+MEASURE_CODE = """
+import sys, time
+start = time.perf_counter()
+import {module}
+elapsed = (time.perf_counter() - start) * 1000
+heavy = [name for name in {heavy_modules!r} if name in sys.modules]
+print(elapsed, ",".join(heavy))
+"""
+
+
+def measure_startup(module, runs):
+    """
+    Imports a module in fresh interpreters and measures the time.
+
+    :param module: Name of the module.
+    :param runs: Number of runs.
+    :return: Tuple of the list of milliseconds and the list of the heavy modules imported.
+    """
+    code = MEASURE_CODE.format(module=module, heavy_modules=HEAVY_MODULES)
+
+    timings = []
+    heavy = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", code], cwd=ROOT_DIRECTORY, capture_output=True, text=True, check=True
+        ).stdout.split()
+        timings.append(float(output[0]))
+        if len(output) > 1:
+            heavy = output[1].split(",")
+
+    return timings, heavy
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the cold start of the commands.")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS, help="number of runs per command")
+    parser.add_argument(
+        "--target-ms", type=float, default=DEFAULT_TARGET_MS, help="maximum median import time in milliseconds"
+    )
+    args = parser.parse_args()
+
+    failed = False
+    for module in COMMAND_MODULES:
+        timings, heavy = measure_startup(module, args.runs)
+        median = statistics.median(timings)
+
+        note = ""
+        if heavy:
+            note += f"  imports {', '.join(heavy)}"
+            failed = True
+        if median > args.target_ms:
+            note += f"  over the target of {args.target_ms:.0f} ms"
+            failed = True
+        print(f"{module:44} : median {median:7.1f} ms, min {min(timings):7.1f} ms{note}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
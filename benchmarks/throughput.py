@@ -0,0 +1,195 @@
+"""
+Measures the throughput of the commands against the GitHub API emulator.
+
+Each scenario starts benchmarks/github_emulator.py with a synthetic organization of a size,
+and runs a command in a fresh interpreter and a temporary directory with its own config.json,
+whose "api-url" points to the emulator. No request reaches GitHub and no token is needed.
+
+It reports the wall time, the number of requests and bytes served by the emulator,
+and the peak memory of the command. The peak is the largest size of the Python objects
+traced by tracemalloc, not the RSS of the process, which is dominated by the interpreter.
+Tracing slows the command down, so the memory is measured by a second run of the command.
+
+e.g., python3 benchmarks/throughput.py --sizes 10 1000 --commits 100000 --latency-ms 20 --json results.json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+##############################################################################
+# Constants
+ROOT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+EMULATOR_PATH = os.path.join(ROOT_DIRECTORY, "benchmarks", "github_emulator.py")
+# Modules of the commands and their extra config
+COMMANDS = {
+    "orgs": {},
+    "count_unique_contributors": {"pipeline": True},
+}
+DEFAULT_SIZES = [10, 100, 1000]
+DEFAULT_COMMITS = 10000
+DEFAULT_MAX_WORKERS = 8
+# The emulator does not limit the pace, so the scheduler of the commands should not either
+DEFAULT_REQUESTS_PER_SECOND = 1000
+# Name of the file the traced run writes the peak memory to, in the directory of the command
+PEAK_FILE_NAME = "tracemalloc-peak.json"
+
+# Runs a command module as __main__ with tracemalloc, and writes the peak in bytes
+TRACED_RUN_CODE = """
+import json, runpy, sys, tracemalloc
+module = sys.argv[1]
+sys.argv = [module] + sys.argv[2:]
+tracemalloc.start()
+try:
+    runpy.run_module(module, run_name="__main__", alter_sys=True)
+finally:
+    with open({peak_file_name!r}, "w") as peak_file:
+        json.dump(tracemalloc.get_traced_memory()[1], peak_file)
+"""
+
+
+def start_emulator(args, repos):
+    """
+    Starts the emulator serving a synthetic organization in a subprocess.
+
+    :return: Tuple of the process and the URL of the emulator.
+    """
+    command = [
+        sys.executable,
+        EMULATOR_PATH,
+        "--port",
+        "0",
+        "--repos",
+        str(repos),
+        "--commits",
+        str(args.commits),
+        "--latency-ms",
+        str(args.latency_ms),
+    ]
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+    url = process.stdout.readline().strip()
+    if not url:
+        process.kill()
+        raise Exception("The emulator did not start")
+    return process, url
+
+
+def get_emulator_stats(url, path="/_stats"):
+    with urllib.request.urlopen(url + path) as response:
+        return json.load(response)
+
+
+def write_workspace(directory, url, repos, args, extra_config):
+    """Writes auth.json and config.json of a command targeting the emulator."""
+    with open(os.path.join(directory, "auth.json"), "w") as auth_file:
+        json.dump({"personal-access-token": "emulator-token"}, auth_file)
+
+    config = {
+        "org-name": "emulated-org",
+        "since": "2023-01-01",
+        "until": "2023-12-31",
+        "api-url": url,
+        "max-workers": args.max_workers,
+        "requests-per-second": DEFAULT_REQUESTS_PER_SECOND,
+        "repositories": [f"repo-{index:05d}" for index in range(repos)],
+    }
+    config.update(extra_config)
+    with open(os.path.join(directory, "config.json"), "w") as config_file:
+        json.dump(config, config_file, indent=2)
+
+
+def run_command(module, directory, trace_memory=False):
+    """
+    Runs a command in a fresh interpreter.
+
+    :param module: Name of the module of the command, e.g., "orgs".
+    :param directory: Working directory with auth.json and config.json.
+    :param trace_memory: Trace the memory by tracemalloc (optional).
+    :return: Tuple of the seconds elapsed and the peak memory in megabytes, None if it is not traced.
+    """
+    environment = dict(os.environ, PYTHONPATH=ROOT_DIRECTORY)
+    command_module = f"github_influence.{module}"
+    if trace_memory:
+        command = [sys.executable, "-c", TRACED_RUN_CODE.format(peak_file_name=PEAK_FILE_NAME), command_module]
+    else:
+        command = [sys.executable, "-m", command_module]
+
+    with tempfile.TemporaryFile("w+") as stderr:
+        start = time.perf_counter()
+        process = subprocess.run(
+            command + ["--no-cache"], cwd=directory, env=environment, stdout=subprocess.DEVNULL, stderr=stderr
+        )
+        elapsed = time.perf_counter() - start
+
+        stderr.seek(0)
+        errors = stderr.read()
+
+    if process.returncode != 0:
+        raise Exception(f"{module} failed with exit code {process.returncode}\n{errors}")
+
+    if not trace_memory:
+        return elapsed, None
+    with open(os.path.join(directory, PEAK_FILE_NAME)) as peak_file:
+        return elapsed, json.load(peak_file) / 1024 / 1024
+
+
+def run_scenario(module, repos, args):
+    """Runs a command against an organization of a size and returns its measurements."""
+    process, url = start_emulator(args, repos)
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            write_workspace(directory, url, repos, args, COMMANDS[module])
+            elapsed, _ = run_command(module, directory)
+            stats = get_emulator_stats(url)
+            get_emulator_stats(url, "/_reset")
+            _, peak_megabytes = run_command(module, directory, trace_memory=True)
+    finally:
+        process.terminate()
+        process.wait()
+
+    return {
+        "command": module,
+        "repos": repos,
+        "commits": args.commits,
+        "latency_ms": args.latency_ms,
+        "seconds": round(elapsed, 3),
+        "requests": stats["requests"],
+        "requests_per_second": round(stats["requests"] / elapsed, 1),
+        "megabytes": round(stats["bytes_sent"] / 1024 / 1024, 2),
+        "peak_megabytes": round(peak_megabytes, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the throughput of the commands against the emulator.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="numbers of repositories")
+    parser.add_argument("--commits", type=int, default=DEFAULT_COMMITS, help="total number of commits")
+    parser.add_argument("--latency-ms", type=float, default=0, help="latency added to each request")
+    parser.add_argument("--max-workers", type=int, default=DEFAULT_MAX_WORKERS, help="max-workers of the commands")
+    parser.add_argument("--commands", nargs="+", default=list(COMMANDS), choices=list(COMMANDS))
+    parser.add_argument("--json", help="path to write the results as JSON")
+    args = parser.parse_args()
+
+    results = []
+    for module in args.commands:
+        for repos in args.sizes:
+            result = run_scenario(module, repos, args)
+            results.append(result)
+            print(
+                f"{module:26} {repos:6} repos : {result['seconds']:8.2f} s, {result['requests']:7} requests "
+                f"({result['requests_per_second']:7.1f}/s), {result['megabytes']:8.2f} MB, "
+                f"peak {result['peak_megabytes']:7.1f} MB"
+            )
+
+    if args.json:
+        with open(args.json, "w") as json_file:
+            json.dump(results, json_file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,4 @@
+from github_influence.commit_store import main
+
+if __name__ == "__main__":
+    main()
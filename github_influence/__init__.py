@@ -0,0 +1 @@
+"""Counts the meaningful achievements of an organization on GitHub."""
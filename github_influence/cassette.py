@@ -0,0 +1,140 @@
+import gzip
+import json
+import os
+import threading
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+##############################################################################
+# Constants
+MODE_RECORD = "record"
+MODE_REPLAY = "replay"
+
+
+def get_interaction_key(method, url, params=None, json_body=None):
+    """
+    Returns the key of a request in a cassette.
+
+    :param method: HTTP method, e.g., "GET".
+    :param url: URL of the request.
+    :param params: Dictionary of query parameters (optional).
+    :param json_body: JSON body of the request, e.g., a GraphQL query (optional).
+    :return: Method, URL with query parameters and the body, as a string.
+    """
+    key = f"{method} {requests.Request(method, url, params=params).prepare().url}"
+    if json_body is not None:
+        key += " " + json.dumps(json_body, sort_keys=True)
+    return key
+
+
+class Cassette:
+    """
+    Recorded requests and responses of the GitHub API, stored in a gzip-compressed JSON Lines file.
+
+    In the record mode, every response of a live run is appended to the file.
+    In the replay mode, the recorded responses are served without the network,
+    so a run can be repeated offline, e.g., to regenerate the reports after changing them.
+    """
+
+    def __init__(self, path, mode):
+        """
+        :param path: Path of the cassette file, e.g., "cassettes/run.jsonl.gz".
+        :param mode: MODE_RECORD to record a live run, or MODE_REPLAY to serve a recorded one.
+        """
+        self.path = path
+        self.mode = mode
+        self.interactions = {}
+        self.lock = threading.Lock()
+        self.file = None
+
+        if mode == MODE_RECORD:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self.file = gzip.open(path, "wt", encoding="utf-8")
+        elif mode == MODE_REPLAY:
+            self._load()
+        else:
+            raise Exception(f"Unknown cassette mode: {mode}")
+
+    @property
+    def replaying(self):
+        return self.mode == MODE_REPLAY
+
+    def _load(self):
+        # A later response of the same request replaces the earlier one
+        with gzip.open(self.path, "rt", encoding="utf-8") as cassette_file:
+            for line in cassette_file:
+                interaction = json.loads(line)
+                self.interactions[interaction["key"]] = interaction
+
+    def record(self, key, response):
+        """
+        Appends a response to the cassette.
+
+        :param key: Key of the request from get_interaction_key().
+        :param response: Response of requests or httpx.
+        """
+        interaction = {
+            "key": key,
+            "status": response.status_code,
+            "url": str(response.url),
+            "headers": dict(response.headers),
+            "body": response.content.decode("utf-8", errors="replace"),
+        }
+        line = json.dumps(interaction) + "\n"
+        with self.lock:
+            self.file.write(line)
+
+    def replay(self, key):
+        """
+        Returns the recorded response of a request.
+
+        :param key: Key of the request from get_interaction_key().
+        :return: requests.Response, otherwise raises an exception if the request was not recorded.
+        """
+        interaction = self.interactions.get(key)
+        if interaction is None:
+            raise Exception(f"Not recorded in the cassette: {key}")
+
+        response = requests.models.Response()
+        response.status_code = interaction["status"]
+        response.url = interaction["url"]
+        response.headers = CaseInsensitiveDict(interaction["headers"])
+        response.encoding = "utf-8"
+        response._content = interaction["body"].encode("utf-8")
+        return response
+
+    def close(self):
+        if self.file is not None:
+            with self.lock:
+                self.file.close()
+
+
+def add_cassette_arguments(parser):
+    """Adds the command line switches of the cassette to an argparse.ArgumentParser."""
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--record", metavar="CASSETTE", help="record the responses of the run to a cassette file")
+    group.add_argument("--replay", metavar="CASSETTE", help="replay the responses of a cassette file without network")
+
+
+def open_cassette(args):
+    """
+    Opens the cassette according to the command line switches.
+
+    A cassette keeps complete responses, so the HTTP cache and the user cache
+    are bypassed while recording or replaying, as with --no-cache.
+
+    :param args: Parsed arguments with the switches of add_cassette_arguments() and http_cache.add_cache_arguments().
+    :return: Cassette, or None if neither --record nor --replay is given.
+    """
+    if args.record:
+        cassette = Cassette(args.record, MODE_RECORD)
+    elif args.replay:
+        cassette = Cassette(args.replay, MODE_REPLAY)
+    else:
+        return None
+
+    args.no_cache = True
+    return cassette
@@ -0,0 +1,184 @@
+import argparse
+import os
+import sqlite3
+import threading
+
+##############################################################################
+# Constants
+DEFAULT_COMMIT_STORE_PATH = os.path.join(".cache", "commits.sqlite")
+# Columns of the commit dates, which are indexed per repository
+DATE_FIELDS = {
+    "committer": "committer_date",
+    "author": "author_date",
+}
+# Fields of a commit of the GitHub API read by add_commits()
+COMMIT_FIELDS = ["sha", "author.login", "commit.author.date", "commit.committer.date"]
+
+
+def to_timestamp(day):
+    """
+    Returns a timestamp of a date, the same as a date parameter of the GitHub API.
+
+    e.g., 2023-01-01 -> "2023-01-01T00:00:00Z"
+    """
+    day = str(day)
+    if "T" in day:
+        return day
+    return f"{day}T00:00:00Z"
+
+
+class CommitStore:
+    """
+    Local store of commit metadata, stored in SQLite.
+
+    Commit dates are indexed per repository, so the number of commits in
+    any period is counted by a binary search of the index instead of the API.
+    The period of committer dates fully stored is kept per repository,
+    to tell whether a period can be answered locally.
+
+    Timestamps are stored as "YYYY-MM-DDTHH:MM:SSZ", which sorts as a string.
+    """
+
+    def __init__(self, path=DEFAULT_COMMIT_STORE_PATH):
+        """
+        :param path: Path of the SQLite database file.
+        """
+        self.path = path
+        self.lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS commits ("
+            "repo TEXT, sha TEXT, author_login TEXT, author_date TEXT, committer_date TEXT, "
+            "PRIMARY KEY (repo, sha))"
+        )
+        self.connection.execute("CREATE INDEX IF NOT EXISTS commits_committer_date ON commits (repo, committer_date)")
+        self.connection.execute("CREATE INDEX IF NOT EXISTS commits_author_date ON commits (repo, author_date)")
+        self.connection.execute("CREATE TABLE IF NOT EXISTS coverage (repo TEXT PRIMARY KEY, since TEXT, until TEXT)")
+        self.connection.commit()
+
+    def get_coverage(self, repo):
+        """
+        Returns the period of committer dates fully stored for a repository.
+
+        :param repo: Full name of a repository.
+        :return: Tuple of since and until timestamps, or None if nothing is stored.
+        """
+        with self.lock:
+            return self.connection.execute("SELECT since, until FROM coverage WHERE repo = ?", (repo,)).fetchone()
+
+    def add_commits(self, repo, commits, since, until):
+        """
+        Stores commits fetched from the GitHub API for a period of committer dates.
+
+        If the period overlaps or adjoins the stored one, they are merged,
+        otherwise the stored period is replaced by the new one.
+
+        :param repo: Full name of a repository.
+        :param commits: List of commits from the commits endpoint.
+        :param since: Start of the period fetched.
+        :param until: End of the period fetched, not after the time of fetching.
+        """
+        since = to_timestamp(since)
+        until = to_timestamp(until)
+
+        rows = []
+        for commit in commits:
+            author = commit.get("author") or {}
+            rows.append(
+                (
+                    repo,
+                    commit["sha"],
+                    author.get("login"),
+                    commit["commit"]["author"]["date"],
+                    commit["commit"]["committer"]["date"],
+                )
+            )
+
+        with self.lock:
+            self.connection.executemany("INSERT OR REPLACE INTO commits VALUES (?, ?, ?, ?, ?)", rows)
+
+            coverage = self.connection.execute("SELECT since, until FROM coverage WHERE repo = ?", (repo,)).fetchone()
+            if coverage is not None and coverage[0] <= until and since <= coverage[1]:
+                since = min(since, coverage[0])
+                until = max(until, coverage[1])
+            self.connection.execute("INSERT OR REPLACE INTO coverage VALUES (?, ?, ?)", (repo, since, until))
+
+            self.connection.commit()
+
+    def count_commits(self, repo, since, until, date_field="committer"):
+        """
+        Counts the stored commits of a repository in a period.
+
+        :param repo: Full name of a repository.
+        :param since: Start of the period (inclusive).
+        :param until: End of the period (inclusive).
+        :param date_field: "committer" or "author", whose date is used.
+        :return: Number of commits.
+        """
+        column = DATE_FIELDS[date_field]
+        with self.lock:
+            return self.connection.execute(
+                f"SELECT COUNT(*) FROM commits WHERE repo = ? AND {column} BETWEEN ? AND ?",
+                (repo, to_timestamp(since), to_timestamp(until)),
+            ).fetchone()[0]
+
+    def get_commit_dates(self, repo, since, until, date_field="committer"):
+        """
+        Returns the dates of the stored commits of a repository in a period, in ascending order.
+
+        :return: List of timestamps, e.g., ["2023-01-01T09:00:00Z", ...].
+        """
+        column = DATE_FIELDS[date_field]
+        with self.lock:
+            rows = self.connection.execute(
+                f"SELECT {column} FROM commits WHERE repo = ? AND {column} BETWEEN ? AND ? ORDER BY {column}",
+                (repo, to_timestamp(since), to_timestamp(until)),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def get_repos(self):
+        """Returns the full names of the stored repositories."""
+        with self.lock:
+            return [row[0] for row in self.connection.execute("SELECT repo FROM coverage ORDER BY repo")]
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Count commits of a period from the local commit store.")
+    parser.add_argument("--since", required=True, help="start date of the period, e.g., 2023-07-01")
+    parser.add_argument("--until", required=True, help="end date of the period, e.g., 2023-09-30")
+    parser.add_argument("--repo", action="append", help="full name of a repository, all stored ones if omitted")
+    parser.add_argument("--date-field", choices=list(DATE_FIELDS), default="committer", help="date to count by")
+    parser.add_argument("--path", default=DEFAULT_COMMIT_STORE_PATH, help="path of the commit store")
+    args = parser.parse_args()
+
+    commit_store = CommitStore(args.path)
+    since = to_timestamp(args.since)
+    until = to_timestamp(args.until)
+
+    total = 0
+    for repo in args.repo or commit_store.get_repos():
+        coverage = commit_store.get_coverage(repo)
+        number_of_commits = commit_store.count_commits(repo, since, until, args.date_field)
+        total += number_of_commits
+
+        # Commits out of the stored period are unknown
+        note = ""
+        if coverage is None or not (coverage[0] <= since and until <= coverage[1]):
+            note = f"  (stored period: {coverage[0]} ~ {coverage[1]})" if coverage else "  (not stored)"
+        print(f"{repo:50} : {number_of_commits:6}{note}")
+
+    print(f"{'Sum':50} : {total:6}")
+    commit_store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,808 @@
+import argparse
+import csv
+import datetime
+import functools
+import json
+import logging
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from github_influence.github_api import (
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_MAX_PAGE_WORKERS,
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_READ_TIMEOUT,
+    DEFAULT_REQUESTS_PER_SECOND,
+    DEFAULT_SERVER_ERROR_RETRIES,
+    GITHUB_API_URL,
+    close_session,
+    iter_projected_items,
+    request_github_api,
+    request_github_graphql,
+    send_github_request,
+    set_http_cache,
+    set_api_url,
+    set_cassette,
+    set_request_metrics,
+    set_http_options,
+    read_personal_access_tokens,
+    record_cache_hit,
+    set_max_workers,
+    set_rate_limit,
+)
+from github_influence.cassette import add_cassette_arguments, open_cassette
+from github_influence.http_cache import add_cache_arguments, open_http_cache
+from github_influence.profiling import add_profile_arguments, span, start_profiling, stop_profiling, traced
+from github_influence.request_metrics import DEFAULT_METRICS_TEXTFILE_DIRECTORY, RequestMetrics, save_request_metrics
+from github_influence.user_cache import open_user_cache
+
+##############################################################################
+# Constants
+REPOS_API_URL = "http://api.github.com/repos/"
+USERS_API_URL = "https://api.github.com/users/"
+# Fields of a contributor read from the contributors endpoint
+CONTRIBUTOR_FIELDS = ["login", "type"]
+# Backends to fetch user profiles
+USERS_BACKEND_REST = "rest"  # A REST request per user, the default
+USERS_BACKEND_GRAPHQL = "graphql"  # A GraphQL query per chunk of users
+GRAPHQL_USERS_PER_QUERY = 100
+# Type of the GraphQL error of a login that is not a User, e.g., a renamed or deleted account or a bot
+GRAPHQL_NOT_FOUND_ERROR_TYPE = "NOT_FOUND"
+# Statuses of a user that does not exist, the only failed lookups kept by the user cache
+NOT_FOUND_STATUS_CODES = [404, 410]
+# Define project-specific bot accounts
+PROJECT_BOTS = ["cb-spider", "cb-github-robot", "fossabot"]
+
+##############################################################################
+# Logging
+
+# Handlers are attached by setup_logging() when a command runs
+logger = logging.getLogger("my_logger")
+
+##############################################################################
+# Configs, set by load_config() when a command runs
+config = {}
+personal_access_tokens = []
+org_name = None
+repositories = []
+max_workers = DEFAULT_MAX_WORKERS
+max_page_workers = DEFAULT_MAX_PAGE_WORKERS
+pipeline = False
+users_backend = USERS_BACKEND_REST
+requests_per_second = DEFAULT_REQUESTS_PER_SECOND
+
+# Persistent cache of user profiles, set when running as a script
+user_cache = None
+
+
+def setup_logging(log_file="app.log"):
+    """
+    Attaches handlers to the logger: one for file and one for stdout.
+
+    :param log_file: Path of the log file (optional).
+    """
+    logger.setLevel(logging.DEBUG)
+
+    # Handlers are attached once even if a command runs again in the same process
+    if logger.handlers:
+        return
+
+    # Create handlers: one for file and one for stdout
+    file_handler = logging.FileHandler(log_file)
+    stdout_handler = logging.StreamHandler()
+
+    # Set logging level for each handler
+    file_handler.setLevel(logging.DEBUG)
+    stdout_handler.setLevel(logging.INFO)
+
+    # Create a formatter with caller details and set it for both handlers
+    formatter = logging.Formatter(
+        "%(asctime)s - %(name)s - %(levelname)s - " "[%(filename)s:%(funcName)s:%(lineno)d] - %(message)s"
+    )
+    file_handler.setFormatter(formatter)
+    stdout_handler.setFormatter(formatter)
+
+    # Add handlers to the logger
+    logger.addHandler(file_handler)
+    logger.addHandler(stdout_handler)
+
+
+def load_config(config_path="config.json", auth_path="auth.json"):
+    """
+    Reads auth.json and config.json, and sets the concurrency and pace of the session.
+
+    :param config_path: Path of config.json (optional).
+    :param auth_path: Path of auth.json (optional).
+    """
+    global config, personal_access_tokens, org_name, repositories, max_workers, max_page_workers, pipeline
+    global requests_per_second, users_backend
+
+    # Create a directory for results
+    directory = os.path.join("results")
+    os.makedirs(directory, exist_ok=True)
+
+    # Read auth.json
+    with open(auth_path) as auth_file:
+        auth_info = json.load(auth_file)
+
+    # A token or a list of tokens to spread requests across
+    personal_access_tokens = read_personal_access_tokens(auth_info)
+
+    # Read config.json file
+    with open(config_path) as config_file:
+        config = json.load(config_file)
+
+    org_name = config["org-name"]
+    repositories = config["repositories"]
+    # Number of concurrent workers of the pipelined mode
+    max_workers = config.get("max-workers", DEFAULT_MAX_WORKERS)
+    # Number of pages fetched at the same time in a paginated request
+    max_page_workers = config.get("max-page-workers", DEFAULT_MAX_PAGE_WORKERS)
+    # Fetch contributors of all repos and user profiles concurrently
+    pipeline = config.get("pipeline", False)
+    users_backend = config.get("users-backend", USERS_BACKEND_REST)
+    # Sustained number of requests per second, bursts are limited by the secondary rate limit
+    requests_per_second = config.get("requests-per-second", DEFAULT_REQUESTS_PER_SECOND)
+    # Timeouts of a request in seconds, and retries of a server error or a network error
+    connect_timeout = config.get("connect-timeout", DEFAULT_CONNECT_TIMEOUT)
+    read_timeout = config.get("read-timeout", DEFAULT_READ_TIMEOUT)
+    retries = config.get("retries", DEFAULT_SERVER_ERROR_RETRIES)
+    # Send the requests over HTTP/2, it needs httpx[http2]
+    http2 = config.get("http2", False)
+    # Base URL of the API, e.g., a GitHub Enterprise Server or a local emulator
+    api_url = config.get("api-url", GITHUB_API_URL)
+
+    if users_backend not in [USERS_BACKEND_REST, USERS_BACKEND_GRAPHQL]:
+        print(f"Invalid users-backend. Please set '{USERS_BACKEND_REST}' or '{USERS_BACKEND_GRAPHQL}'.")
+        sys.exit(1)
+
+    ##########################################################################
+    # Set the concurrency and pace of the session
+    # The pipelined mode fetches the profiles in a user pool besides the repo workers
+    if pipeline:
+        set_max_workers(max_workers, max_page_workers, extra_workers=max_workers)
+    else:
+        set_max_workers(1, max_page_workers)
+    set_http_options(connect_timeout, read_timeout, retries, http2)
+    set_api_url(api_url)
+    set_rate_limit(personal_access_tokens, requests_per_second)
+
+
+def get_all_contributors_from_repo(owner, repo_name):
+    """
+    Fetch all contributors from a specific repository.
+    Returns a dict with username as key and type info as value.
+    """
+    contributors_dict = {}
+    contributors_url = f"{REPOS_API_URL}{owner}/{repo_name}/contributors"
+
+    try:
+        contributors = list(iter_projected_items(contributors_url, CONTRIBUTOR_FIELDS))
+    except Exception as e:
+        logger.error(f"Error fetching contributors for {repo_name}: {e}")
+        contributors = []
+
+    for contributor in contributors:
+        username = contributor.get("login", "")
+        contributor_type = contributor.get("type", "")
+        if username:
+            contributors_dict[username] = contributor_type
+
+    logger.info(f"Found {len(contributors_dict)} contributors in {repo_name}")
+    return contributors_dict
+
+
+def get_user_profile(username):
+    """
+    Fetch the profile of a user, from the user cache if it is set.
+
+    A profile within its TTL is returned without a request, and a stale one
+    is revalidated by a conditional request. A user not found (404, 410) is
+    cached for a short time, and raises an exception again until then.
+    Other failures, e.g., a network error or a rate limit, are not cached.
+    Returns a dict of the user, e.g., name, email and type.
+    """
+    user_url = f"{USERS_API_URL}{username}"
+
+    if user_cache is None:
+        return request_github_api(user_url)
+
+    cached_user = user_cache.get(username)
+    if cached_user is not None and user_cache.is_fresh(cached_user):
+        if cached_user.failed:
+            raise Exception(f"Cached failure: {cached_user.error}")
+        record_cache_hit(user_url)
+        return cached_user.profile
+
+    # Revalidate a stale profile
+    headers = {}
+    stale_profile = None
+    if cached_user is not None and not cached_user.failed:
+        headers = cached_user.conditional_headers()
+        stale_profile = cached_user.profile
+
+    try:
+        response = send_github_request("GET", user_url, headers=headers)
+    except Exception as e:
+        if stale_profile is not None:
+            logger.warning(f"Use the stale profile of {username}: {e}")
+            return stale_profile
+        raise
+
+    if response.status_code == 304 and stale_profile is not None:
+        user_cache.touch(username)
+        record_cache_hit(user_url)
+        return stale_profile
+
+    if response.status_code != 200:
+        error = f"API error: {response.status_code}"
+        if response.status_code in NOT_FOUND_STATUS_CODES:
+            user_cache.put_failure(username, error)
+        elif stale_profile is not None:
+            logger.warning(f"Use the stale profile of {username}: {error}")
+            return stale_profile
+        raise Exception(error)
+
+    user_data = response.json()
+    user_cache.put(username, user_data, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+    return user_data
+
+
+def build_users_graphql_query(usernames):
+    """
+    Build a GraphQL query of the profiles of users.
+    Each user is requested with an alias, e.g., user0, user1, ...
+    """
+    fields = [
+        f"  user{index}: user(login: {json.dumps(username)}) {{\n    login\n    name\n    email\n  }}"
+        for index, username in enumerate(usernames)
+    ]
+    return "query {\n" + "\n".join(fields) + "\n}"
+
+
+def get_user_profiles_by_graphql(usernames):
+    """
+    Fetch profiles of users by GraphQL queries of up to GRAPHQL_USERS_PER_QUERY users.
+
+    Fresh profiles in the user cache are used without a query. A user not
+    resolved by GraphQL, e.g., a renamed or deleted account or a bot, which
+    is not a User of GraphQL, falls back to get_user_profile() of REST.
+    Returns a dict with username as key and a profile, or the exception of
+    a failed lookup, as value.
+    """
+    profiles = {}
+    pending_users = []
+    fallback_users = []
+
+    for username in usernames:
+        cached_user = user_cache.get(username) if user_cache is not None else None
+        if cached_user is None or not user_cache.is_fresh(cached_user):
+            pending_users.append(username)
+        elif cached_user.failed:
+            # REST raises the cached failure
+            fallback_users.append(username)
+        else:
+            profiles[username] = cached_user.profile
+
+    for start in range(0, len(pending_users), GRAPHQL_USERS_PER_QUERY):
+        chunk = pending_users[start : start + GRAPHQL_USERS_PER_QUERY]
+        try:
+            data = request_github_graphql(
+                build_users_graphql_query(chunk), handled_error_types=[GRAPHQL_NOT_FOUND_ERROR_TYPE]
+            )
+        except Exception as e:
+            logger.warning(f"Error fetching users by GraphQL, fall back to REST: {e}")
+            data = {}
+
+        for index, username in enumerate(chunk):
+            user_data = data.get(f"user{index}")
+            if user_data is None:
+                logger.debug(f"User {username} not found by GraphQL, fall back to REST")
+                fallback_users.append(username)
+                continue
+
+            # The same fields as REST, which has null for no public email
+            profile = {
+                "login": user_data["login"],
+                "name": user_data["name"],
+                "email": user_data["email"] or None,
+                "type": "User",
+            }
+            if user_cache is not None:
+                user_cache.put(username, profile)
+            profiles[username] = profile
+
+    for username in fallback_users:
+        logger.debug(f"Fetch user {username} by REST")
+        try:
+            profiles[username] = get_user_profile(username)
+        except Exception as e:
+            profiles[username] = e
+
+    return profiles
+
+
+def get_resolved_profile(profiles, username):
+    """Return a profile from get_user_profiles_by_graphql(), or raise the exception of its lookup."""
+    profile = profiles[username]
+    if isinstance(profile, Exception):
+        raise profile
+    return profile
+
+
+def needs_user_profile(username, contributor_type):
+    """Returns True for a regular user, whose profile is fetched, and False for an Agent or a Bot."""
+    return username != "Copilot" and contributor_type != "Bot" and username not in PROJECT_BOTS
+
+
+def add_contributor(unique_contributors, failed_users, username, contributor_type, repo_name, get_profile):
+    """
+    Add a contributor of a repository to unique_contributors.
+
+    A new contributor is classified and, for a regular user, its profile is
+    read by get_profile(username). An existing one gets the repository added.
+    """
+    if username in unique_contributors:
+        # User already exists, increment repo count
+        unique_contributors[username]["repo_count"] += 1
+        unique_contributors[username]["repositories"].append(repo_name)
+        return
+
+    # Classify special accounts
+    if username == "Copilot":
+        user_type = "Agent"
+        logger.info(f"Classified {username} as Agent")
+        unique_contributors[username] = {
+            "username": username,
+            "name": "",
+            "email": "",
+            "type": user_type,
+            "repo_count": 1,
+            "repositories": [repo_name],
+        }
+    elif not needs_user_profile(username, contributor_type):
+        user_type = "Bot"
+        logger.info(f"Classified {username} as Bot")
+        unique_contributors[username] = {
+            "username": username,
+            "name": "",
+            "email": "",
+            "type": user_type,
+            "repo_count": 1,
+            "repositories": [repo_name],
+        }
+    else:
+        # Fetch detailed user info only for regular users
+        try:
+            user_data = get_profile(username)
+            user_type = user_data.get("type", "User")
+
+            unique_contributors[username] = {
+                "username": username,
+                "name": user_data.get("name", ""),
+                "email": user_data.get("email", ""),
+                "type": user_type,
+                "repo_count": 1,
+                "repositories": [repo_name],
+            }
+            logger.debug(f"Added contributor: {username} (type: {user_type})")
+        except Exception as e:
+            logger.error(f"Error fetching user {username}: {e}")
+            failed_users.append(username)
+            # Still add with basic info for verification
+            unique_contributors[username] = {
+                "username": username,
+                "name": "",
+                "email": "",
+                "type": "Unknown (API Error)",
+                "repo_count": 1,
+                "repositories": [repo_name],
+            }
+
+
+def collect_unique_contributors(org_name, repositories):
+    """
+    Collect all unique contributors from specified repositories.
+    Uses username as key to avoid duplicates.
+    Returns a dictionary with username as key and user info as value.
+    """
+    unique_contributors = {}
+    failed_users = []
+    repo_contributor_counts = {}
+
+    logger.info(f"Collecting contributors from {len(repositories)} repos")
+
+    for repo_name in repositories:
+        logger.info(f"Processing repository: {repo_name}")
+
+        with span("contributors", "repo", repo=repo_name):
+            contributors = get_all_contributors_from_repo(org_name, repo_name)
+        repo_contributor_counts[repo_name] = len(contributors)
+
+        with span("user resolution", "repo", repo=repo_name):
+            get_profile = get_user_profile
+            if users_backend == USERS_BACKEND_GRAPHQL:
+                # Fetch the new users of the repository in batches
+                new_users = [
+                    username
+                    for username, contributor_type in contributors.items()
+                    if username not in unique_contributors and needs_user_profile(username, contributor_type)
+                ]
+                get_profile = functools.partial(get_resolved_profile, get_user_profiles_by_graphql(new_users))
+
+            for username, contributor_type in contributors.items():
+                add_contributor(unique_contributors, failed_users, username, contributor_type, repo_name, get_profile)
+
+    logger.info(f"Total unique contributors: {len(unique_contributors)}")
+    if failed_users:
+        logger.warning(f"Failed to fetch details for {len(failed_users)} users: " f"{', '.join(failed_users)}")
+
+    return unique_contributors, repo_contributor_counts, failed_users
+
+
+def collect_unique_contributors_pipelined(org_name, repositories, max_workers):
+    """
+    Collect all unique contributors from specified repositories concurrently.
+
+    Contributors of all repositories are fetched at the same time, and the
+    profiles of the new users of a repository are fetched by a pool of workers
+    as soon as it and the repositories before it have arrived, while the later
+    repositories are still loading. Each user is fetched once. The repositories
+    are taken in their order, so the users and the GraphQL batches are the same
+    in every run, and the results are the same as collect_unique_contributors().
+    """
+    contributors_of_repos = {}
+    profile_futures = {}
+
+    logger.info(f"Collecting contributors from {len(repositories)} repos with {max_workers} workers")
+
+    with ThreadPoolExecutor(max_workers=max_workers) as repo_executor, ThreadPoolExecutor(
+        max_workers=max_workers
+    ) as user_executor:
+        repo_futures = [
+            (
+                repo_name,
+                repo_executor.submit(
+                    traced("contributors", get_all_contributors_from_repo, repo=repo_name), org_name, repo_name
+                ),
+            )
+            for repo_name in repositories
+        ]
+
+        # Not in the order of completion, so a recorded run can be replayed
+        for repo_name, repo_future in repo_futures:
+            contributors = repo_future.result()
+            contributors_of_repos[repo_name] = contributors
+
+            # Queue the new users, whose profiles are fetched only once
+            new_users = [
+                username
+                for username, contributor_type in contributors.items()
+                if username not in profile_futures and needs_user_profile(username, contributor_type)
+            ]
+            if users_backend == USERS_BACKEND_GRAPHQL:
+                for start in range(0, len(new_users), GRAPHQL_USERS_PER_QUERY):
+                    chunk = new_users[start : start + GRAPHQL_USERS_PER_QUERY]
+                    get_chunk = traced("user batch", get_user_profiles_by_graphql, "user", users=len(chunk))
+                    future = user_executor.submit(get_chunk, chunk)
+                    for username in chunk:
+                        profile_futures[username] = future
+            else:
+                for username in new_users:
+                    fetch_profile = traced("user profile", get_user_profile, "user", user=username)
+                    profile_futures[username] = user_executor.submit(fetch_profile, username)
+
+        def get_profile(username):
+            if users_backend == USERS_BACKEND_GRAPHQL:
+                return get_resolved_profile(profile_futures[username].result(), username)
+            return profile_futures[username].result()
+
+        # Merge in the order of the repositories, the same as the sequential run
+        unique_contributors = {}
+        failed_users = []
+        repo_contributor_counts = {}
+        with span("merge"):
+            for repo_name in repositories:
+                contributors = contributors_of_repos[repo_name]
+                repo_contributor_counts[repo_name] = len(contributors)
+
+                for username, contributor_type in contributors.items():
+                    add_contributor(
+                        unique_contributors, failed_users, username, contributor_type, repo_name, get_profile
+                    )
+
+    logger.info(f"Total unique contributors: {len(unique_contributors)}")
+    if failed_users:
+        logger.warning(f"Failed to fetch details for {len(failed_users)} users: " f"{', '.join(failed_users)}")
+
+    return unique_contributors, repo_contributor_counts, failed_users
+
+
+def save_contributors_to_csv(contributors_dict, org_name):
+    """Save unique contributors to a CSV file."""
+    output_filename = (
+        f"./results/({org_name})unique-contributors-" f"{datetime.datetime.now().strftime('%Y%m%d-%H%M%S')}.csv"
+    )
+
+    with open(output_filename, "w", newline="", encoding="utf-8-sig") as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(["Username", "Name", "Email", "Type", "Repo Count", "Repositories"])
+
+        # Sort by repo_count descending
+        for username, info in sorted(
+            contributors_dict.items(),
+            key=lambda x: x[1].get("repo_count", 0),
+            reverse=True,
+        ):
+            repos_list = ", ".join(info.get("repositories", []))
+            writer.writerow(
+                [
+                    username,
+                    info["name"],
+                    info["email"],
+                    info.get("type", "User"),
+                    info.get("repo_count", 1),
+                    repos_list,
+                ]
+            )
+
+    logger.info(f"Contributors saved to {output_filename}")
+    return output_filename
+
+
+def print_validation_report(unique_contributors, repo_counts, failed_users):
+    """Print a validation report of the collected data."""
+    report_lines = []
+
+    report_lines.append("=" * 70)
+    report_lines.append("VALIDATION REPORT")
+    report_lines.append("=" * 70)
+    report_lines.append("")
+    report_lines.append("=" * 60)
+    report_lines.append(f"Organization: {org_name}")
+    report_lines.append(f"Total repositories analyzed: {len(repo_counts)}")
+
+    # Calculate totals first
+    total_contributors_sum = sum(repo_counts.values())
+
+    report_lines.append(f"Total contributors (with duplicates)                  : {total_contributors_sum}")
+    report_lines.append(f"Total unique contributors: {len(unique_contributors)}")
+    report_lines.append("=" * 60)
+
+    # Repository breakdown
+    report_lines.append("\nRepository Contributor Counts:")
+    report_lines.append("-" * 70)
+    for repo, count in sorted(repo_counts.items(), key=lambda x: x[1], reverse=True):
+        report_lines.append(f"  {repo:40} : {count:3} contributors")
+
+    # Contribution distribution
+    report_lines.append("\nContributor Distribution by Repo Count:")
+    report_lines.append("-" * 70)
+    repo_count_distribution = {}
+    for info in unique_contributors.values():
+        count = info.get("repo_count", 1)
+        repo_count_distribution[count] = repo_count_distribution.get(count, 0) + 1
+
+    for repo_count in sorted(repo_count_distribution.keys(), reverse=True):
+        contributor_count = repo_count_distribution[repo_count]
+        report_lines.append(f"  {repo_count:2} repos : {contributor_count:3} contributors")
+
+    # Top contributors
+    report_lines.append("\nTop 15 Multi-repo Contributors:")
+    report_lines.append("-" * 70)
+    sorted_contributors = sorted(
+        unique_contributors.items(),
+        key=lambda x: x[1].get("repo_count", 0),
+        reverse=True,
+    )
+    # Filter only User type
+    user_contributors = [(u, i) for u, i in sorted_contributors if i.get("type") == "User"]
+    for i, (username, info) in enumerate(user_contributors[:15]):
+        name = info.get("name") or "N/A"
+        repo_count = info.get("repo_count", 1)
+        report_lines.append(f"  {i+1:2}. {username:20} ({name:20}) : {repo_count:2} repos")
+
+    # Failed fetches
+    if failed_users:
+        report_lines.append("\nFailed API Fetches:")
+        report_lines.append("-" * 70)
+        for username in failed_users:
+            user_info = unique_contributors.get(username, {})
+            user_type = user_info.get("type", "Unknown")
+            report_lines.append(f"  {username:40} : {user_type}")
+        report_lines.append(f"\n  Total failed: {len(failed_users)}")
+
+    # Contributors with missing info
+    report_lines.append("\nContributors with Missing Information:")
+    report_lines.append("-" * 70)
+    missing_name = [u for u, i in unique_contributors.items() if not i.get("name")]
+    missing_email = [u for u, i in unique_contributors.items() if not i.get("email")]
+
+    report_lines.append(f"  Missing name  : {len(missing_name):3}")
+    report_lines.append(f"  Missing email : {len(missing_email):3}")
+
+    report_lines.append("\n" + "=" * 70)
+
+    # Print to console
+    print("\n" + "\n".join(report_lines))
+
+    return report_lines
+
+
+def save_report_to_markdown(report_lines, org_name, unique_contributors, repo_counts, failed_users):
+    """Save the validation report to a markdown file."""
+    output_filename = (
+        f"./results/({org_name})unique-contributors-report-" f"{datetime.datetime.now().strftime('%Y%m%d-%H%M%S')}.md"
+    )
+
+    with open(output_filename, "w", encoding="utf-8") as f:
+        f.write(f"# Contributor Analysis Report - {org_name}\n\n")
+        f.write(f"**Generated:** {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        f.write("---\n\n")
+
+        # Summary section
+        f.write("## Summary\n\n")
+        total_contributors_sum = sum(repo_counts.values())
+        f.write(f"- **Total Repositories Analyzed:** {len(repo_counts)}\n")
+        f.write(f"- **Total Contributors (with duplicates):** {total_contributors_sum}\n")
+
+        # Count contributors by type
+        type_counts = {}
+        for info in unique_contributors.values():
+            user_type = info.get("type", "Unknown")
+            type_counts[user_type] = type_counts.get(user_type, 0) + 1
+
+        f.write(f"- **Unique Contributors:** {len(unique_contributors)}\n")
+        for user_type in ["User", "Bot", "Agent"]:
+            if user_type in type_counts:
+                f.write(f"  - {user_type}: {type_counts[user_type]}\n")
+        # Add any other types that might exist
+        for user_type, count in sorted(type_counts.items()):
+            if user_type not in ["User", "Bot", "Agent"]:
+                f.write(f"  - {user_type}: {count}\n")
+        f.write("\n")
+
+        # Repository breakdown
+        f.write("## Repository Contributor Counts\n\n")
+        f.write("| Repository | Contributors |\n")
+        f.write("|------------|-------------:|\n")
+        for repo, count in sorted(repo_counts.items(), key=lambda x: x[1], reverse=True):
+            f.write(f"| {repo} | {count} |\n")
+
+        # Top contributors
+        f.write("\n## Top 15 Multi-repo Contributors\n\n")
+        sorted_contributors = sorted(
+            unique_contributors.items(),
+            key=lambda x: x[1].get("repo_count", 0),
+            reverse=True,
+        )
+        # Filter only User type
+        user_contributors = [(u, i) for u, i in sorted_contributors if i.get("type") == "User"]
+        f.write("| Rank | Username | Name | Repo Count |\n")
+        f.write("|-----:|----------|------|----------:|\n")
+        for i, (username, info) in enumerate(user_contributors[:15]):
+            name = info.get("name", "N/A")
+            repo_count = info.get("repo_count", 1)
+            f.write(f"| {i+1} | {username} | {name} | {repo_count} |\n")
+
+        # Failed fetches
+        if failed_users:
+            f.write("\n## Failed API Fetches\n\n")
+            f.write("| Username | Status |\n")
+            f.write("|----------|--------|\n")
+            for username in failed_users:
+                user_info = unique_contributors.get(username, {})
+                user_type = user_info.get("type", "Unknown")
+                f.write(f"| {username} | {user_type} |\n")
+
+        # Missing info
+        f.write("\n## Contributors with Missing Information\n\n")
+        missing_name = [u for u, i in unique_contributors.items() if not i.get("name")]
+        missing_email = [u for u, i in unique_contributors.items() if not i.get("email")]
+
+        f.write(f"- **Missing name:** {len(missing_name)}\n")
+        f.write(f"- **Missing email:** {len(missing_email)}\n")
+
+    logger.info(f"Report saved to {output_filename}")
+    return output_filename
+
+
+def main():
+    global user_cache
+
+    parser = argparse.ArgumentParser(description="Count unique contributors of repositories in an organization.")
+    add_cache_arguments(parser)
+    add_cassette_arguments(parser)
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+
+    setup_logging()
+    load_config()
+
+    # Time the phases of the run if --profile is given
+    start_profiling(args)
+
+    logger.info("Starting to count unique contributors")
+
+    if repositories:
+        logger.info(f"Target repositories: {repositories}")
+    else:
+        logger.error("No repositories specified in config.json")
+        sys.exit(1)
+
+    # Collect the metrics of the requests
+    metrics = RequestMetrics() if config.get("metrics", False) else None
+    set_request_metrics(metrics)
+
+    # Record or replay the responses, which bypasses the caches
+    cassette = open_cassette(args)
+    set_cassette(cassette)
+
+    # Set the HTTP cache
+    http_cache = open_http_cache(args, config)
+    set_http_cache(http_cache)
+
+    # Set the cache of user profiles
+    user_cache = open_user_cache(args, config)
+
+    # Collect unique contributors
+    logger.info(f"Collecting contributors from organization: {org_name}")
+    if pipeline:
+        result = collect_unique_contributors_pipelined(org_name, repositories, max_workers)
+    else:
+        result = collect_unique_contributors(org_name, repositories)
+    unique_contributors, repo_counts, failed_users = result
+
+    # Display summary
+    print("\n" + "=" * 60)
+    print(f"Organization: {org_name}")
+    print(f"Total repositories analyzed: {len(repositories)}")
+    print(f"Total unique contributors: {len(unique_contributors)}")
+    print("=" * 60 + "\n")
+
+    # Save results to CSV
+    with span("csv writing"):
+        output_file = save_contributors_to_csv(unique_contributors, org_name)
+    print(f"Results saved to: {output_file}")
+
+    # Display sample of contributors (first 10)
+    print("\nSample of contributors (first 10):")
+    print("-" * 70)
+    sample_items = list(unique_contributors.items())[:10]
+    for i, (username, info) in enumerate(sample_items):
+        name = info["name"] if info["name"] else "N/A"
+        repo_count = info.get("repo_count", 1)
+        print(f"{i+1}. {username:20} | {name:20} | {repo_count:2} repos")
+
+    if len(unique_contributors) > 10:
+        print(f"... and {len(unique_contributors) - 10} more")
+
+    # Print validation report
+    report_lines = print_validation_report(unique_contributors, repo_counts, failed_users)
+
+    # Save report to markdown
+    with span("markdown writing"):
+        report_file = save_report_to_markdown(report_lines, org_name, unique_contributors, repo_counts, failed_users)
+    print(f"\nReport saved to: {report_file}")
+
+    if user_cache is not None:
+        user_cache.close()
+    if http_cache is not None:
+        http_cache.close()
+    if metrics is not None:
+        textfile_directory = config.get("metrics-textfile-directory", DEFAULT_METRICS_TEXTFILE_DIRECTORY)
+        json_path, textfile_path = save_request_metrics(
+            metrics, org_name, "count_unique_contributors", textfile_directory
+        )
+        logger.info(f"Request metrics: {json_path}, {textfile_path}")
+    if cassette is not None:
+        cassette.close()
+    for profile_path in stop_profiling(org_name, "count_unique_contributors"):
+        logger.info(f"Profile: {profile_path}")
+    close_session()
+    logger.info("Process completed successfully")
+
+
+if __name__ == "__main__":
+    main()
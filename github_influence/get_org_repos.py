@@ -0,0 +1,79 @@
+import json
+
+from github_influence.github_api import (
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_READ_TIMEOUT,
+    DEFAULT_SERVER_ERROR_RETRIES,
+    GITHUB_API_URL,
+    close_session,
+    iter_all_items,
+    read_personal_access_tokens,
+    set_api_url,
+    set_http_options,
+    set_rate_limit,
+)
+
+
+def get_organization_repos(org_name, access_token=None):
+    """
+    Get a list of repositories for a given organization.
+
+    Parameters:
+        org_name (str): Name of the organization
+        access_token (str or list of str): GitHub Access Token(s) (optional)
+
+    Returns:
+        list of str: List of repository names
+    """
+    url = f"https://api.github.com/orgs/{org_name}/repos"
+    if access_token:
+        tokens = [access_token] if isinstance(access_token, str) else access_token
+        set_rate_limit(tokens)
+
+    try:
+        # Every page of the listing, not only the first 100 repositories
+        repos = list(iter_all_items(url))
+    except Exception as e:
+        print(f"Failed to retrieve repos for {org_name}: {e}")
+        return []
+
+    print("Retrieved repositories successfully.")
+    print(f"Number of repositories: {len(repos)}")
+    return [repo["name"] for repo in repos]
+
+
+def main():
+    # Read authentication information from a file
+    with open("auth.json") as auth_file:
+        auth_info = json.load(auth_file)
+
+    personal_access_tokens = read_personal_access_tokens(auth_info)
+
+    auth_file.close()
+
+    # Read configuration from the file
+    with open("config.json", "r", encoding="utf-8") as file:
+        config = json.load(file)
+
+    org_name = config["org-name"]
+
+    # Timeouts, retries and transport of the requests, the same as orgs.py
+    set_http_options(
+        config.get("connect-timeout", DEFAULT_CONNECT_TIMEOUT),
+        config.get("read-timeout", DEFAULT_READ_TIMEOUT),
+        config.get("retries", DEFAULT_SERVER_ERROR_RETRIES),
+        config.get("http2", False),
+    )
+    set_api_url(config.get("api-url", GITHUB_API_URL))
+
+    repositories = get_organization_repos(org_name, personal_access_tokens)
+
+    # Print the list of repositories separated by commas
+    quoted_repositories = ['"{}"'.format(repo) for repo in repositories]
+    print(", ".join(quoted_repositories))
+
+    close_session()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,711 @@
+import logging
+import random
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from github_influence.cassette import get_interaction_key
+from github_influence.json_projection import iter_array_items
+from github_influence.json_projection import iter_projected_items as iter_projected_page_items
+from github_influence.rate_limit import (  # noqa: F401
+    DEFAULT_REQUESTS_PER_SECOND,
+    RESOURCE_CORE,
+    RESOURCE_GRAPHQL,
+    RESOURCE_SEARCH,
+    RateLimitScheduler,
+)
+from github_influence.request_memo import RequestMemo
+
+##############################################################################
+# Constants
+GITHUB_API_URL = "https://api.github.com"
+SEARCH_ISSUES_API_URL = "https://api.github.com/search/issues"
+GRAPHQL_API_URL = "https://api.github.com/graphql"
+# Base path of the REST API of GitHub Enterprise Server, whose GraphQL API is at /api/graphql
+ENTERPRISE_REST_API_PATH = "/api/v3"
+PER_PAGE_100 = "100"  # Default 30, Max 100
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_MAX_PAGE_WORKERS = 4
+# Maximum number of retries of a request rejected by a rate limit
+MAX_RETRIES = 5
+# Timeouts of a request in seconds: connecting, and waiting for data from the server
+DEFAULT_CONNECT_TIMEOUT = 10
+DEFAULT_READ_TIMEOUT = 30
+# Retries of a request failed by a server error or a network error, e.g., connection reset
+DEFAULT_SERVER_ERROR_RETRIES = 3
+SERVER_ERROR_STATUS_CODES = [500, 502, 503, 504]
+# Backoff of the retries: a random wait up to base * 2^(retry - 1), no longer than the max
+RETRY_BACKOFF_BASE = 1
+RETRY_BACKOFF_MAX = 30
+
+##############################################################################
+# Logging
+
+# Handlers are attached by the entry scripts
+logger = logging.getLogger("my_logger")
+
+##############################################################################
+# Create a session
+gh_session = requests.Session()
+
+# Base URL the requests of api.github.com are sent to, set by set_api_url()
+api_url = GITHUB_API_URL
+
+# HTTP/2 client of httpx used instead of the session, disabled if None
+http2_client = None
+
+# Maximum number of connections of the pool, set by set_max_workers()
+pool_size = DEFAULT_MAX_WORKERS * DEFAULT_MAX_PAGE_WORKERS
+
+# Timeouts and retries of a request, set by set_http_options()
+request_timeout = (DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT)
+server_error_retries = DEFAULT_SERVER_ERROR_RETRIES
+
+# Exceptions of a request: all of them, and the transient ones that are retried
+REQUESTS_ERRORS = (requests.exceptions.RequestException,)
+REQUESTS_TRANSIENT_ERRORS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+)
+request_errors = REQUESTS_ERRORS
+transient_errors = REQUESTS_TRANSIENT_ERRORS
+
+# Maximum number of pages fetched at the same time by get_all_pages()
+max_page_workers = DEFAULT_MAX_PAGE_WORKERS
+
+# Persistent cache of GET responses, disabled if None
+http_cache = None
+
+# In-run memo of GET responses with single-flight requests, disabled if None
+request_memo = RequestMemo()
+
+# Scheduler of requests within the rate limits
+rate_limit_scheduler = RateLimitScheduler()
+
+# Cassette recording or replaying the responses, disabled if None
+cassette = None
+
+# Metrics of the requests of the run, disabled if None
+request_metrics = None
+
+
+def set_max_workers(max_workers, page_workers=DEFAULT_MAX_PAGE_WORKERS, extra_workers=0):
+    """
+    Sets the concurrency of the API requests.
+
+    The connection pool of the session is sized to the number of
+    requests that can be in flight at the same time.
+
+    :param max_workers: Maximum number of concurrent workers of a script.
+    :param page_workers: Maximum number of pages fetched at the same time.
+    :param extra_workers: Number of workers sending single requests besides them, e.g., the user pool.
+    """
+    global max_page_workers, pool_size
+
+    max_page_workers = page_workers
+
+    pool_size = max_workers * page_workers + extra_workers
+    adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    gh_session.mount("https://", adapter)
+    gh_session.mount("http://", adapter)
+
+
+def set_http_options(
+    connect_timeout=DEFAULT_CONNECT_TIMEOUT,
+    read_timeout=DEFAULT_READ_TIMEOUT,
+    retries=DEFAULT_SERVER_ERROR_RETRIES,
+    http2=False,
+):
+    """
+    Sets the timeouts, the retries and the transport of the API requests.
+
+    HTTP/2 multiplexes the concurrent requests over a few connections.
+    It needs httpx with the http2 extra, e.g., pip install "httpx[http2]",
+    and HTTP/1.1 of the session is used if it is not installed.
+    Call it after set_max_workers(), so the pool of the client is sized the same.
+
+    :param connect_timeout: Seconds to wait for a connection.
+    :param read_timeout: Seconds to wait for data from the server.
+    :param retries: Maximum number of retries of a server error or a network error.
+    :param http2: Send the requests over HTTP/2 (optional).
+    """
+    global http2_client, request_timeout, server_error_retries, request_errors, transient_errors
+
+    request_timeout = (connect_timeout, read_timeout)
+    server_error_retries = retries
+
+    if http2_client is not None:
+        http2_client.close()
+        http2_client = None
+    request_errors = REQUESTS_ERRORS
+    transient_errors = REQUESTS_TRANSIENT_ERRORS
+
+    if not http2:
+        return
+
+    try:
+        import httpx
+
+        http2_client = httpx.Client(
+            http2=True,
+            timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+        )
+    except ImportError as e:
+        logger.warning("Use HTTP/1.1, HTTP/2 needs httpx[http2]: %s" % e)
+        return
+
+    request_errors = REQUESTS_ERRORS + (httpx.HTTPError,)
+    transient_errors = REQUESTS_TRANSIENT_ERRORS + (httpx.TransportError,)
+
+
+def close_session():
+    """Closes the connections of the session and the HTTP/2 client."""
+    gh_session.close()
+    if http2_client is not None:
+        http2_client.close()
+
+
+def set_api_url(url):
+    """
+    Sets the base URL of the API, e.g., a GitHub Enterprise Server or a local emulator.
+
+    The URLs of api.github.com, e.g., REPOS_API_URL of the scripts, are sent to it,
+    and the URLs from the responses, e.g., "next" links, are sent as they are.
+
+    :param url: Base URL of the API, e.g., "http://127.0.0.1:8000".
+    """
+    global api_url
+
+    api_url = url.rstrip("/")
+
+
+def resolve_url(url):
+    """
+    Returns a URL of api.github.com on the base URL of the API.
+
+    e.g., https://api.github.com/repos/... -> https://(host)/api/v3/repos/...
+          https://api.github.com/graphql -> https://(host)/api/graphql
+    """
+    if url.startswith(GRAPHQL_API_URL) and api_url.endswith(ENTERPRISE_REST_API_PATH):
+        return api_url[: -len(ENTERPRISE_REST_API_PATH)] + "/api/graphql" + url[len(GRAPHQL_API_URL) :]
+
+    for prefix in [GITHUB_API_URL, "http://api.github.com"]:
+        if url.startswith(prefix):
+            return api_url + url[len(prefix) :]
+    return url
+
+
+def set_http_cache(cache):
+    """
+    Sets the persistent cache of GET responses.
+
+    :param cache: http_cache.HttpCache, or None to disable the cache.
+    """
+    global http_cache
+
+    http_cache = cache
+
+
+def set_request_memo(memo):
+    """
+    Sets the in-run memo of GET responses.
+
+    :param memo: request_memo.RequestMemo, or None to disable the memo.
+    """
+    global request_memo
+
+    request_memo = memo
+
+
+def set_cassette(new_cassette):
+    """
+    Sets the cassette recording the responses of the run, or replaying the recorded ones.
+
+    :param new_cassette: cassette.Cassette, or None to disable it.
+    """
+    global cassette
+
+    cassette = new_cassette
+
+
+def set_request_metrics(metrics):
+    """
+    Sets the metrics of the requests of the run.
+
+    :param metrics: request_metrics.RequestMetrics, or None to disable the metrics.
+    """
+    global request_metrics
+
+    request_metrics = metrics
+
+
+def record_cache_hit(url, params=None):
+    """Records a response served by a cache to the metrics, if they are set."""
+    if request_metrics is not None:
+        request_metrics.record_cache_hit(url, params)
+
+
+def read_personal_access_tokens(auth_info):
+    """
+    Reads personal access tokens from auth.json.
+
+    e.g., "personal-access-token": "token"
+          "personal-access-token": ["token1", "token2"]
+
+    :param auth_info: Dictionary of auth.json.
+    :return: List of personal access tokens.
+    """
+    tokens = auth_info["personal-access-token"]
+    if isinstance(tokens, str):
+        tokens = [tokens]
+    return tokens
+
+
+def set_rate_limit(tokens=None, requests_per_second=DEFAULT_REQUESTS_PER_SECOND):
+    """
+    Sets the access tokens and the pace of the requests.
+
+    Requests are spread across the tokens by their remaining requests.
+
+    :param tokens: List of personal access tokens (optional), None for unauthenticated requests.
+    :param requests_per_second: Sustained number of requests per second.
+    """
+    global rate_limit_scheduler
+
+    rate_limit_scheduler = RateLimitScheduler(requests_per_second, tokens=tokens)
+
+
+def get_resource(url):
+    """Returns the rate limit resource of a URL of the GitHub API."""
+    if url.startswith(GRAPHQL_API_URL):
+        return RESOURCE_GRAPHQL
+    if url.startswith(SEARCH_ISSUES_API_URL):
+        return RESOURCE_SEARCH
+    return RESOURCE_CORE
+
+
+def get_retry_backoff(retry):
+    """Returns seconds to wait before a retry, a random wait that doubles its range on each retry."""
+    return random.uniform(0, min(RETRY_BACKOFF_MAX, RETRY_BACKOFF_BASE * 2 ** (retry - 1)))
+
+
+def send_github_request(method, url, **kwargs):
+    global cassette, request_metrics
+    """
+    Sends a request to the GitHub API within the rate limits.
+
+    The request waits for its turn of the scheduler and is sent with the access token
+    chosen by it. A request rejected by a rate limit is retried after Retry-After
+    or the reset time of the limit, with another token if one is available.
+    A request failed by a server error (5xx) or a network error, e.g., a timeout
+    or a connection reset, is retried after a random backoff.
+    If the cassette is replaying, the recorded response is returned without the network.
+    If the metrics are set, the request is recorded with its latency and retries.
+
+    :param method: HTTP method, e.g., "GET".
+    :param url: URL of the GitHub API endpoint.
+    :param kwargs: Keyword arguments of requests.Session.request(), e.g., params and json.
+    :return: Response from the API, otherwise raises an exception.
+    """
+    resource = get_resource(url)
+    url = resolve_url(url)
+
+    start = time.perf_counter()
+    attempts = {"retries": 0}
+    try:
+        if cassette is not None:
+            key = get_interaction_key(method, url, kwargs.get("params"), kwargs.get("json"))
+            if cassette.replaying:
+                response = cassette.replay(key)
+            else:
+                response = send_with_retries(method, url, resource, attempts, **kwargs)
+                cassette.record(key, response)
+        else:
+            response = send_with_retries(method, url, resource, attempts, **kwargs)
+    except Exception:
+        if request_metrics is not None:
+            request_metrics.record_error(url, kwargs.get("params"), time.perf_counter() - start, attempts["retries"])
+        raise
+
+    if request_metrics is not None:
+        seconds = time.perf_counter() - start
+        replayed = cassette is not None and cassette.replaying
+        request_metrics.record_request(
+            url, kwargs.get("params"), response, seconds, attempts["retries"], replayed, attempts.get("token")
+        )
+    return response
+
+
+def send_with_retries(method, url, resource, attempts, **kwargs):
+    global gh_session, http2_client, rate_limit_scheduler
+    """
+    Sends a request until it gets a final response, see send_github_request().
+
+    :param method: HTTP method, e.g., "GET".
+    :param url: URL of the GitHub API endpoint.
+    :param resource: Rate limit resource of the URL.
+    :param attempts: Dictionary counting the "retries" of the request, and the "token" of the last attempt.
+    :param kwargs: Keyword arguments of requests.Session.request(), e.g., params and json.
+    :return: Response from the API, otherwise raises an exception.
+    """
+    headers = kwargs.pop("headers", None) or {}
+
+    rate_limit_retries = 0
+    error_retries = 0
+    while True:
+        token = rate_limit_scheduler.acquire(resource)
+        attempts["token"] = token
+
+        request_headers = dict(headers)
+        if token:
+            request_headers["Authorization"] = f"token {token}"
+
+        try:
+            if http2_client is not None:
+                response = http2_client.request(method, url, headers=request_headers, **kwargs)
+            else:
+                response = gh_session.request(method, url, headers=request_headers, timeout=request_timeout, **kwargs)
+        except transient_errors as e:
+            if error_retries == server_error_retries:
+                raise Exception(f"Network error: {e}")
+
+            error_retries += 1
+            attempts["retries"] += 1
+            wait = get_retry_backoff(error_retries)
+            logger.warning("Network error, retry in %.1f seconds: %s (%s)" % (wait, url, e))
+            time.sleep(wait)
+            continue
+        except request_errors as e:
+            # Handle network errors.
+            raise Exception(f"Network error: {e}")
+
+        rate_limit_scheduler.update(token, response)
+
+        if response.status_code in SERVER_ERROR_STATUS_CODES and error_retries < server_error_retries:
+            error_retries += 1
+            attempts["retries"] += 1
+            wait = get_retry_backoff(error_retries)
+            logger.warning("Server error %s, retry in %.1f seconds: %s" % (response.status_code, wait, url))
+            time.sleep(wait)
+            continue
+
+        if response.status_code not in [403, 429]:
+            return response
+
+        # Forbidden for other reasons, e.g., no permission
+        wait = rate_limit_scheduler.get_retry_wait(response)
+        if wait is None:
+            return response
+
+        if rate_limit_retries == MAX_RETRIES:
+            raise Exception("API request rate limit exceeded.")
+
+        rate_limit_retries += 1
+        attempts["retries"] += 1
+        logger.warning("API request rate limit exceeded, retry in %.0f seconds: %s" % (wait, url))
+        rate_limit_scheduler.pause(token, resource, wait)
+
+
+def request_github_api_response(url, params=None):
+    global request_memo
+    """
+    Makes a request to a specified GitHub API endpoint and returns the response.
+
+    If the memo is set, concurrent callers of a URL with the same query parameters share the request in flight,
+    and a small response that is not a page of a listing is kept for the later callers of the run.
+
+    :param url: URL of the GitHub API endpoint.
+    :param params: Dictionary of query parameters (optional).
+    :return: Response from the API if successful, otherwise raises an exception.
+    """
+    if request_memo is None:
+        return fetch_github_api_response(url, params)
+
+    fetched = False
+
+    def fetch():
+        nonlocal fetched
+        fetched = True
+        return fetch_github_api_response(url, params)
+
+    key = requests.Request("GET", url, params=params).prepare().url
+    response = request_memo.get_or_fetch(key, fetch)
+    if not fetched:
+        record_cache_hit(url, params)
+    return response
+
+
+def fetch_github_api_response(url, params=None):
+    global http_cache
+    """
+    Makes a request to a specified GitHub API endpoint and returns the response.
+
+    If the cache is set, a conditional request is made for a cached URL,
+    and the cached response is returned for 304 Not Modified.
+
+    :param url: URL of the GitHub API endpoint.
+    :param params: Dictionary of query parameters (optional).
+    :return: Response from the API if successful, otherwise raises an exception.
+    """
+
+    logger.debug("Request URL: %s" % url)
+    logger.debug("Request params: %s" % params)
+
+    headers = {}
+    cached_response = None
+    if http_cache is not None:
+        cache_key = requests.Request("GET", url, params=params).prepare().url
+        cached_response = http_cache.get(cache_key)
+        if cached_response is not None:
+            headers = cached_response.conditional_headers()
+
+    response = send_github_request("GET", url, params=params, headers=headers)
+
+    # Use the cached response if it is not modified.
+    if response.status_code == 304 and cached_response is not None:
+        logger.debug("Not modified, use the cached response")
+        record_cache_hit(url, params)
+        return cached_response.to_response()
+
+    # Check if the request was successful.
+    if response.status_code == 200:
+        if http_cache is not None:
+            http_cache.put(cache_key, response)
+        return response
+
+    # Handle other errors.
+    raise Exception(f"API error: {response.status_code}")
+
+
+def request_github_api(url, params=None):
+    """
+    Makes a request to a specified GitHub API endpoint and fetches data.
+
+    :param url: URL of the GitHub API endpoint.
+    :param params: Dictionary of query parameters (optional).
+    :return: JSON response from the API if successful, otherwise raises an exception.
+    """
+    return request_github_api_response(url, params).json()
+
+
+def request_github_graphql(query, variables=None, handled_error_types=()):
+    """
+    Makes a GraphQL query to the GitHub API and fetches data.
+
+    Errors of a part of the query (e.g., a repository not found) are logged,
+    and the corresponding fields of the data are null.
+
+    :param query: GraphQL query.
+    :param variables: Dictionary of variables of the query (optional).
+    :param handled_error_types: Types of the errors handled by the caller, e.g., "NOT_FOUND", logged at debug level.
+    :return: "data" of the JSON response if successful, otherwise raises an exception.
+    """
+
+    logger.debug("GraphQL query: %s" % query)
+    logger.debug("GraphQL variables: %s" % variables)
+
+    response = send_github_request("POST", GRAPHQL_API_URL, json={"query": query, "variables": variables or {}})
+
+    # Handle errors.
+    if response.status_code != 200:
+        raise Exception(f"API error: {response.status_code}")
+
+    response_json = response.json()
+
+    for error in response_json.get("errors", []):
+        if error.get("type") in handled_error_types:
+            logger.debug("GraphQL error: %s" % error.get("message"))
+        else:
+            logger.error("GraphQL error: %s" % error.get("message"))
+
+    if response_json.get("data") is None:
+        raise Exception("GraphQL error: no data")
+
+    return response_json["data"]
+
+
+def get_last_page_number(response):
+    """
+    Reads the number of the last page from the Link header of a response.
+
+    e.g., Link: <https://api.github.com/...&page=2>; rel="next",
+                <https://api.github.com/...&page=34>; rel="last"
+
+    :param response: Response from the GitHub API.
+    :return: Number of the last page, or None if the header has no "last" link.
+    """
+    last_url = response.links.get("last", {}).get("url")
+    if not last_url:
+        return None
+
+    query = urllib.parse.parse_qs(urllib.parse.urlparse(last_url).query)
+    try:
+        return int(query["page"][0])
+    except (KeyError, ValueError):
+        return None
+
+
+def iter_all_page_responses(url, params=None, page_workers=None):
+    """
+    Fetches every page of a paginated GitHub API endpoint, and yields the responses as they arrive.
+
+    The Link header of the first page tells the number of the last page,
+    so the remaining pages are requested in parallel with bounded concurrency
+    before the first page is yielded. Without the hint, the "next" links are
+    followed one by one. Either way, no empty page is requested to detect the end.
+    The pages bypass the in-run memo, since a page is read once.
+
+    :param url: URL of the GitHub API endpoint.
+    :param params: Dictionary of query parameters (optional).
+    :param page_workers: Maximum number of pages fetched at the same time (optional).
+    :return: Generator of responses in page order.
+    """
+    if page_workers is None:
+        page_workers = max_page_workers
+
+    def get_page(page):
+        page_params = dict(params or {})
+        page_params.update({"page": str(page), "per_page": PER_PAGE_100})
+        return fetch_github_api_response(url, page_params)
+
+    response = get_page(1)
+
+    last_page = get_last_page_number(response)
+    if last_page is None:
+        yield response
+        while "next" in response.links:
+            response = fetch_github_api_response(response.links["next"]["url"])
+            yield response
+        return
+
+    if last_page == 1:
+        yield response
+        return
+
+    logger.debug("Fetch pages 2 to %s of %s" % (last_page, url))
+    with ThreadPoolExecutor(max_workers=min(page_workers, last_page - 1)) as executor:
+        # The remaining pages are requested while the first page is consumed
+        responses = executor.map(get_page, range(2, last_page + 1))
+        yield response
+        del response
+        yield from responses
+
+
+def iter_all_pages(url, params=None, page_workers=None):
+    """
+    Fetches every page of a paginated GitHub API endpoint, and yields the pages as they arrive.
+
+    :param url: URL of the GitHub API endpoint.
+    :param params: Dictionary of query parameters (optional).
+    :param page_workers: Maximum number of pages fetched at the same time (optional).
+    :return: Generator of pages in page order, each page is a list of items.
+    """
+    for response in iter_all_page_responses(url, params, page_workers):
+        yield response.json()
+
+
+def get_all_pages(url, params=None, page_workers=None):
+    """
+    Fetches every page of a paginated GitHub API endpoint.
+
+    :param url: URL of the GitHub API endpoint.
+    :param params: Dictionary of query parameters (optional).
+    :param page_workers: Maximum number of pages fetched at the same time (optional).
+    :return: List of pages in page order, each page is a list of items.
+    """
+    return list(iter_all_pages(url, params, page_workers))
+
+
+def iter_all_items(url, params=None, page_workers=None):
+    """
+    Yields every item of a paginated GitHub API endpoint, e.g., the repositories of an organization.
+
+    The items of a page are yielded as soon as the page arrives,
+    so the work on them can start while the later pages are loading.
+
+    :param url: URL of the GitHub API endpoint.
+    :param params: Dictionary of query parameters (optional).
+    :param page_workers: Maximum number of pages fetched at the same time (optional).
+    :return: Generator of items in page order.
+    """
+    for page in iter_all_pages(url, params, page_workers):
+        yield from page
+
+
+def iter_projected_items(url, fields, params=None, page_workers=None):
+    """
+    Yields every item of a paginated GitHub API endpoint with only the given fields.
+
+    Only the fields of the items outlive their page, e.g., a commit of a few kilobytes
+    is reduced to its dates, so a long history is not kept in memory.
+    With ijson installed, the items of a page are parsed one by one from its body,
+    see json_projection.iter_array_items().
+
+    The body of a page is read in full before parsing, not from the open connection:
+    a failed read is retried like any other request, the body can be cached or recorded,
+    and the pages fetched ahead do not hold connections while the earlier ones are consumed.
+    So the bytes of a page, at most PER_PAGE_100 items, are kept until its items are projected.
+
+    e.g., iter_projected_items(commits_url, ["sha", "author.login", "commit.committer.date"])
+
+    :param url: URL of the GitHub API endpoint.
+    :param fields: List of dotted paths of the fields, see json_projection.project().
+    :param params: Dictionary of query parameters (optional).
+    :param page_workers: Maximum number of pages fetched at the same time (optional).
+    :return: Generator of projected items in page order.
+    """
+    for response in iter_all_page_responses(url, params, page_workers):
+        yield from iter_projected_page_items(iter_array_items(response.content), fields)
+
+
+def count_items(url, params=None):
+    """
+    Counts the items of a paginated GitHub API endpoint.
+
+    The first page is requested with per_page=1, so the number of the last page
+    in the Link header equals the total number of items.
+    Falls back to full pagination if the Link header does not have it.
+
+    :param url: URL of the GitHub API endpoint.
+    :param params: Dictionary of query parameters (optional).
+    :return: Total number of items.
+    """
+    page_params = dict(params or {})
+    page_params.update({"page": "1", "per_page": "1"})
+
+    response = request_github_api_response(url, page_params)
+
+    last_page = get_last_page_number(response)
+    if last_page is not None:
+        return last_page
+
+    # No more pages, so the first page has all the items
+    if "next" not in response.links:
+        return len(response.json())
+
+    logger.debug("No last page in the Link header, fall back to full pagination")
+    return sum(len(items) for items in get_all_pages(url, params))
+
+
+def search_issues_count(query):
+    """
+    Counts issues and pull requests matched by a search query.
+
+    Only total_count of the first page is read, so a count costs one request
+    of the search quota regardless of the number of matched items.
+
+    e.g., query: "repo:cloud-barista/cb-spider is:pr is:closed closed:2023-01-01..2023-12-31"
+
+    :param query: Search query with qualifiers.
+    :return: Number of matched issues and pull requests.
+    """
+    response_json = request_github_api(SEARCH_ISSUES_API_URL, {"q": query, "per_page": "1"})
+
+    if response_json.get("incomplete_results"):
+        logger.warning("Incomplete search results: %s" % query)
+
+    return response_json["total_count"]
@@ -0,0 +1,185 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+##############################################################################
+# Constants
+DEFAULT_CACHE_PATH = os.path.join(".cache", "http-cache.sqlite")
+DEFAULT_CACHE_MAX_MEGABYTES = 512
+
+
+class CachedResponse:
+    """A response stored in the cache with its validators."""
+
+    def __init__(self, url, etag, last_modified, headers, body):
+        self.url = url
+        self.etag = etag
+        self.last_modified = last_modified
+        self.headers = headers
+        self.body = body
+
+    def conditional_headers(self):
+        """
+        Returns the headers of a conditional request to revalidate this response.
+
+        A 304 Not Modified response to it does not count against the rate limit.
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_response(self):
+        """Returns this response as a requests.Response with status 200."""
+        response = requests.models.Response()
+        response.status_code = 200
+        response.url = self.url
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.encoding = "utf-8"
+        response._content = self.body
+        return response
+
+
+class HttpCache:
+    """
+    Persistent cache of GET responses of the GitHub API, stored in SQLite.
+
+    A response is stored with its ETag and Last-Modified per URL with query parameters.
+    When the total size of the bodies exceeds the limit,
+    the least recently used responses are evicted.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_megabytes=DEFAULT_CACHE_MAX_MEGABYTES):
+        """
+        :param path: Path of the SQLite database file.
+        :param max_megabytes: Maximum total size of the cached bodies in megabytes.
+        """
+        self.path = path
+        self.max_bytes = max_megabytes * 1024 * 1024
+        self.lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, headers TEXT, "
+            "body BLOB, size INTEGER, accessed_at REAL)"
+        )
+        self.connection.execute("CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)")
+        self.connection.commit()
+
+        self.total_bytes = self.connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def get(self, url):
+        """
+        Returns the cached response of a URL.
+
+        :param url: URL with query parameters.
+        :return: CachedResponse, or None if the URL is not cached.
+        """
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT etag, last_modified, headers, body FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            self.connection.execute("UPDATE responses SET accessed_at = ? WHERE url = ?", (time.time(), url))
+            self.connection.commit()
+
+        etag, last_modified, headers, body = row
+        return CachedResponse(url, etag, last_modified, json.loads(headers), body)
+
+    def put(self, url, response):
+        """
+        Stores a response if it has a validator, ETag or Last-Modified.
+
+        :param url: URL with query parameters.
+        :param response: requests.Response with status 200.
+        """
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+
+        body = response.content
+        size = len(body)
+        if size > self.max_bytes:
+            return
+
+        with self.lock:
+            row = self.connection.execute("SELECT size FROM responses WHERE url = ?", (url,)).fetchone()
+            if row is not None:
+                self.total_bytes -= row[0]
+
+            self.connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (url, etag, last_modified, json.dumps(dict(response.headers)), body, size, time.time()),
+            )
+            self.total_bytes += size
+
+            self._evict()
+            self.connection.commit()
+
+    def _evict(self):
+        """Evicts the least recently used responses until the total size is within the limit."""
+        if self.total_bytes <= self.max_bytes:
+            return
+
+        evicted = []
+        for url, size in self.connection.execute("SELECT url, size FROM responses ORDER BY accessed_at"):
+            if self.total_bytes <= self.max_bytes:
+                break
+            evicted.append((url,))
+            self.total_bytes -= size
+
+        self.connection.executemany("DELETE FROM responses WHERE url = ?", evicted)
+
+    def clear(self):
+        """Removes all the cached responses."""
+        with self.lock:
+            self.connection.execute("DELETE FROM responses")
+            self.connection.commit()
+            self.connection.execute("VACUUM")
+            self.total_bytes = 0
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
+
+
+def add_cache_arguments(parser):
+    """Adds the command line switches of the cache to an argparse.ArgumentParser."""
+    parser.add_argument("--no-cache", action="store_true", help="bypass the HTTP cache")
+    parser.add_argument("--clear-cache", action="store_true", help="clear the HTTP cache before running")
+
+
+def open_http_cache(args, config):
+    """
+    Opens the cache according to the command line switches and config.json.
+
+    :param args: Parsed arguments with the switches of add_cache_arguments().
+    :param config: Dictionary of config.json, "cache-path" and "cache-max-megabytes" are optional.
+    :return: HttpCache, or None if the cache is bypassed.
+    """
+    path = config.get("cache-path", DEFAULT_CACHE_PATH)
+
+    if args.clear_cache and os.path.exists(path):
+        cache = HttpCache(path)
+        cache.clear()
+        cache.close()
+
+    if args.no_cache:
+        return None
+
+    return HttpCache(path, config.get("cache-max-megabytes", DEFAULT_CACHE_MAX_MEGABYTES))
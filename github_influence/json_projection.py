@@ -0,0 +1,73 @@
+import functools
+import json
+
+
+def project(item, fields):
+    """
+    Returns an item with only the given fields, in the same nesting.
+
+    A missing field is left out, so its presence can be checked as before, e.g., "pull_request" in issue.
+    A null object on the path, e.g., "author": null of a commit, is kept as null.
+
+    e.g., project(commit, ["sha", "commit.author.date"]) -> {"sha": ..., "commit": {"author": {"date": ...}}}
+
+    :param item: Dictionary of an item.
+    :param fields: List of dotted paths of the fields.
+    :return: Dictionary of the fields.
+    """
+    projected = {}
+    for field in fields:
+        keys = field.split(".")
+        value = item
+        target = projected
+        for depth, key in enumerate(keys):
+            if key not in value:
+                break
+            value = value[key]
+            if depth == len(keys) - 1 or not isinstance(value, dict):
+                target[key] = value
+                break
+            target = target.setdefault(key, {})
+
+    return projected
+
+
+@functools.cache
+def load_ijson():
+    """Returns the ijson module, or None if it is not installed."""
+    try:
+        import ijson
+    except ImportError:
+        return None
+    return ijson
+
+
+def iter_array_items(content):
+    """
+    Yields the items of a JSON array, e.g., the body of a page of the GitHub API.
+
+    With ijson installed, e.g., pip install ".[stream]", the items are parsed one by one from the bytes,
+    so a single parsed item is alive at a time instead of the whole page.
+    Otherwise, the array is parsed at once by json.
+    The bytes themselves are the whole body, which is read before parsing, see github_api.iter_projected_items().
+
+    :param content: Bytes of the JSON array.
+    :return: Generator of the items.
+    """
+    ijson = load_ijson()
+    if ijson is None:
+        yield from json.loads(content)
+        return
+    yield from ijson.items(content, "item", use_float=True)
+
+
+def iter_projected_items(items, fields):
+    """
+    Yields items with only the given fields.
+
+    :param items: Iterable of the items, e.g., from iter_array_items().
+    :param fields: List of dotted paths of the fields, see project().
+    :return: Generator of the projected items.
+    """
+    for item in items:
+        yield project(item, fields)
@@ -0,0 +1,1345 @@
+import argparse
+import csv
+import datetime
+import json
+import logging
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from github_influence.github_api import (
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_MAX_PAGE_WORKERS,
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_READ_TIMEOUT,
+    DEFAULT_REQUESTS_PER_SECOND,
+    DEFAULT_SERVER_ERROR_RETRIES,
+    GITHUB_API_URL,
+    PER_PAGE_100,
+    close_session,
+    count_items,
+    iter_all_items,
+    iter_projected_items,
+    request_github_api,
+    request_github_graphql,
+    search_issues_count,
+    set_http_cache,
+    set_api_url,
+    set_cassette,
+    set_request_metrics,
+    set_http_options,
+    read_personal_access_tokens,
+    set_max_workers,
+    set_rate_limit,
+)
+from github_influence.cassette import add_cassette_arguments, open_cassette
+from github_influence.commit_store import COMMIT_FIELDS, DEFAULT_COMMIT_STORE_PATH, CommitStore, to_timestamp
+from github_influence.http_cache import add_cache_arguments, open_http_cache
+from github_influence.profiling import add_profile_arguments, span, start_profiling, stop_profiling, traced
+from github_influence.request_metrics import DEFAULT_METRICS_TEXTFILE_DIRECTORY, RequestMetrics, save_request_metrics
+from github_influence.statistics_table import StatisticsTable
+from github_influence.watermarks import (
+    DEFAULT_OVERLAP_DAYS,
+    DEFAULT_WATERMARKS_DIRECTORY,
+    WATERMARK_FORMAT,
+    WatermarkStore,
+    subtract_days,
+)
+
+##############################################################################
+# Constants
+BASE_URL_OF_ORGS_API = "https://api.github.com/orgs/"
+REPOS_API_URL = "http://api.github.com/repos/"
+# Backends to count closed issues and pull requests
+ISSUES_BACKEND_REST = "rest"  # Issues updated since 'since', the default
+ISSUES_BACKEND_SEARCH = "search"  # Issues closed from 'since' until 'until'
+# Backends to collect repository statistics
+BACKEND_REST = "rest"  # A few REST requests per repository, the default
+BACKEND_GRAPHQL = "graphql"  # A GraphQL query per chunk of repositories
+# Keep a query small enough for the node limit of GitHub GraphQL API
+GRAPHQL_REPOS_PER_QUERY = 25
+# Rate limiting: https://developer.github.com/v3/#rate-limiting
+
+##############################################################################
+# Logging
+
+# Handlers are attached by setup_logging() when a command runs
+logger = logging.getLogger("my_logger")
+
+##############################################################################
+# Configs, set by load_config() when a command runs
+config = {}
+personal_access_tokens = []
+org_name = None
+repositories = []
+since = None
+until = None
+max_workers = DEFAULT_MAX_WORKERS
+max_page_workers = DEFAULT_MAX_PAGE_WORKERS
+requests_per_second = DEFAULT_REQUESTS_PER_SECOND
+connect_timeout = DEFAULT_CONNECT_TIMEOUT
+read_timeout = DEFAULT_READ_TIMEOUT
+retries = DEFAULT_SERVER_ERROR_RETRIES
+http2 = False
+api_url = GITHUB_API_URL
+issues_backend = ISSUES_BACKEND_REST
+backend = BACKEND_REST
+incremental = False
+watermarks_path = None
+overlap_days = DEFAULT_OVERLAP_DAYS
+parquet = False
+commit_store_enabled = False
+commit_store_path = DEFAULT_COMMIT_STORE_PATH
+
+# Stored counts of the incremental mode, set when running as a script
+watermark_store = None
+# Local store of commit metadata, set when running as a script
+commit_store = None
+
+
+def setup_logging(log_file="app.log"):
+    """
+    Attaches handlers to the logger: one for file and one for stdout.
+
+    :param log_file: Path of the log file (optional).
+    """
+    logger.setLevel(logging.DEBUG)
+
+    # Handlers are attached once even if a command runs again in the same process
+    if logger.handlers:
+        return
+
+    # Create handlers: one for file and one for stdout
+    file_handler = logging.FileHandler(log_file)
+    stdout_handler = logging.StreamHandler()
+
+    # Set logging level for each handler (optional, can be different for each handler)
+    file_handler.setLevel(logging.DEBUG)
+    stdout_handler.setLevel(logging.INFO)
+
+    # Create a formatter with caller details and set it for both handlers
+    # This will include file name, function name, and line number
+    formatter = logging.Formatter(
+        "%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(funcName)s:%(lineno)d] - %(message)s"
+    )
+    file_handler.setFormatter(formatter)
+    stdout_handler.setFormatter(formatter)
+
+    # Add handlers to the logger
+    logger.addHandler(file_handler)
+    logger.addHandler(stdout_handler)
+
+
+def load_config(config_path="config.json", auth_path="auth.json"):
+    """
+    Reads auth.json and config.json, and sets the concurrency and pace of the session.
+
+    It exits if a config is invalid.
+
+    :param config_path: Path of config.json (optional).
+    :param auth_path: Path of auth.json (optional).
+    """
+    global config, personal_access_tokens, org_name, repositories, since, until
+    global max_workers, max_page_workers, requests_per_second, issues_backend, backend
+    global connect_timeout, read_timeout, retries, http2, api_url
+    global incremental, watermarks_path, overlap_days, parquet, commit_store_enabled, commit_store_path
+
+    # Create a directory for results
+    directory = os.path.join("results")
+    os.makedirs(directory, exist_ok=True)
+
+    # Read auth.json
+    with open(auth_path) as auth_file:
+        auth_info = json.load(auth_file)
+
+    # A token or a list of tokens to spread requests across
+    personal_access_tokens = read_personal_access_tokens(auth_info)
+
+    # Read config.json file
+    with open(config_path) as config_file:
+        config = json.load(config_file)
+
+    org_name = config["org-name"]
+    repositories = config["repositories"]
+    since = config["since"]
+    until = config["until"]
+    # Number of concurrent workers, set it to 1 to collect sequentially
+    max_workers = config.get("max-workers", DEFAULT_MAX_WORKERS)
+    # Number of pages fetched at the same time in a paginated request
+    max_page_workers = config.get("max-page-workers", DEFAULT_MAX_PAGE_WORKERS)
+    # Sustained number of requests per second, bursts are limited by the secondary rate limit
+    requests_per_second = config.get("requests-per-second", DEFAULT_REQUESTS_PER_SECOND)
+    # Timeouts of a request in seconds, and retries of a server error or a network error
+    connect_timeout = config.get("connect-timeout", DEFAULT_CONNECT_TIMEOUT)
+    read_timeout = config.get("read-timeout", DEFAULT_READ_TIMEOUT)
+    retries = config.get("retries", DEFAULT_SERVER_ERROR_RETRIES)
+    # Send the requests over HTTP/2, it needs httpx[http2]
+    http2 = config.get("http2", False)
+    # Base URL of the API, e.g., a GitHub Enterprise Server or a local emulator
+    api_url = config.get("api-url", GITHUB_API_URL)
+    issues_backend = config.get("issues-backend", ISSUES_BACKEND_REST)
+    backend = config.get("backend", BACKEND_REST)
+    # Count only the activity after the previous run and add it to the stored counts
+    incremental = config.get("incremental", False)
+    watermarks_path = config.get(
+        "watermarks-path", os.path.join(DEFAULT_WATERMARKS_DIRECTORY, f"({org_name})watermarks.json")
+    )
+    # Days before the watermark whose commits are fetched again, for the commits pushed later with older dates
+    overlap_days = config.get("overlap-days", DEFAULT_OVERLAP_DAYS)
+    # Write the statistics to a Parquet file as well, it needs pyarrow
+    parquet = config.get("parquet", False)
+    # Keep commit metadata in a local store, and count commits of any period from it
+    commit_store_enabled = config.get("commit-store", False)
+    commit_store_path = config.get("commit-store-path", DEFAULT_COMMIT_STORE_PATH)
+
+    try:
+        # Convert 'since' and 'until' to datetime.date objects
+        since = datetime.datetime.strptime(since, "%Y-%m-%d").date()
+        until = datetime.datetime.strptime(until, "%Y-%m-%d").date()
+    except ValueError:
+        print("Invalid date format. Please make sure the date format is YYYY-MM-DD.")
+        sys.exit(1)
+
+    for key, value in [("max-workers", max_workers), ("max-page-workers", max_page_workers)]:
+        if not isinstance(value, int) or value < 1:
+            print(f"Invalid {key}. Please set a positive integer.")
+            sys.exit(1)
+
+    for key, value in [
+        ("requests-per-second", requests_per_second),
+        ("connect-timeout", connect_timeout),
+        ("read-timeout", read_timeout),
+    ]:
+        if not isinstance(value, (int, float)) or value <= 0:
+            print(f"Invalid {key}. Please set a positive number.")
+            sys.exit(1)
+
+    for key, value in [("retries", retries), ("overlap-days", overlap_days)]:
+        if not isinstance(value, int) or value < 0:
+            print(f"Invalid {key}. Please set zero or a positive integer.")
+            sys.exit(1)
+
+    if issues_backend not in [ISSUES_BACKEND_REST, ISSUES_BACKEND_SEARCH]:
+        print(f"Invalid issues-backend. Please set '{ISSUES_BACKEND_REST}' or '{ISSUES_BACKEND_SEARCH}'.")
+        sys.exit(1)
+
+    if backend not in [BACKEND_REST, BACKEND_GRAPHQL]:
+        print(f"Invalid backend. Please set '{BACKEND_REST}' or '{BACKEND_GRAPHQL}'.")
+        sys.exit(1)
+
+    if backend == BACKEND_GRAPHQL and (incremental or commit_store_enabled):
+        print("Incremental mode and commit-store are not supported by the graphql backend. Please set 'rest' backend.")
+        sys.exit(1)
+
+    ##########################################################################
+    # Set the concurrency and pace of the session
+    set_max_workers(max_workers, max_page_workers)
+    set_http_options(connect_timeout, read_timeout, retries, http2)
+    set_api_url(api_url)
+    set_rate_limit(personal_access_tokens, requests_per_second)
+
+
+def get_orgs_info(orgs_name):
+    global BASE_URL_OF_ORGS_API, PER_PAGE_100
+    ###########################################################################
+    # Result of organization information
+
+    # Request organization information
+    orgs_url = BASE_URL_OF_ORGS_API + orgs_name
+    try:
+        # Request GitHub API
+        org_info = request_github_api(orgs_url)
+    except Exception as e:
+        # Handle any errors that occurred during the API request.
+        # The rest depends on the organization information, so stop here.
+        logger.error("Error occurred: %s" % e)
+        raise
+
+    # Request the number of organization members
+    # e.g., "members_url":
+    # "https://api.github.com/orgs/cloud-barista/members{/member}"
+    members_url = org_info["members_url"].split("{")[0]
+
+    try:
+        # Request GitHub API
+        number_of_members = count_items(members_url)
+    except Exception as e:
+        # Handle any errors that occurred during the API request.
+        logger.error("Error occurred: %s" % e)
+        number_of_members = 0
+
+    logger.debug("Organization name: %s" % org_info["name"])
+    logger.debug("Public repos: %s" % (org_info["public_repos"]))
+    logger.debug("Members: %s" % number_of_members)
+
+    # Create a file for results
+    orgs_result_file = open("./results/orgs-info.csv", "w", newline="")
+    orgs_result_writer = csv.writer(orgs_result_file)
+
+    # CSV header
+    orgs_result_writer.writerow(["Organization", "Public repositories", "Members"])
+    orgs_result_writer.writerow(
+        [org_info["name"], org_info["public_repos"], number_of_members]
+    )
+
+    orgs_result_file.close()
+
+    return org_info
+
+
+def get_contributors(url_contributors):
+    return count_items(url_contributors)
+
+
+def get_commits_during_the_period(url_commits, since, until):
+    params = {
+        "since": since,
+        "until": until,
+    }
+
+    total_commits_count = count_items(url_commits, params)
+    logger.debug("Number of commits: %s" % total_commits_count)
+
+    return total_commits_count
+
+
+# Per-item aggregations of an issue scan
+# The issues endpoint returns pull requests as well, with a "pull_request" key
+ISSUE_AGGREGATIONS = {
+    "issues": lambda issue: "pull_request" not in issue,
+    "prs": lambda issue: "pull_request" in issue,
+}
+# Fields of an issue read by the aggregations, the rest of an issue is not kept
+ISSUE_FIELDS = ["pull_request", "closed_at"]
+
+
+def scan_issues_since(url_issues, state, since, aggregations=None, fields=ISSUE_FIELDS):
+    """
+    Scans the issues endpoint once and counts the items for each aggregation.
+
+    :param url_issues: URL of the issues endpoint of a repository.
+    :param state: State of the issues, e.g., "closed".
+    :param since: Only issues updated at or after this date are returned.
+    :param aggregations: Dictionary of name and predicate of an item (optional).
+    :param fields: Fields of an item read by the predicates (optional).
+    :return: Dictionary of name and the number of items matched by the predicate.
+    """
+    if aggregations is None:
+        aggregations = ISSUE_AGGREGATIONS
+
+    params = {
+        "state": state,
+        "since": since,
+    }
+
+    counts = {name: 0 for name in aggregations}
+    for issue in iter_projected_items(url_issues, fields, params):
+        for name, predicate in aggregations.items():
+            if predicate(issue):
+                counts[name] += 1
+
+    return counts
+
+
+def get_issues_since(url_issues, state, since):
+    # Count issues closed in the period
+    aggregations = {"issues": ISSUE_AGGREGATIONS["issues"]}
+    return scan_issues_since(url_issues, state, since, aggregations)["issues"]
+
+
+def get_prs_since(url_prs, state, since):
+    # Count pull requests closed in the period
+    aggregations = {"prs": ISSUE_AGGREGATIONS["prs"]}
+    return scan_issues_since(url_prs, state, since, aggregations)["prs"]
+
+
+# Search queries of closed issues and pull requests in a period
+# e.g., "merged_prs": "is:pr is:merged merged:{since}..{until}"
+SEARCH_AGGREGATIONS = {
+    "issues": "is:issue is:closed closed:{since}..{until}",
+    "prs": "is:pr is:closed closed:{since}..{until}",
+}
+
+
+def search_closed_issues(full_name, since, until, aggregations=None):
+    """
+    Counts closed issues and pull requests in a period by the Search API.
+
+    Each aggregation costs a single search request, which reads total_count.
+
+    :param full_name: Full name of a repository, e.g., "cloud-barista/cb-spider".
+    :param since: Start date of the period.
+    :param until: End date of the period.
+    :param aggregations: Dictionary of name and search qualifiers (optional).
+    :return: Dictionary of name and the number of matched items.
+    """
+    if aggregations is None:
+        aggregations = SEARCH_AGGREGATIONS
+
+    counts = {}
+    for name, qualifiers in aggregations.items():
+        query = f"repo:{full_name} " + qualifiers.format(since=since, until=until)
+        counts[name] = search_issues_count(query)
+
+    return counts
+
+
+def get_repos_statistics_headers():
+    global since, until, issues_backend
+
+    if issues_backend == ISSUES_BACKEND_SEARCH:
+        closed_period = f"since {since} until {until}"
+    else:
+        closed_period = f"since {since}"
+
+    return [
+        "Repo",
+        "Repo link",
+        f"Commits since {since} until {until}",
+        "Forks total",
+        "Stars total",
+        f"Issues (closed) {closed_period}",
+        f"Pull requests (closed) {closed_period}",
+        "Contributors",
+    ]
+
+
+# Search qualifiers equivalent to the REST scan of closed issues and pull requests
+# The issues endpoint with 'since' returns the issues updated at or after 'since'
+UPDATED_SINCE_AGGREGATIONS = {
+    "issues": "is:issue is:closed updated:>={since}",
+    "prs": "is:pr is:closed updated:>={since}",
+}
+
+
+def build_repos_graphql_query(repos, search_aggregations):
+    """
+    Builds a GraphQL query of the statistics of repositories.
+
+    Each repository is requested with an alias, e.g., repo0, repo1, ...,
+    and closed issues and pull requests are counted by aliased searches,
+    e.g., repo0_issues, repo0_prs.
+
+    :param repos: List of repositories from the organization's repos_url.
+    :param search_aggregations: Dictionary of name and search qualifiers.
+    :return: GraphQL query with $since and $until variables.
+    """
+    global since, until
+
+    fields = []
+    for index, repo in enumerate(repos):
+        owner, name = repo["full_name"].split("/", 1)
+        fields.append(
+            f"""  repo{index}: repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) {{
+    name
+    nameWithOwner
+    forkCount
+    stargazerCount
+    defaultBranchRef {{
+      target {{
+        ... on Commit {{
+          history(since: $since, until: $until) {{
+            totalCount
+          }}
+        }}
+      }}
+    }}
+  }}"""
+        )
+
+        for aggregation, qualifiers in search_aggregations.items():
+            search_query = f"repo:{repo['full_name']} " + qualifiers.format(since=since, until=until)
+            fields.append(
+                f"  repo{index}_{aggregation}: search(query: {json.dumps(search_query)}, type: ISSUE) {{\n"
+                "    issueCount\n"
+                "  }"
+            )
+
+    return "query ($since: GitTimestamp!, $until: GitTimestamp!) {\n" + "\n".join(fields) + "\n}"
+
+
+def get_repo_statistics_by_rest(repo):
+    """
+    Requests the statistics of a repository by the REST API, the same ones as get_repos_statistics_by_graphql().
+
+    :param repo: Repository from the organization's repos_url.
+    :return: Dictionary of the statistics.
+    """
+    global since, until, issues_backend, REPOS_API_URL
+
+    repo_api_url = REPOS_API_URL + repo["full_name"]
+    if issues_backend == ISSUES_BACKEND_SEARCH:
+        closed_counts = search_closed_issues(repo["full_name"], since, until)
+    else:
+        closed_counts = scan_issues_since(repo_api_url + "/issues", "closed", since)
+
+    return {
+        "name": repo["name"],
+        "full_name": repo["full_name"],
+        "commits": get_commits_during_the_period(repo_api_url + "/commits", since, until),
+        "forks_count": repo["forks_count"],
+        "stargazers_count": repo["stargazers_count"],
+        "issues": closed_counts["issues"],
+        "prs": closed_counts["prs"],
+    }
+
+
+def get_repos_statistics_by_graphql(repos):
+    """
+    Requests the statistics of repositories by a single GraphQL query.
+
+    A repository without data, e.g., deleted, renamed or not accessible since the listing,
+    falls back to get_repo_statistics_by_rest(), and is skipped if it fails as well.
+
+    :param repos: List of repositories from the organization's repos_url.
+    :return: List of dictionaries of the statistics, or None for a skipped repository,
+             in the order of the given repositories.
+    """
+    global since, until, issues_backend
+
+    if issues_backend == ISSUES_BACKEND_SEARCH:
+        search_aggregations = SEARCH_AGGREGATIONS
+    else:
+        search_aggregations = UPDATED_SINCE_AGGREGATIONS
+
+    query = build_repos_graphql_query(repos, search_aggregations)
+    # The same timestamps as 'since' and 'until' of the REST API
+    variables = {"since": f"{since}T00:00:00Z", "until": f"{until}T00:00:00Z"}
+
+    data = request_github_graphql(query, variables)
+
+    repos_statistics = []
+    for index, repo in enumerate(repos):
+        repo_data = data.get(f"repo{index}")
+        search_data = [data.get(f"repo{index}_{aggregation}") for aggregation in search_aggregations]
+        if repo_data is None or None in search_data:
+            logger.warning("No GraphQL data of %s, fall back to REST" % repo["full_name"])
+            try:
+                repos_statistics.append(get_repo_statistics_by_rest(repo))
+            except Exception as e:
+                logger.error("Skip repo %s: %s" % (repo["full_name"], e))
+                repos_statistics.append(None)
+            continue
+
+        # An empty repository has no default branch
+        number_of_commits = 0
+        if repo_data["defaultBranchRef"]:
+            number_of_commits = repo_data["defaultBranchRef"]["target"]["history"]["totalCount"]
+
+        statistics = {
+            "name": repo_data["name"],
+            "full_name": repo_data["nameWithOwner"],
+            "commits": number_of_commits,
+            "forks_count": repo_data["forkCount"],
+            "stargazers_count": repo_data["stargazerCount"],
+        }
+        for aggregation, aggregation_data in zip(search_aggregations, search_data):
+            statistics[aggregation] = aggregation_data["issueCount"]
+
+        repos_statistics.append(statistics)
+
+    return repos_statistics
+
+
+def collect_repos_statistics_by_graphql(repos, max_workers):
+    """
+    Collects statistics of the given repositories by GraphQL queries.
+
+    The repositories are requested in chunks of GRAPHQL_REPOS_PER_QUERY per query.
+    GraphQL API does not provide the number of contributors,
+    so it is counted by the REST API, a request per repository.
+
+    :param repos: Iterable of repositories from the organization's repos_url.
+    :param max_workers: Maximum number of concurrent workers.
+    :return: StatisticsTable of a row per repository, the same as collect_repos_statistics().
+    """
+    global REPOS_API_URL
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        chunk_futures = []
+        contributors_futures = []
+        chunk = []
+        # The same span as the REST backend, so the profiles of the backends can be compared
+        with span("repo listing"):
+            for repo in repos:
+                contributors_url = REPOS_API_URL + repo["full_name"] + "/contributors"
+                get_repo_contributors = traced("contributors", get_contributors, repo=repo["full_name"])
+                contributors_futures.append(executor.submit(get_repo_contributors, contributors_url))
+
+                # A chunk is queried as soon as it is full, while the later repos are loading
+                chunk.append(repo)
+                if len(chunk) == GRAPHQL_REPOS_PER_QUERY:
+                    logger.info("Starting to get info of %s repos by GraphQL" % len(chunk))
+                    get_chunk = traced("graphql chunk", get_repos_statistics_by_graphql, repos=len(chunk))
+                    chunk_futures.append(executor.submit(get_chunk, chunk))
+                    chunk = []
+
+            if chunk:
+                logger.info("Starting to get info of %s repos by GraphQL" % len(chunk))
+                get_chunk = traced("graphql chunk", get_repos_statistics_by_graphql, repos=len(chunk))
+                chunk_futures.append(executor.submit(get_chunk, chunk))
+
+        repos_statistics = []
+        for future in chunk_futures:
+            repos_statistics.extend(future.result())
+
+        table = StatisticsTable(get_repos_statistics_headers())
+        for statistics, future in zip(repos_statistics, contributors_futures):
+            if statistics is None:
+                continue
+
+            row = [
+                statistics["name"],
+                "https://github.com/" + statistics["full_name"],
+                statistics["commits"],
+                statistics["forks_count"],
+                statistics["stargazers_count"],
+                statistics["issues"],
+                statistics["prs"],
+                future.result(),
+            ]
+            table.append(row)
+
+            logger.info("Collected %s's info" % statistics["name"])
+
+    return table
+
+
+# Fields of an issue read by the incremental count, which keeps the numbers of the counted issues
+INCREMENTAL_ISSUE_FIELDS = ["number", "state", "pull_request", "closed_at"]
+# Fields of a commit read by the incremental count, which keeps the SHAs of the counted commits
+INCREMENTAL_COMMIT_FIELDS = ["sha"]
+
+
+def scan_closed_issue_numbers(url_issues, state, updated_since, closed_since, closed_until=None):
+    """
+    Scans the issues updated since a timestamp, and returns the numbers of the ones closed in a period.
+
+    :param url_issues: URL of the issues endpoint of a repository.
+    :param state: State of the issues scanned, "closed", or "all" to see the reopened ones as well.
+    :param updated_since: Only issues updated at or after this timestamp are scanned.
+    :param closed_since: Timestamp in WATERMARK_FORMAT, issues closed before it are skipped.
+    :param closed_until: Timestamp in WATERMARK_FORMAT, issues closed at or after it are skipped (optional).
+    :return: Dictionary of "issues" and "prs" and the sets of their numbers,
+             and "scanned" and the set of the numbers of all the scanned issues and pull requests.
+    """
+    params = {
+        "state": state,
+        "since": updated_since,
+    }
+
+    numbers = {"issues": set(), "prs": set(), "scanned": set()}
+    for issue in iter_projected_items(url_issues, INCREMENTAL_ISSUE_FIELDS, params):
+        numbers["scanned"].add(issue["number"])
+        if issue.get("state") == "open":
+            continue
+        closed_at = issue.get("closed_at")
+        if closed_at is None or closed_at < closed_since:
+            continue
+        if closed_until is not None and closed_at >= closed_until:
+            continue
+        numbers["prs" if "pull_request" in issue else "issues"].add(issue["number"])
+
+    return numbers
+
+
+def scan_commit_shas(url_commits, since, until):
+    """
+    Scans the commits of a period, and returns their SHAs.
+
+    :param url_commits: URL of the commits endpoint of a repository.
+    :param since: Start of the period, a date or a timestamp.
+    :param until: End of the period, a date or a timestamp.
+    :return: Set of the SHAs.
+    """
+    params = {
+        "since": since,
+        "until": until,
+    }
+
+    return {commit["sha"] for commit in iter_projected_items(url_commits, INCREMENTAL_COMMIT_FIELDS, params)}
+
+
+def fetch_commits_to_store(full_name, since, until):
+    """
+    Fetches the commits of a period of a repository to the commit store.
+
+    Nothing is fetched if the stored period covers it, except its last 'overlap-days',
+    where a commit can still be pushed later with an older date, e.g., of a merged branch.
+    Otherwise only the commits after the stored period, and its last 'overlap-days', are fetched
+    if it overlaps, and the commits fetched again are stored once by their SHAs.
+
+    :param full_name: Full name of a repository.
+    :param since: Start date of the period.
+    :param until: End date of the period.
+    """
+    global commit_store, overlap_days, REPOS_API_URL
+
+    # Commits after now do not exist yet, so the stored period ends now at the latest
+    now = datetime.datetime.now(datetime.timezone.utc).strftime(WATERMARK_FORMAT)
+    since = to_timestamp(since)
+    until = min(to_timestamp(until), now)
+
+    coverage = commit_store.get_coverage(full_name)
+    if coverage is not None and coverage[0] <= since and until <= subtract_days(coverage[1], overlap_days):
+        logger.debug("Commits of %s from %s until %s are stored" % (full_name, since, until))
+        return
+
+    fetch_since = since
+    if coverage is not None and coverage[0] <= since <= coverage[1]:
+        fetch_since = max(since, subtract_days(coverage[1], overlap_days))
+
+    commits_url = REPOS_API_URL + full_name + "/commits"
+    params = {
+        "since": fetch_since,
+        "until": until,
+    }
+    commits = list(iter_projected_items(commits_url, COMMIT_FIELDS, params))
+    logger.debug("Store %s commits of %s from %s until %s" % (len(commits), full_name, fetch_since, until))
+
+    commit_store.add_commits(full_name, commits, fetch_since, until)
+
+
+def count_commits_from_store(full_name, since, until):
+    """
+    Counts commits of a repository in a period from the commit store.
+
+    :param full_name: Full name of a repository.
+    :param since: Start date of the period.
+    :param until: End date of the period.
+    :return: Number of commits.
+    """
+    global commit_store
+
+    fetch_commits_to_store(full_name, since, until)
+    return commit_store.count_commits(full_name, since, until)
+
+
+def count_commits_incrementally(full_name, watermark):
+    """
+    Counts commits of a repository from 'since' until 'until' incrementally.
+
+    The SHAs of the counted commits are stored, and only the commits dated after their watermark
+    minus 'overlap-days' are scanned, and added if they are not counted yet.
+    So a commit dated after the watermark but fetched by the previous run is counted once,
+    and a commit pushed after the previous run with an older date, e.g., of a merged branch,
+    is counted if it is dated within the overlap.
+
+    :param full_name: Full name of a repository.
+    :param watermark: Timestamp to count the commits up to, in WATERMARK_FORMAT.
+    :return: Number of commits.
+    """
+    global since, until, overlap_days, watermark_store, REPOS_API_URL
+
+    commits_url = REPOS_API_URL + full_name + "/commits"
+
+    stored = watermark_store.get_numbers(full_name, "commits")
+    if stored is None:
+        shas = scan_commit_shas(commits_url, since, until)
+    else:
+        shas, stored_watermark = stored
+        scan_since = max(f"{since}T00:00:00Z", subtract_days(stored_watermark, overlap_days))
+        logger.debug("Count commits of %s after %s" % (full_name, scan_since))
+        shas |= scan_commit_shas(commits_url, scan_since, until)
+
+    watermark_store.set(full_name, "commits", len(shas), watermark, shas)
+    return len(shas)
+
+
+def count_closed_issues_incrementally(full_name, watermark):
+    """
+    Counts issues and pull requests of a repository closed since 'since' incrementally.
+
+    The numbers of the counted issues and pull requests are stored, and only the ones updated
+    after their watermark are scanned again, in any state, and counted by their current state.
+    So an issue closed again after being reopened is counted once, an issue reopened and still open
+    is dropped, and the count equals a full rescan.
+    Unlike the non-incremental REST scan, which counts the closed issues updated since 'since',
+    an issue is counted by its "closed_at", and with the search backend, if it is closed until 'until'.
+
+    :param full_name: Full name of a repository.
+    :param watermark: Timestamp to count up to, in WATERMARK_FORMAT.
+    :return: Dictionary of "issues" and "prs" and their numbers.
+    """
+    global since, until, issues_backend, watermark_store, REPOS_API_URL
+
+    issues_url = REPOS_API_URL + full_name + "/issues"
+    closed_since = f"{since}T00:00:00Z"
+    closed_until = None
+    if issues_backend == ISSUES_BACKEND_SEARCH:
+        # 'until' is included as in the search qualifier closed:{since}..{until}
+        closed_until = f"{until + datetime.timedelta(days=1)}T00:00:00Z"
+
+    stored_issues = watermark_store.get_numbers(full_name, "issues")
+    stored_prs = watermark_store.get_numbers(full_name, "prs")
+    if stored_issues is None or stored_prs is None:
+        numbers = scan_closed_issue_numbers(issues_url, "closed", closed_since, closed_since, closed_until)
+    else:
+        numbers = {"issues": stored_issues[0], "prs": stored_prs[0]}
+        stored_watermark = stored_issues[1]
+        if stored_watermark < watermark:
+            logger.debug("Count issues and pull requests of %s updated after %s" % (full_name, stored_watermark))
+            new_numbers = scan_closed_issue_numbers(issues_url, "all", stored_watermark, closed_since, closed_until)
+            # The updated ones are counted again by their current state, e.g., a reopened one is dropped
+            for metric in ["issues", "prs"]:
+                numbers[metric] = (numbers[metric] - new_numbers["scanned"]) | new_numbers[metric]
+
+    watermark_store.set(full_name, "issues", len(numbers["issues"]), watermark, numbers["issues"])
+    watermark_store.set(full_name, "prs", len(numbers["prs"]), watermark, numbers["prs"])
+    return {"issues": len(numbers["issues"]), "prs": len(numbers["prs"])}
+
+
+def collect_repos_statistics(repos, max_workers):
+    """
+    Collects statistics of the given repositories concurrently.
+
+    Each repository and each metric of a repository is submitted to one
+    thread pool, so independent requests run at the same time.
+    The rows are returned in the same order as the given repositories.
+
+    :param repos: Iterable of repositories from the organization's repos_url,
+                  the work on a repository starts as soon as it is yielded.
+    :param max_workers: Maximum number of concurrent workers.
+    :return: StatisticsTable of a row per repository.
+    """
+    global since, until, backend, issues_backend, watermark_store, commit_store, REPOS_API_URL
+
+    if backend == BACKEND_GRAPHQL:
+        return collect_repos_statistics_by_graphql(repos, max_workers)
+
+    if watermark_store is not None:
+        # Count up to now, but not after 'until'
+        now = datetime.datetime.now(datetime.timezone.utc).strftime(WATERMARK_FORMAT)
+        until_watermark = min(now, f"{until}T00:00:00Z")
+
+    repos_futures = []
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # The repositories arrive page by page, while the workers collect the submitted ones
+        with span("repo listing"):
+            for repo in repos:
+                logger.info("Starting to get %s's info" % repo["name"])
+
+                # API URL of the repository, its stars and forks are already in the listing
+                full_name = repo["full_name"]
+                repo_api_url = REPOS_API_URL + full_name
+
+                # Request the number of commits
+                # reference:
+                # https://docs.github.com/en/free-pro-team@latest/rest/reference/repos#list-commits
+                commits_url = repo_api_url + "/commits"
+                issues_url = repo_api_url + "/issues"
+                # prs_url = repo_api_url + "/pulls"
+
+                if commit_store is not None:
+                    commits = executor.submit(
+                        traced("commits", count_commits_from_store, repo=full_name), full_name, since, until
+                    )
+                elif watermark_store is not None:
+                    commits = executor.submit(
+                        traced("commits", count_commits_incrementally, repo=full_name), full_name, until_watermark
+                    )
+                else:
+                    commits = executor.submit(
+                        traced("commits", get_commits_during_the_period, repo=full_name), commits_url, since, until
+                    )
+
+                if watermark_store is not None:
+                    issues_and_prs = executor.submit(
+                        traced("issues and prs", count_closed_issues_incrementally, repo=full_name),
+                        full_name,
+                        now,
+                    )
+                elif issues_backend == ISSUES_BACKEND_SEARCH:
+                    issues_and_prs = executor.submit(
+                        traced("issues and prs", search_closed_issues, repo=full_name), full_name, since, until
+                    )
+                else:
+                    # Closed issues and pull requests in a single pass
+                    issues_and_prs = executor.submit(
+                        traced("issues and prs", scan_issues_since, repo=full_name), issues_url, "closed", since
+                    )
+
+                futures = {
+                    "contributors": executor.submit(
+                        traced("contributors", get_contributors, repo=full_name), repo_api_url + "/contributors"
+                    ),
+                    "commits": commits,
+                    "issues_and_prs": issues_and_prs,
+                }
+                repos_futures.append((repo, futures))
+
+        table = StatisticsTable(get_repos_statistics_headers())
+        for repo, futures in repos_futures:
+            # Stars and forks are in the listing of the organization's repos
+            repo_info = repo
+            number_of_contributors = futures["contributors"].result()
+            number_of_commits = futures["commits"].result()
+            closed_counts = futures["issues_and_prs"].result()
+            number_of_issues_closed = closed_counts["issues"]
+            number_of_prs_closed = closed_counts["prs"]
+
+            # repo_name = repo["name"]
+            repo_link = "https://github.com/" + repo["full_name"]
+
+            logger.debug("Repo name: %s" % repo_info["name"])
+            logger.debug("Repo link: %s" % repo_link)
+            logger.debug("Commits (since %s until %s): %s" % (since, until, number_of_commits))
+            logger.debug("Forks: %s" % (repo_info["forks_count"]))
+            logger.debug("Stars: %s" % (repo_info["stargazers_count"]))
+            logger.debug("Issues closed (since %s): %s" % (since, number_of_issues_closed))
+            logger.debug("Pull requests closed (since %s): %s" % (since, number_of_prs_closed))
+            logger.debug("Contributors: %s" % number_of_contributors)
+            # logger.debug("Watches: %s" % (repo_info["subscribers_count"]))
+
+            row = [
+                repo_info["name"],
+                repo_link,
+                number_of_commits,
+                repo_info["forks_count"],
+                repo_info["stargazers_count"],
+                number_of_issues_closed,
+                number_of_prs_closed,
+                number_of_contributors,
+            ]
+            #     repo_info["subscribers_count"],
+            # ]
+            table.append(row)
+
+            logger.info("Collected %s's info" % repo["name"])
+
+    if watermark_store is not None:
+        watermark_store.save()
+
+    return table
+
+
+def save_repos_statistics(table):
+    """
+    Saves the statistics of repositories to a CSV file with the Sum row,
+    and to a Parquet file if it is enabled.
+
+    :param table: StatisticsTable of a row per repository.
+    :return: Path of the CSV file.
+    """
+    global org_name, parquet
+
+    outputfile_name = (
+        "./results/("
+        + org_name
+        + ")repos-statistics-rawdata-"
+        + datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+        + ".csv"
+    )
+
+    logger.info("Output file: %s" % outputfile_name)
+
+    # Write header, rows and the sum of each column except column 0 and 1
+    table.write_csv(outputfile_name)
+
+    if parquet:
+        parquet_file_name = os.path.splitext(outputfile_name)[0] + ".parquet"
+        if table.write_parquet(parquet_file_name):
+            logger.info("Output file: %s" % parquet_file_name)
+
+    logger.info("Saved all repos info")
+
+    return outputfile_name
+
+
+def get_target_repos_info(repos_url, target_repos):
+    global org_name, since, until, max_workers, PER_PAGE_100
+
+    ##########################################################################
+    # Target repos information
+
+    # Read repos from a repos_url from organization, page by page
+    logger.debug("Read repos from a repos_url from organization")
+    repos = iter_all_items(repos_url)
+
+    def iter_target_repos():
+        for repo in repos:
+            if repo["name"] not in target_repos:
+                logger.debug("Skip repo: %s" % repo["name"])
+                continue
+            yield repo
+
+    # The target repos are collected as soon as their page arrives
+    table = collect_repos_statistics(iter_target_repos(), max_workers)
+
+    with span("csv writing"):
+        save_repos_statistics(table)
+
+    return table.to_dataframe()
+
+
+def main():
+    global watermark_store, commit_store
+
+    parser = argparse.ArgumentParser(description="Count the meaningful achievements of an organization on GitHub.")
+    add_cache_arguments(parser)
+    add_cassette_arguments(parser)
+    add_profile_arguments(parser)
+    parser.add_argument(
+        "--full-rescan", action="store_true", help="discard the stored counts of the incremental mode and count all"
+    )
+    args = parser.parse_args()
+
+    setup_logging()
+    load_config()
+
+    # Their requests depend on the stored state and the current time, which differ from the recorded run
+    if args.replay and (incremental or commit_store_enabled):
+        print("--replay cannot be used with incremental or commit-store. Please set them to false to replay.")
+        sys.exit(1)
+
+    # Time the phases of the run if --profile is given
+    start_profiling(args)
+
+    logger.info("Starting to get organization information")
+
+    if repositories:
+        logger.info("Target repositories: %s" % repositories)
+
+    # # Get today's date
+    # today = date.today()
+    # this_year = today.year
+
+    # Collect the metrics of the requests
+    metrics = RequestMetrics() if config.get("metrics", False) else None
+    set_request_metrics(metrics)
+
+    # Record or replay the responses, which bypasses the caches
+    cassette = open_cassette(args)
+    set_cassette(cassette)
+
+    # Set the HTTP cache
+    http_cache = open_http_cache(args, config)
+    set_http_cache(http_cache)
+
+    # Load the stored counts of the incremental mode
+    if incremental:
+        window = {"since": str(since), "until": str(until), "issues-backend": issues_backend}
+        watermark_store = WatermarkStore(watermarks_path, window, reset=args.full_rescan)
+
+    # Open the local store of commit metadata
+    if commit_store_enabled:
+        commit_store = CommitStore(commit_store_path)
+
+    # Get organization information
+    logger.info("Getting organization information")
+    with span("org info"):
+        org_info = get_orgs_info(org_name)
+
+    logger.info("Getting target repositories information")
+    get_target_repos_info(org_info["repos_url"], repositories)
+
+    # get_repos_commits(org_info["repos_url"], repos_ignore)
+    # get_monthly_commits(org_info["repos_url"], repos_ignore)
+
+    if commit_store is not None:
+        commit_store.close()
+    if http_cache is not None:
+        http_cache.close()
+    if metrics is not None:
+        textfile_directory = config.get("metrics-textfile-directory", DEFAULT_METRICS_TEXTFILE_DIRECTORY)
+        json_path, textfile_path = save_request_metrics(metrics, org_name, "orgs", textfile_directory)
+        logger.info("Request metrics: %s, %s" % (json_path, textfile_path))
+    if cassette is not None:
+        cassette.close()
+    for profile_path in stop_profiling(org_name, "orgs"):
+        logger.info("Profile: %s" % profile_path)
+    close_session()
+
+##################################################################
+##################################################################
+##################################################################
+# Keep this code
+
+# Test code - GitHub API example
+#  http://api.github.com/repos/[username]/[reponame]
+# link = "http://api.github.com/repos/cloud-barista/cb-spider"
+# data = json.loads(gh_session.get(link).text)
+# pretty_json = json.dumps(data, indent=4, sort_keys=True)
+# print(pretty_json)
+#
+# print("Stars: %s" % (data["stargazers_count"]))
+# print("Forks: %s" % (data["forks_count"]))
+# print("Watches: %s" % (data["subscribers_count"]))
+
+
+def get_all_repos_info(repos_url):
+    global org_name, since, until, max_workers, PER_PAGE_100
+
+    ##########################################################################
+    # Target repos information
+
+    # Read repos from a repos_url from organization, page by page
+    logger.debug("Read repos from a repos_url from organization")
+    repos = iter_all_items(repos_url)
+
+    table = collect_repos_statistics(repos, max_workers)
+
+    save_repos_statistics(table)
+
+    return table.to_dataframe()
+
+
+def get_prs(url_prs, state):
+    params = {"state": state}
+
+    number_of_prs = count_items(url_prs, params)
+    logger.debug("Number of pull requests: %s" % number_of_prs)
+
+    return number_of_prs
+
+
+# Periods of the commit tables: step as relativedelta arguments, header of the first column, and label of a period
+COMMIT_PERIODS = {
+    "weekly": ({"weeks": 1}, "YYYY-MM-DD", lambda day: day.strftime("%Y-%m-%d")),
+    "monthly": ({"months": 1}, "YYYY-MM", lambda day: day.strftime("%Y-%m")),
+    "quarterly": ({"months": 3}, "YYYY-Qn", lambda day: f"{day.year}-Q{(day.month - 1) // 3 + 1}"),
+}
+
+
+def get_commit_dates(commits_url, since, until, date_field="committer"):
+    """
+    Fetches the commits of a period once and returns their dates.
+
+    :param commits_url: URL of the commits endpoint of a repository.
+    :param since: Start date of the period.
+    :param until: End date of the period.
+    :param date_field: "committer" or "author", whose date is used.
+    :return: NumPy array of datetime64[s] in UTC.
+    """
+    import numpy as np
+
+    params = {
+        "since": since,
+        "until": until,
+    }
+
+    # e.g., "2023-01-01T09:00:00Z" -> "2023-01-01T09:00:00"
+    dates = [
+        commit["commit"][date_field]["date"].rstrip("Z")
+        for commit in iter_projected_items(commits_url, [f"commit.{date_field}.date"], params)
+    ]
+
+    return np.array(dates, dtype="datetime64[s]")
+
+
+def get_repo_commit_dates(full_name, since, until):
+    """
+    Returns the committer dates of the commits of a repository in a period.
+
+    The dates are read from the commit store if it is set, otherwise fetched from the API.
+
+    :return: NumPy array of datetime64[s] in UTC.
+    """
+    global commit_store, REPOS_API_URL
+
+    import numpy as np
+
+    if commit_store is None:
+        return get_commit_dates(REPOS_API_URL + full_name + "/commits", since, until)
+
+    fetch_commits_to_store(full_name, since, until)
+    dates = [date.rstrip("Z") for date in commit_store.get_commit_dates(full_name, since, until)]
+    return np.array(dates, dtype="datetime64[s]")
+
+
+def get_period_starts(since, until, step):
+    """Returns the start dates of the periods from 'since' until 'until', the columns of a table."""
+    period_starts = []
+    period_start = since
+    while period_start <= until:
+        period_starts.append(period_start)
+        period_start = period_start + step
+    return period_starts
+
+
+def get_period_bounds(since, until, step, today):
+    """
+    Returns the periods counted from 'since' until 'until', the same as a commits query per period.
+
+    A period is from its start date to the start date of the next period, both inclusive
+    as 'since' and 'until' of the API, so a commit at the midnight of a boundary is counted in both.
+    The periods stop at the one that ends on or after today or 'until', which ends at 'until',
+    so a table can have fewer counts than its columns.
+
+    :param since: Start date of the first period.
+    :param until: End date of the last period.
+    :param step: relativedelta of a period.
+    :param today: Date of today.
+    :return: List of tuples of the start and end dates of the periods.
+    """
+    period_bounds = []
+    period_start = since
+    period_end = period_start + step
+    while period_end < today and period_end < until:
+        period_bounds.append((period_start, period_end))
+        period_start = period_start + step
+        period_end = period_start + step
+    period_bounds.append((period_start, until))
+    return period_bounds
+
+
+def count_commits_by_period(commit_dates, period_bounds):
+    """
+    Counts commits in each period by a vectorized binary search of the dates.
+
+    :param commit_dates: NumPy array of datetime64 of commits.
+    :param period_bounds: List of tuples of the start and end dates of the periods, both inclusive.
+    :return: List of the number of commits in each period.
+    """
+    import numpy as np
+
+    commit_dates = np.sort(commit_dates)
+    period_starts = np.array([start for start, _ in period_bounds], dtype="datetime64[s]")
+    period_ends = np.array([end for _, end in period_bounds], dtype="datetime64[s]")
+
+    first_indexes = np.searchsorted(commit_dates, period_starts, side="left")
+    last_indexes = np.searchsorted(commit_dates, period_ends, side="right")
+
+    return (last_indexes - first_indexes).tolist()
+
+
+def get_periodic_commits(repos_url, repos_ignore, periods=("monthly",)):
+    """
+    Writes the commits of repositories per period, e.g., monthly, to CSV files.
+
+    The commits of the whole window are fetched once per repository,
+    and the same commit dates are counted for every period.
+    The counts are the same as a commits query per period, see get_period_bounds().
+
+    :param repos_url: URL of the repositories of the organization.
+    :param repos_ignore: List of repository names to ignore.
+    :param periods: Periods of the tables, keys of COMMIT_PERIODS.
+    """
+    global since, until, max_workers
+
+    from dateutil.relativedelta import relativedelta
+
+    # Request the commits of the period of each repository
+    # reference:
+    # https://docs.github.com/en/free-pro-team@latest/rest/reference/repos#list-commits
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        target_repos = []
+        futures = []
+        # Read repos from a repos_url from organization, page by page
+        for repo in iter_all_items(repos_url):
+            if repo["name"] in repos_ignore:
+                print("Ignore repo: %s" % repo["name"])
+                continue
+            target_repos.append(repo)
+
+            print("Start to get %s's info" % repo["name"])
+            futures.append(executor.submit(get_repo_commit_dates, repo["full_name"], since, until))
+
+        commit_dates_of_repos = [future.result() for future in futures]
+
+    today = datetime.date.today()
+    for period in periods:
+        step, first_header, label = COMMIT_PERIODS[period]
+        period_starts = get_period_starts(since, until, relativedelta(**step))
+        period_bounds = get_period_bounds(since, until, relativedelta(**step), today)
+
+        ###########################################################################
+        # Repositories' commits per period
+        org_repos_commits_file = open(f"./results/org-{period}-commits.csv", "w", newline="")
+        org_repos_commits_writer = csv.writer(org_repos_commits_file)
+
+        # Create header
+        header = [first_header]
+        header.extend(label(period_start) for period_start in period_starts)
+        header.append("Sum")
+
+        # Write header
+        org_repos_commits_writer.writerow(header)
+
+        # Write data
+        # Data structure in a row :
+        # [repo name, commits[0], commits[1], ......, sum of commits]
+        for repo, commit_dates in zip(target_repos, commit_dates_of_repos):
+            number_of_commits = count_commits_by_period(commit_dates, period_bounds)
+
+            row = [repo["name"]]
+            row.extend(number_of_commits)
+            row.append(sum(number_of_commits))
+
+            # Write row
+            org_repos_commits_writer.writerow(row)
+
+        org_repos_commits_file.close()
+
+
+def get_monthly_commits(repos_url, repos_ignore):
+    get_periodic_commits(repos_url, repos_ignore, periods=("monthly",))
+
+
+def get_repos_commits(repos_url, repos_ignore):
+    global since, until
+
+    # Read repos from a repos_url from organization, page by page
+    repos = iter_all_items(repos_url)
+
+    headers = [
+        "Repo",
+        "Commits",
+    ]
+
+    # repos_result_writer.writerow(headers)
+
+    repos_table = StatisticsTable(headers, label_columns=1)
+
+    for repo in repos:
+        if repo["name"] in repos_ignore:
+            print("Ignore repo: %s" % repo["name"])
+            continue
+
+        print("Start to get %s's info" % repo["name"])
+
+        # The name is in the listing of the organization's repos
+        repo_info = repo
+
+        commits_url = REPOS_API_URL + repo["full_name"] + "/commits"
+        repo_commits = get_commits_during_the_period(commits_url, since, until)
+
+        repos_table.append(
+            [
+                repo_info["name"],
+                repo_commits,
+            ]
+        )
+
+    print("Save all repos info")
+    outputfile_name = (
+        "./results/("
+        + org_name
+        + ")repos-commits-rawdata-"
+        + datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+        + ".csv"
+    )
+    repos_table.write_csv(outputfile_name, with_sum=False)
+
+
+def get_forks_since(url_forks, since):
+    number_of_forks_in_a_month = 0
+
+    params = {"per_page": PER_PAGE_100}
+
+    forks = request_github_api(url_forks, params)
+
+    for fork in forks:
+        create_at = datetime.datetime.strptime(fork["created_at"], "%Y-%m-%dT%H:%M:%SZ")
+        create_at = create_at.date()
+        if create_at >= since:
+            number_of_forks_in_a_month += 1
+        else:
+            break
+
+    return number_of_forks_in_a_month
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+import contextlib
+import datetime
+import functools
+import json
+import os
+import sys
+import threading
+import time
+
+##############################################################################
+# Constants
+# Process id of the events, there is one process
+TRACE_PID = 1
+
+# Profiler of the run, disabled if None, set by start_profiling()
+profiler = None
+
+
+class Profiler:
+    """
+    Timed spans of the phases of a run, written as Chrome trace events.
+
+    Each span is a complete event on the thread it ran on, so the trace shows
+    the overlap of the workers, the stragglers and the idle time per worker,
+    e.g., in chrome://tracing or https://ui.perfetto.dev.
+    Optionally, the run is profiled by cProfile as well.
+    """
+
+    def __init__(self, cprofile=False):
+        """
+        :param cprofile: Profile the functions by cProfile as well (optional).
+        """
+        self.events = []
+        self.thread_names = {}
+        self.start = time.perf_counter_ns()
+        self.lock = threading.Lock()
+
+        self.profiles = []
+        if cprofile:
+            self._start_cprofile()
+
+    def _start_cprofile(self):
+        import cProfile
+
+        profile = cProfile.Profile()
+        self.profiles.append(profile)
+        profile.enable()
+
+        # Before Python 3.12, a profile sees only its own thread, so every new thread gets its own
+        if sys.version_info < (3, 12):
+
+            def enable_thread_profile(frame, event, arg):
+                thread_profile = cProfile.Profile()
+                with self.lock:
+                    self.profiles.append(thread_profile)
+                thread_profile.enable()
+
+            threading.setprofile(enable_thread_profile)
+
+    def now(self):
+        """Returns microseconds since the start of the profiler."""
+        return (time.perf_counter_ns() - self.start) / 1000
+
+    def add_span(self, name, category, start, end, args):
+        thread = threading.current_thread()
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": start,
+            "dur": end - start,
+            "pid": TRACE_PID,
+            "tid": thread.ident,
+        }
+        if args:
+            event["args"] = args
+
+        with self.lock:
+            self.events.append(event)
+            self.thread_names.setdefault(thread.ident, thread.name)
+
+    def write_trace(self, path):
+        """Writes the spans as a JSON file of Chrome trace events."""
+        with self.lock:
+            events = list(self.events)
+            thread_names = dict(self.thread_names)
+
+        metadata = [
+            {"name": "thread_name", "ph": "M", "pid": TRACE_PID, "tid": tid, "args": {"name": name}}
+            for tid, name in thread_names.items()
+        ]
+        with open(path, "w") as trace_file:
+            json.dump({"traceEvents": metadata + events, "displayTimeUnit": "ms"}, trace_file)
+
+    def write_cprofile(self, path):
+        """Writes the profiles of all threads merged, for pstats or snakeviz."""
+        import pstats
+
+        threading.setprofile(None)
+        for profile in self.profiles:
+            profile.disable()
+
+        stats = pstats.Stats(self.profiles[0])
+        for profile in self.profiles[1:]:
+            stats.add(profile)
+        stats.dump_stats(path)
+
+
+def span(name, category="phase", **args):
+    """
+    Returns a context manager timing a span, e.g., with span("org info"): ...
+
+    It does nothing if profiling is not started.
+
+    :param name: Name of the span.
+    :param category: Category of the span, e.g., "phase" or "repo".
+    :param args: Arguments shown with the span, e.g., repo="cb-spider".
+    """
+    if profiler is None:
+        return contextlib.nullcontext()
+    return _span(profiler, name, category, args)
+
+
+@contextlib.contextmanager
+def _span(active_profiler, name, category, args):
+    start = active_profiler.now()
+    try:
+        yield
+    finally:
+        active_profiler.add_span(name, category, start, active_profiler.now(), args)
+
+
+def traced(name, function, category="repo", **args):
+    """
+    Wraps a function to run in a span, e.g., a task submitted to a thread pool.
+
+    :param name: Name of the span.
+    :param function: Function to wrap.
+    :param category: Category of the span (optional).
+    :param args: Arguments shown with the span.
+    :return: The wrapped function, or the function itself if profiling is not started.
+    """
+    if profiler is None:
+        return function
+
+    @functools.wraps(function)
+    def wrapper(*function_args, **function_kwargs):
+        with span(name, category, **args):
+            return function(*function_args, **function_kwargs)
+
+    return wrapper
+
+
+def add_profile_arguments(parser):
+    """Adds the command line switches of the profiler to an argparse.ArgumentParser."""
+    parser.add_argument("--profile", action="store_true", help="write the spans of the phases as a Chrome trace")
+    parser.add_argument(
+        "--profile-cprofile", action="store_true", help="with --profile, write a cProfile dump of the run as well"
+    )
+
+
+def start_profiling(args):
+    """
+    Starts profiling according to the command line switches.
+
+    :param args: Parsed arguments with the switches of add_profile_arguments().
+    """
+    global profiler
+
+    if args.profile:
+        profiler = Profiler(cprofile=args.profile_cprofile)
+
+
+def stop_profiling(org_name, job):
+    """
+    Stops profiling and writes the trace, and the cProfile dump if it is enabled, to results.
+
+    :param org_name: Name of the organization, used in the file names.
+    :param job: Name of the script, used in the file names.
+    :return: List of the paths written, empty if profiling is not started.
+    """
+    global profiler
+
+    if profiler is None:
+        return []
+
+    active_profiler = profiler
+    profiler = None
+
+    file_name = os.path.join(
+        "results", f"({org_name})profile-{job}-" + datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+    )
+    paths = [file_name + ".trace.json"]
+    active_profiler.write_trace(paths[0])
+    if active_profiler.profiles:
+        paths.append(file_name + ".prof")
+        active_profiler.write_cprofile(paths[1])
+    return paths
@@ -0,0 +1,200 @@
+import collections
+import logging
+import threading
+import time
+
+##############################################################################
+# Constants
+# Resources of the rate limits, as in the X-RateLimit-Resource header
+RESOURCE_CORE = "core"
+RESOURCE_SEARCH = "search"
+RESOURCE_GRAPHQL = "graphql"
+# Secondary rate limit: no more than 900 points per minute for REST API endpoints
+# https://docs.github.com/en/rest/using-the-rest-api/rate-limits-for-the-rest-api#about-secondary-rate-limits
+DEFAULT_REQUESTS_PER_SECOND = 15
+DEFAULT_BURST = 30
+# Search API has a separate rate limit: 30 requests per minute of an access token when authenticated
+# https://docs.github.com/en/rest/search/search#rate-limit
+DEFAULT_SEARCH_REQUESTS_PER_MINUTE = 30
+SEARCH_WINDOW_SECONDS = 60
+# Wait at least one minute on a secondary rate limit without Retry-After
+SECONDARY_RATE_LIMIT_WAIT = 60
+
+##############################################################################
+# Logging
+
+# Handlers are attached by the entry scripts
+logger = logging.getLogger("my_logger")
+
+
+class RateLimitScheduler:
+    """
+    Schedules requests within the rate limits of the GitHub API.
+
+    Requests are paced by a token bucket, so a burst of concurrent requests
+    does not hit the secondary rate limit.
+    The primary rate limit is tracked per access token and resource from the
+    X-RateLimit-* headers. Each request is sent with the access token that has
+    the most remaining requests, and an exhausted token is taken out of rotation
+    until its reset time. Requests wait only when every token is exhausted.
+    Search requests are limited per token in a sliding window of a minute as well,
+    so a search is sent with another token while one has used its searches of the minute.
+    """
+
+    def __init__(
+        self,
+        requests_per_second=DEFAULT_REQUESTS_PER_SECOND,
+        burst=DEFAULT_BURST,
+        tokens=None,
+        search_requests_per_minute=DEFAULT_SEARCH_REQUESTS_PER_MINUTE,
+    ):
+        """
+        :param requests_per_second: Rate of the token bucket.
+        :param burst: Capacity of the token bucket.
+        :param tokens: List of personal access tokens (optional), None for unauthenticated requests.
+        :param search_requests_per_minute: Search requests of a token in any minute (optional).
+        """
+        self.rate = requests_per_second
+        self.burst = burst
+        self.bucket = burst
+        self.updated_at = time.monotonic()
+        self.tokens = list(tokens) if tokens else [None]
+        self.search_limit = search_requests_per_minute
+        # Send times (epoch seconds) of the search requests in the last minute per token
+        self.search_times = {token: collections.deque() for token in self.tokens}
+        # Remaining requests and reset time (epoch seconds) per (token, resource)
+        self.remaining = {}
+        self.reset_at = {}
+        # No request is sent with a token until this time (epoch seconds) per (token, resource)
+        self.paused_until = {}
+        self.lock = threading.Lock()
+
+    def acquire(self, resource=RESOURCE_CORE):
+        """
+        Blocks until a request of the resource can be sent.
+
+        :param resource: Rate limit resource of the request.
+        :return: Access token to send the request with, None for an unauthenticated request.
+        """
+        while True:
+            with self.lock:
+                token, wait = self._choose_token(resource)
+                if wait <= 0:
+                    wait = self._take_from_bucket()
+                if wait <= 0:
+                    key = (token, resource)
+                    if self.remaining.get(key) is not None:
+                        self.remaining[key] -= 1
+                    if resource == RESOURCE_SEARCH:
+                        self.search_times[token].append(time.time())
+                    return token
+
+            time.sleep(wait)
+
+    def _choose_token(self, resource):
+        """
+        Chooses the available token with the most remaining requests.
+
+        A token whose remaining is not known yet is chosen first.
+
+        :return: Token and seconds to wait for it, 0 if it is available now.
+        """
+        now = time.time()
+
+        best_token = None
+        best_remaining = None
+        earliest_token = None
+        earliest_at = None
+        exhausted = False
+        for token in self.tokens:
+            key = (token, resource)
+
+            available_at = self.paused_until.get(key, 0)
+            if available_at > now:
+                exhausted = True
+            if self.remaining.get(key) == 0:
+                reset_at = self.reset_at.get(key, 0)
+                if reset_at > now:
+                    # Wake up a second after the reset
+                    available_at = max(available_at, reset_at + 1)
+                    exhausted = True
+                else:
+                    # The limit has been reset, so the next response tells the new remaining
+                    self.remaining[key] = None
+
+            if resource == RESOURCE_SEARCH:
+                search_times = self.search_times[token]
+                while search_times and now - search_times[0] >= SEARCH_WINDOW_SECONDS:
+                    search_times.popleft()
+                if len(search_times) >= self.search_limit:
+                    available_at = max(available_at, search_times[0] + SEARCH_WINDOW_SECONDS)
+
+            if available_at > now:
+                if earliest_at is None or available_at < earliest_at:
+                    earliest_token = token
+                    earliest_at = available_at
+                continue
+
+            remaining = self.remaining.get(key)
+            remaining = float("inf") if remaining is None else remaining
+            if best_remaining is None or remaining > best_remaining:
+                best_token = token
+                best_remaining = remaining
+
+        if best_remaining is not None:
+            return best_token, 0
+
+        if exhausted:
+            logger.warning("Rate limit of %s exhausted, wait %.0f seconds" % (resource, earliest_at - now))
+        else:
+            logger.debug("Search rate limit reached, wait %.1f seconds" % (earliest_at - now))
+        return earliest_token, earliest_at - now
+
+    def _take_from_bucket(self):
+        """Takes a token from the bucket, returns seconds to wait if it is empty."""
+        monotonic_now = time.monotonic()
+        self.bucket = min(self.burst, self.bucket + (monotonic_now - self.updated_at) * self.rate)
+        self.updated_at = monotonic_now
+        if self.bucket < 1:
+            return (1 - self.bucket) / self.rate
+
+        self.bucket -= 1
+        return 0
+
+    def update(self, token, response):
+        """Updates the remaining requests and reset time of a token from the headers of a response."""
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        reset = response.headers.get("X-RateLimit-Reset")
+        if remaining is None or reset is None:
+            return
+
+        key = (token, response.headers.get("X-RateLimit-Resource", RESOURCE_CORE))
+        with self.lock:
+            self.remaining[key] = int(remaining)
+            self.reset_at[key] = int(reset)
+
+    def get_retry_wait(self, response):
+        """
+        Returns seconds to wait before retrying a request rejected by a rate limit.
+
+        :param response: Response with status 403 or 429.
+        :return: Seconds to wait, or None if the request was not rejected by a rate limit.
+        """
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None:
+            return int(retry_after)
+
+        if response.headers.get("X-RateLimit-Remaining") == "0":
+            reset = int(response.headers.get("X-RateLimit-Reset", 0))
+            return max(reset - time.time(), 0) + 1
+
+        if "rate limit" in response.text.lower():
+            return SECONDARY_RATE_LIMIT_WAIT
+
+        return None
+
+    def pause(self, token, resource, seconds):
+        """Takes a token out of rotation for requests of the resource for the given seconds."""
+        key = (token, resource)
+        with self.lock:
+            self.paused_until[key] = max(self.paused_until.get(key, 0), time.time() + seconds)
@@ -0,0 +1,94 @@
+import collections
+import threading
+from concurrent.futures import Future
+
+##############################################################################
+# Constants
+# Total size of the bodies of the responses kept for the run, the least recently used ones are dropped first
+DEFAULT_REQUEST_MEMO_MAX_BYTES = 16 * 1024 * 1024
+# Largest body of a response kept for the run, a larger one is only shared while it is in flight
+DEFAULT_REQUEST_MEMO_MAX_RESPONSE_BYTES = 256 * 1024
+
+
+class RequestMemo:
+    """
+    In-run memo of GET responses with single-flight requests.
+
+    Concurrent callers of the same URL share one request in flight.
+    A finished response is kept for later callers only if it is small and not
+    a page of a paginated endpoint, e.g., the profile of a user or the info of a repository,
+    since the pages of a listing are read once and would only hold memory.
+    A failed request is not kept, so the next caller requests it again.
+    """
+
+    def __init__(
+        self, max_bytes=DEFAULT_REQUEST_MEMO_MAX_BYTES, max_response_bytes=DEFAULT_REQUEST_MEMO_MAX_RESPONSE_BYTES
+    ):
+        """
+        :param max_bytes: Maximum total size of the bodies of the responses kept.
+        :param max_response_bytes: Maximum size of the body of a response kept.
+        """
+        self.max_bytes = max_bytes
+        self.max_response_bytes = max_response_bytes
+        self.responses = collections.OrderedDict()
+        self.size = 0
+        self.in_flight = {}
+        self.hits = 0
+        self.lock = threading.Lock()
+
+    def is_kept(self, response):
+        """Returns whether a finished response is kept: a small one without pagination links."""
+        return len(response.content) <= self.max_response_bytes and not response.links
+
+    def get_or_fetch(self, key, fetch):
+        """
+        Returns the response of a key, fetching it only if nobody is fetching it or has kept it.
+
+        :param key: URL with query parameters.
+        :param fetch: Function that requests the response.
+        :return: Response shared by the callers of the key.
+        """
+        with self.lock:
+            if key in self.responses:
+                self.responses.move_to_end(key)
+                self.hits += 1
+                return self.responses[key]
+
+            future = self.in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self.in_flight[key] = future
+            else:
+                self.hits += 1
+
+        if not leader:
+            # Wait for the request of another caller
+            return future.result()
+
+        try:
+            response = fetch()
+        except Exception as e:
+            with self.lock:
+                del self.in_flight[key]
+            future.set_exception(e)
+            raise
+
+        kept = self.is_kept(response)
+        with self.lock:
+            del self.in_flight[key]
+            if kept:
+                self.responses[key] = response
+                self.size += len(response.content)
+                while self.size > self.max_bytes:
+                    _, dropped = self.responses.popitem(last=False)
+                    self.size -= len(dropped.content)
+
+        future.set_result(response)
+        return response
+
+    def clear(self):
+        """Drops the kept responses."""
+        with self.lock:
+            self.responses.clear()
+            self.size = 0
@@ -0,0 +1,334 @@
+import bisect
+import datetime
+import hashlib
+import json
+import os
+import re
+import threading
+import urllib.parse
+
+##############################################################################
+# Constants
+# Upper bounds of the buckets of the latency histogram in seconds
+LATENCY_BUCKETS = [0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30]
+# Directory of the Prometheus textfiles, e.g., the directory of the textfile collector of the node exporter
+DEFAULT_METRICS_TEXTFILE_DIRECTORY = "results"
+# Top-level paths of the API, anything before them is the base path, e.g., /api/v3 of GitHub Enterprise Server
+ENDPOINT_PATTERN = re.compile(r"/(?:repos|orgs|users|search|graphql)(?:/.*)?$")
+REPO_PATH_PATTERN = re.compile(r"^/repos/([^/]+)/([^/]+)(/.*)?$")
+SEARCH_REPO_PATTERN = re.compile(r"\brepo:(\S+)")
+SHA_PATTERN = re.compile(r"^[0-9a-f]{40}$")
+
+
+def get_endpoint_and_repo(url, params=None):
+    """
+    Returns the endpoint template and the repository of a request.
+
+    e.g., https://api.github.com/repos/cloud-barista/cb-spider/commits?page=2
+          -> ("/repos/{owner}/{repo}/commits", "cloud-barista/cb-spider")
+          https://api.github.com/search/issues?q=repo:cloud-barista/cb-spider is:pr
+          -> ("/search/issues", "cloud-barista/cb-spider")
+
+    :param url: URL of the request.
+    :param params: Dictionary of query parameters (optional).
+    :return: Tuple of the endpoint template and the full name of the repository, "" if none.
+    """
+    parsed_url = urllib.parse.urlparse(url)
+    match = ENDPOINT_PATTERN.search(parsed_url.path)
+    path = match.group(0) if match else parsed_url.path
+
+    repo = ""
+    repo_match = REPO_PATH_PATTERN.match(path)
+    if repo_match:
+        repo = f"{repo_match.group(1)}/{repo_match.group(2)}"
+        path = "/repos/{owner}/{repo}" + (repo_match.group(3) or "")
+    elif path.startswith("/search/"):
+        query = (params or {}).get("q") or urllib.parse.parse_qs(parsed_url.query).get("q", [""])[0]
+        search_match = SEARCH_REPO_PATTERN.search(query)
+        if search_match:
+            repo = search_match.group(1)
+
+    segments = path.split("/")
+    if len(segments) > 2 and segments[1] in ["users", "orgs"]:
+        segments[2] = "{username}" if segments[1] == "users" else "{org}"
+    for index, segment in enumerate(segments):
+        if segment.isdigit():
+            segments[index] = "{number}"
+        elif SHA_PATTERN.match(segment):
+            segments[index] = "{sha}"
+
+    return "/".join(segments), repo
+
+
+class EndpointMetrics:
+    """Metrics of the requests of an endpoint template and a repository."""
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.statuses = {}
+        self.seconds = 0.0
+        # Counts of the latency buckets, the last one is over the largest bound
+        self.latency_buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.response_bytes = 0
+        self.cache_hits = 0
+        self.retries = 0
+
+    def to_dict(self):
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "statuses": self.statuses,
+            "seconds": round(self.seconds, 6),
+            "latency_buckets": dict(zip([str(bound) for bound in LATENCY_BUCKETS] + ["+Inf"], self.latency_buckets)),
+            "response_bytes": self.response_bytes,
+            "cache_hits": self.cache_hits,
+            "retries": self.retries,
+        }
+
+
+class QuotaMetrics:
+    """
+    Rate limit quota of an access token and a resource, read from the X-RateLimit-* headers of the responses.
+
+    The quota used is the growth of X-RateLimit-Used (limit - remaining if it is missing) in each window
+    of the rate limit, so a GraphQL query costs its points, and a 304 Not Modified response costs nothing.
+    The first response of a window is counted as one, since the used quota before it is not known.
+    Other clients of the same token in the window are counted as well.
+    """
+
+    def __init__(self):
+        # Lowest and highest used quota seen per reset time of a window
+        self.windows = {}
+        self.limit = 0
+        self.remaining = None
+        self.reset = 0
+
+    def update(self, limit, remaining, used, reset):
+        lowest, highest = self.windows.get(reset, (used, used))
+        self.windows[reset] = (min(lowest, used), max(highest, used))
+
+        # The remaining quota of the latest window, the lowest seen as the responses may arrive out of order
+        if reset > self.reset or self.remaining is None:
+            self.remaining = remaining
+        elif reset == self.reset:
+            self.remaining = min(self.remaining, remaining)
+        self.reset = max(self.reset, reset)
+        self.limit = limit
+
+    @property
+    def used(self):
+        return sum(highest - lowest + 1 for lowest, highest in self.windows.values())
+
+    def to_dict(self):
+        return {"limit": self.limit, "remaining": self.remaining, "reset": self.reset, "quota_used": self.used}
+
+
+def get_token_label(token):
+    """Returns a label of an access token that does not reveal it, e.g., "token-1a2b3c4d"."""
+    if token is None:
+        return "anonymous"
+    return "token-" + hashlib.sha256(token.encode()).hexdigest()[:8]
+
+
+class RequestMetrics:
+    """
+    Metrics of the requests of a run per endpoint template and repository.
+
+    The request count, latency histogram, response bytes, cache hits and retries are collected,
+    with the rate limit quota used and remaining per access token and resource, see QuotaMetrics.
+    They are exported as JSON, and as a Prometheus textfile for the textfile collector of the node exporter.
+    """
+
+    def __init__(self):
+        self.endpoints = {}
+        # Quota per (token label, resource), e.g., ("token-1a2b3c4d", "core")
+        self.quotas = {}
+        self.started_at = datetime.datetime.now(datetime.timezone.utc)
+        self.lock = threading.Lock()
+
+    def _get(self, url, params):
+        key = get_endpoint_and_repo(url, params)
+        metrics = self.endpoints.get(key)
+        if metrics is None:
+            metrics = self.endpoints[key] = EndpointMetrics()
+        return metrics
+
+    def record_request(self, url, params, response, seconds, retries, replayed=False, token=None):
+        """
+        Records a request answered by the API.
+
+        :param url: URL of the request.
+        :param params: Dictionary of query parameters, or None.
+        :param response: Final response of the request.
+        :param seconds: Seconds from the first attempt until the final response, including retries.
+        :param retries: Number of retries of the request.
+        :param replayed: True if the response is replayed from a cassette, which uses no quota (optional).
+        :param token: Access token the final response was received with, None if unauthenticated (optional).
+        """
+        status = str(response.status_code)
+        size = len(response.content)
+        headers = response.headers
+
+        with self.lock:
+            metrics = self._get(url, params)
+            metrics.requests += 1
+            metrics.statuses[status] = metrics.statuses.get(status, 0) + 1
+            metrics.seconds += seconds
+            metrics.latency_buckets[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+            metrics.response_bytes += size
+            metrics.retries += retries
+            if replayed:
+                return
+
+            resource = headers.get("X-RateLimit-Resource")
+            remaining = headers.get("X-RateLimit-Remaining")
+            if resource and remaining is not None:
+                limit = int(headers.get("X-RateLimit-Limit", 0))
+                used = headers.get("X-RateLimit-Used")
+                used = int(used) if used is not None else limit - int(remaining)
+
+                key = (get_token_label(token), resource)
+                quota = self.quotas.get(key)
+                if quota is None:
+                    quota = self.quotas[key] = QuotaMetrics()
+                quota.update(limit, int(remaining), used, int(headers.get("X-RateLimit-Reset", 0)))
+
+    def record_error(self, url, params, seconds, retries):
+        """Records a request failed without a response, e.g., by a network error."""
+        with self.lock:
+            metrics = self._get(url, params)
+            metrics.requests += 1
+            metrics.errors += 1
+            metrics.seconds += seconds
+            metrics.latency_buckets[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+            metrics.retries += retries
+
+    def record_cache_hit(self, url, params=None):
+        """Records a response served by a cache, e.g., the HTTP cache on 304 Not Modified or the in-run memo."""
+        with self.lock:
+            self._get(url, params).cache_hits += 1
+
+    def to_dict(self):
+        with self.lock:
+            endpoints = [
+                dict(endpoint=endpoint, repo=repo, **metrics.to_dict())
+                for (endpoint, repo), metrics in sorted(self.endpoints.items())
+            ]
+            rate_limits = [
+                dict(token=token, resource=resource, **quota.to_dict())
+                for (token, resource), quota in sorted(self.quotas.items())
+            ]
+
+        return {
+            "started_at": self.started_at.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "finished_at": datetime.datetime.now(datetime.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "latency_buckets": LATENCY_BUCKETS,
+            "rate_limits": rate_limits,
+            "endpoints": endpoints,
+        }
+
+    def write_json(self, path):
+        """Writes the metrics to a JSON file."""
+        with open(path, "w") as json_file:
+            json.dump(self.to_dict(), json_file, indent=2)
+
+    def write_prometheus(self, path, job):
+        """
+        Writes the metrics in the Prometheus text format.
+
+        The counters are labeled by endpoint and repository, and the latency histogram by endpoint,
+        which keeps the number of series small for thousands of repositories.
+        The file is replaced at once, so the collector never reads a partial file.
+
+        :param path: Path of the textfile, e.g., in the directory of the textfile collector.
+        :param job: Value of the "job" label, e.g., the name of the script.
+        """
+        with self.lock:
+            endpoints = sorted(self.endpoints.items())
+            quotas = [(key, quota.to_dict()) for key, quota in sorted(self.quotas.items())]
+
+        def labels(**values):
+            values = dict(job=job, **values)
+            return ",".join(f'{name}="{escape_label(value)}"' for name, value in values.items())
+
+        lines = []
+        counters = [
+            ("github_api_requests_total", "Requests sent to the GitHub API.", "requests"),
+            ("github_api_request_errors_total", "Requests failed without a response.", "errors"),
+            ("github_api_response_bytes_total", "Bytes of the response bodies.", "response_bytes"),
+            ("github_api_cache_hits_total", "Responses served by a cache.", "cache_hits"),
+            ("github_api_retries_total", "Retries of the requests.", "retries"),
+        ]
+        for name, help_text, attribute in counters:
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+            for (endpoint, repo), metrics in endpoints:
+                lines.append(f"{name}{{{labels(endpoint=endpoint, repo=repo)}}} {getattr(metrics, attribute)}")
+
+        # The histogram per endpoint, summed over the repositories
+        histograms = {}
+        for (endpoint, _), metrics in endpoints:
+            buckets, seconds = histograms.get(endpoint, ([0] * len(metrics.latency_buckets), 0.0))
+            buckets = [total + count for total, count in zip(buckets, metrics.latency_buckets)]
+            histograms[endpoint] = (buckets, seconds + metrics.seconds)
+
+        name = "github_api_request_duration_seconds"
+        lines += [f"# HELP {name} Latency of the requests including retries.", f"# TYPE {name} histogram"]
+        for endpoint, (buckets, seconds) in histograms.items():
+            cumulative = 0
+            for bound, count in zip([str(bound) for bound in LATENCY_BUCKETS] + ["+Inf"], buckets):
+                cumulative += count
+                lines.append(f"{name}_bucket{{{labels(endpoint=endpoint, le=bound)}}} {cumulative}")
+            lines.append(f"{name}_sum{{{labels(endpoint=endpoint)}}} {seconds:.6f}")
+            lines.append(f"{name}_count{{{labels(endpoint=endpoint)}}} {cumulative}")
+
+        quota_series = [
+            ("github_api_quota_used_total", "counter", "Rate limit quota used in the run.", "quota_used"),
+            ("github_api_rate_limit_limit", "gauge", "Rate limit quota per window.", "limit"),
+            ("github_api_rate_limit_remaining", "gauge", "Remaining quota of the latest window.", "remaining"),
+            ("github_api_rate_limit_reset_timestamp_seconds", "gauge", "Reset time of the rate limit.", "reset"),
+        ]
+        for name, metric_type, help_text, field in quota_series:
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {metric_type}"]
+            for (token, resource), quota in quotas:
+                lines.append(f"{name}{{{labels(resource=resource, token=token)}}} {quota[field]}")
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temporary_path = path + ".tmp"
+        with open(temporary_path, "w") as textfile:
+            textfile.write("\n".join(lines) + "\n")
+        os.replace(temporary_path, path)
+
+
+def escape_label(value):
+    """Escapes a label value of the Prometheus text format."""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def save_request_metrics(metrics, org_name, job, textfile_directory=DEFAULT_METRICS_TEXTFILE_DIRECTORY):
+    """
+    Saves the metrics of a run as a JSON file in results and as a Prometheus textfile.
+
+    The textfile of a script, e.g., github-api-metrics-orgs.prom, is replaced by its next run.
+
+    :param metrics: RequestMetrics of the run.
+    :param org_name: Name of the organization, used in the name of the JSON file.
+    :param job: Name of the script, the "job" label and a part of the file names.
+    :param textfile_directory: Directory of the Prometheus textfile (optional).
+    :return: Tuple of the paths of the JSON file and the textfile.
+    """
+    json_path = (
+        "./results/("
+        + org_name
+        + ")request-metrics-"
+        + job
+        + "-"
+        + datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+        + ".json"
+    )
+    textfile_path = os.path.join(textfile_directory, f"github-api-metrics-{job}.prom")
+    metrics.write_json(json_path)
+    metrics.write_prometheus(textfile_path, job)
+    return json_path, textfile_path
@@ -0,0 +1,95 @@
+import csv
+import logging
+
+##############################################################################
+# Logging
+
+# Handlers are attached by the entry scripts
+logger = logging.getLogger("my_logger")
+
+
+class StatisticsTable:
+    """
+    Rows of statistics gathered column by column.
+
+    Appending a row only appends its values to a list per column,
+    and the columns are turned into a DataFrame, CSV or Parquet at once.
+    The first columns are labels (e.g., repository name and link),
+    and the rest are numbers, which are summed up for the Sum row.
+    """
+
+    def __init__(self, headers, label_columns=2):
+        """
+        :param headers: List of the column headers.
+        :param label_columns: Number of the leading label columns (optional).
+        """
+        self.headers = list(headers)
+        self.label_columns = label_columns
+        self.columns = [[] for _ in self.headers]
+
+    def __len__(self):
+        return len(self.columns[0])
+
+    def append(self, row):
+        """Appends a row, a list of values in the order of the headers."""
+        for column, value in zip(self.columns, row):
+            column.append(value)
+
+    def get_rows(self):
+        """Returns the rows as lists."""
+        return [list(row) for row in zip(*self.columns)]
+
+    def get_sum_row(self):
+        """
+        Returns the Sum row, e.g., ["Sum", "-", sum of column 2, sum of column 3, ...].
+
+        The number columns are summed up at once as a 2-D array.
+        """
+        import numpy as np
+
+        sum_row = ["Sum"] + ["-"] * (self.label_columns - 1)
+
+        number_columns = np.array(self.columns[self.label_columns :], dtype=np.int64).reshape(
+            len(self.headers) - self.label_columns, len(self)
+        )
+        sum_row.extend(number_columns.sum(axis=1).tolist())
+
+        return sum_row
+
+    def to_dataframe(self):
+        """Returns the rows as a DataFrame, without the Sum row."""
+        import pandas as pd
+
+        return pd.DataFrame(dict(zip(self.headers, self.columns)), columns=self.headers)
+
+    def write_csv(self, path, with_sum=True):
+        """
+        Writes the header, the rows and the Sum row to a CSV file.
+
+        :param path: Path of the CSV file.
+        :param with_sum: Write the Sum row at the end (optional).
+        """
+        with open(path, "w", newline="") as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(self.headers)
+            writer.writerows(zip(*self.columns))
+            if with_sum:
+                writer.writerow(self.get_sum_row())
+
+    def write_parquet(self, path):
+        """
+        Writes the rows to a Parquet file, without the Sum row.
+
+        Parquet needs pyarrow (or fastparquet), which is optional.
+        If it is not installed, nothing is written.
+
+        :param path: Path of the Parquet file.
+        :return: True if the file is written, otherwise False.
+        """
+        try:
+            self.to_dataframe().to_parquet(path, index=False)
+        except ImportError as e:
+            logger.warning("Skip writing %s: %s" % (path, e))
+            return False
+
+        return True
@@ -0,0 +1,211 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+
+##############################################################################
+# Constants
+DEFAULT_USER_CACHE_PATH = os.path.join(".cache", "users.sqlite")
+# Profiles rarely change, so they are used without a request for a week
+DEFAULT_USER_CACHE_TTL_HOURS = 24 * 7
+# Failed lookups are not retried for a while, e.g., a deleted account
+DEFAULT_USER_CACHE_NEGATIVE_TTL_MINUTES = 10
+DEFAULT_USER_CACHE_MAX_ENTRIES = 10000
+# Fields of a profile kept in the cache
+PROFILE_FIELDS = ["login", "name", "email", "type"]
+
+
+class CachedUser:
+    """A profile or a failed lookup of a user stored in the cache."""
+
+    def __init__(self, login, profile, etag, last_modified, error, fetched_at):
+        self.login = login
+        self.profile = profile
+        self.etag = etag
+        self.last_modified = last_modified
+        # Error of the lookup, None if the profile was fetched
+        self.error = error
+        self.fetched_at = fetched_at
+
+    @property
+    def failed(self):
+        return self.error is not None
+
+    def conditional_headers(self):
+        """
+        Returns the headers of a conditional request to revalidate this profile.
+
+        A 304 Not Modified response to it does not count against the rate limit.
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class UserCache:
+    """
+    Persistent cache of user profiles of the GitHub API, stored in SQLite.
+
+    A profile is used without a request until its TTL expires,
+    then it is revalidated by a conditional request.
+    A failed lookup is stored as well, and is not retried until its shorter TTL expires.
+    When the number of users exceeds the limit, the least recently used ones are evicted.
+    """
+
+    def __init__(
+        self,
+        path=DEFAULT_USER_CACHE_PATH,
+        ttl_hours=DEFAULT_USER_CACHE_TTL_HOURS,
+        negative_ttl_minutes=DEFAULT_USER_CACHE_NEGATIVE_TTL_MINUTES,
+        max_entries=DEFAULT_USER_CACHE_MAX_ENTRIES,
+    ):
+        """
+        :param path: Path of the SQLite database file.
+        :param ttl_hours: Hours a profile is used without a request.
+        :param negative_ttl_minutes: Minutes a failed lookup is not retried.
+        :param max_entries: Maximum number of users in the cache.
+        """
+        self.path = path
+        self.ttl = ttl_hours * 60 * 60
+        self.negative_ttl = negative_ttl_minutes * 60
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS users ("
+            "login TEXT PRIMARY KEY, profile TEXT, etag TEXT, last_modified TEXT, error TEXT, "
+            "fetched_at REAL, accessed_at REAL)"
+        )
+        self.connection.execute("CREATE INDEX IF NOT EXISTS users_accessed_at ON users (accessed_at)")
+        self.connection.commit()
+
+        self.entries = self.connection.execute("SELECT COUNT(*) FROM users").fetchone()[0]
+
+    def get(self, login):
+        """
+        Returns the cached profile or failed lookup of a user.
+
+        :param login: Login of a user.
+        :return: CachedUser, or None if the user is not cached.
+        """
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT profile, etag, last_modified, error, fetched_at FROM users WHERE login = ?", (login,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            self.connection.execute("UPDATE users SET accessed_at = ? WHERE login = ?", (time.time(), login))
+            self.connection.commit()
+
+        profile, etag, last_modified, error, fetched_at = row
+        profile = json.loads(profile) if profile else None
+        return CachedUser(login, profile, etag, last_modified, error, fetched_at)
+
+    def is_fresh(self, cached_user):
+        """Returns True if a cached profile or failed lookup is within its TTL."""
+        ttl = self.negative_ttl if cached_user.failed else self.ttl
+        return time.time() - cached_user.fetched_at < ttl
+
+    def put(self, login, profile, etag=None, last_modified=None):
+        """
+        Stores the profile of a user.
+
+        :param login: Login of a user.
+        :param profile: Dictionary of the user from the users endpoint.
+        :param etag: ETag of the response (optional).
+        :param last_modified: Last-Modified of the response (optional).
+        """
+        profile = {field: profile.get(field) for field in PROFILE_FIELDS}
+        self._store(login, json.dumps(profile), etag, last_modified, None)
+
+    def put_failure(self, login, error):
+        """
+        Stores a failed lookup of a user.
+
+        :param login: Login of a user.
+        :param error: Message of the error.
+        """
+        self._store(login, None, None, None, error)
+
+    def touch(self, login):
+        """Restarts the TTL of a profile revalidated by a 304 Not Modified response."""
+        with self.lock:
+            now = time.time()
+            self.connection.execute(
+                "UPDATE users SET fetched_at = ?, accessed_at = ? WHERE login = ?", (now, now, login)
+            )
+            self.connection.commit()
+
+    def _store(self, login, profile, etag, last_modified, error):
+        with self.lock:
+            row = self.connection.execute("SELECT 1 FROM users WHERE login = ?", (login,)).fetchone()
+            if row is None:
+                self.entries += 1
+
+            now = time.time()
+            self.connection.execute(
+                "INSERT OR REPLACE INTO users VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (login, profile, etag, last_modified, error, now, now),
+            )
+
+            self._evict()
+            self.connection.commit()
+
+    def _evict(self):
+        """Evicts the least recently used users until the number of users is within the limit."""
+        if self.entries <= self.max_entries:
+            return
+
+        excess = self.entries - self.max_entries
+        self.connection.execute(
+            "DELETE FROM users WHERE login IN (SELECT login FROM users ORDER BY accessed_at LIMIT ?)", (excess,)
+        )
+        self.entries -= excess
+
+    def clear(self):
+        """Removes all the cached users."""
+        with self.lock:
+            self.connection.execute("DELETE FROM users")
+            self.connection.commit()
+            self.entries = 0
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
+
+
+def open_user_cache(args, config):
+    """
+    Opens the cache according to the command line switches of the HTTP cache and config.json.
+
+    :param args: Parsed arguments with the switches of http_cache.add_cache_arguments().
+    :param config: Dictionary of config.json, "user-cache-path", "user-cache-ttl-hours",
+                   "user-cache-negative-ttl-minutes" and "user-cache-max-entries" are optional.
+    :return: UserCache, or None if the cache is bypassed.
+    """
+    path = config.get("user-cache-path", DEFAULT_USER_CACHE_PATH)
+
+    if args.clear_cache and os.path.exists(path):
+        cache = UserCache(path)
+        cache.clear()
+        cache.close()
+
+    if args.no_cache:
+        return None
+
+    return UserCache(
+        path,
+        config.get("user-cache-ttl-hours", DEFAULT_USER_CACHE_TTL_HOURS),
+        config.get("user-cache-negative-ttl-minutes", DEFAULT_USER_CACHE_NEGATIVE_TTL_MINUTES),
+        config.get("user-cache-max-entries", DEFAULT_USER_CACHE_MAX_ENTRIES),
+    )
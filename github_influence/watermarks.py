@@ -0,0 +1,125 @@
+import datetime
+import json
+import os
+import threading
+
+##############################################################################
+# Constants
+DEFAULT_WATERMARKS_DIRECTORY = ".cache"
+# Format of a watermark, which is compared as a string with GitHub timestamps
+WATERMARK_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+# Days before a watermark scanned again, since a commit can be pushed later with an older date, e.g., a merged branch
+DEFAULT_OVERLAP_DAYS = 7
+
+
+def subtract_days(watermark, days):
+    """
+    Returns a timestamp days before a watermark, e.g., the start of an overlap window.
+
+    e.g., ("2023-06-08T09:00:00Z", 7) -> "2023-06-01T09:00:00Z"
+    """
+    moment = datetime.datetime.strptime(watermark, WATERMARK_FORMAT) - datetime.timedelta(days=days)
+    return moment.strftime(WATERMARK_FORMAT)
+
+
+class WatermarkStore:
+    """
+    Counts of repositories and metrics with the timestamps they were computed up to.
+
+    The counts are stored in a JSON file for a collection window.
+    If the window changes, e.g., a different 'since', the stored counts are discarded.
+
+    e.g., {
+        "window": {"since": "2023-01-01", "until": "2023-12-31", "issues-backend": "rest"},
+        "repos": {
+            "cloud-barista/cb-spider": {
+                "commits": {"count": 2, "watermark": "2023-06-01T09:00:00Z", "numbers": ["0a1b...", "9f8e..."]},
+                "issues": {"count": 2, "watermark": "2023-06-01T09:00:00Z", "numbers": [12, 15]}
+            }
+        }
+    }
+
+    The numbers of the counted items, or the SHAs of commits, are stored for a metric whose items can be
+    seen again, e.g., an issue closed, reopened and closed again, or a commit in an overlap window scanned again,
+    so an item is counted once.
+    """
+
+    def __init__(self, path, window, reset=False):
+        """
+        :param path: Path of the JSON file.
+        :param window: Dictionary of the collection window, e.g., since and until.
+        :param reset: Discard the stored counts, so everything is counted again (optional).
+        """
+        self.path = path
+        self.window = window
+        self.repos = {}
+        self.lock = threading.Lock()
+
+        if not reset and os.path.exists(path):
+            with open(path) as state_file:
+                state = json.load(state_file)
+
+            if state.get("window") == window:
+                self.repos = state.get("repos", {})
+
+    def get(self, full_name, metric):
+        """
+        Returns the stored count of a metric of a repository.
+
+        :param full_name: Full name of a repository.
+        :param metric: Name of the metric, e.g., "commits".
+        :return: Tuple of count and watermark, or None if not stored.
+        """
+        with self.lock:
+            stored = self.repos.get(full_name, {}).get(metric)
+
+        if stored is None:
+            return None
+        return stored["count"], stored["watermark"]
+
+    def get_numbers(self, full_name, metric):
+        """
+        Returns the numbers of the items counted for a metric of a repository.
+
+        :param full_name: Full name of a repository.
+        :param metric: Name of the metric, e.g., "issues".
+        :return: Tuple of the set of numbers and watermark, or None if not stored.
+        """
+        with self.lock:
+            stored = self.repos.get(full_name, {}).get(metric)
+
+        if stored is None or "numbers" not in stored:
+            return None
+        return set(stored["numbers"]), stored["watermark"]
+
+    def set(self, full_name, metric, count, watermark, numbers=None):
+        """
+        Stores the count of a metric of a repository computed up to the watermark.
+
+        :param full_name: Full name of a repository.
+        :param metric: Name of the metric, e.g., "commits".
+        :param count: Count of the metric.
+        :param watermark: Timestamp the count was computed up to, in WATERMARK_FORMAT.
+        :param numbers: Numbers of the counted items, e.g., of issues, or SHAs of commits (optional).
+        """
+        stored = {"count": count, "watermark": watermark}
+        if numbers is not None:
+            stored["numbers"] = sorted(numbers)
+
+        with self.lock:
+            self.repos.setdefault(full_name, {})[metric] = stored
+
+    def save(self):
+        """Writes the stored counts to the JSON file."""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self.lock:
+            state = {"window": self.window, "repos": self.repos}
+
+        # Write to a temporary file first not to corrupt the state on failure
+        temporary_path = self.path + ".tmp"
+        with open(temporary_path, "w") as state_file:
+            json.dump(state, state_file, indent=2)
+        os.replace(temporary_path, self.path)
@@ -0,0 +1,39 @@
+import threading
+
+import pytest
+
+from benchmarks.github_emulator import SyntheticOrg, create_server
+from github_influence import github_api
+from github_influence.rate_limit import RateLimitScheduler
+from github_influence.request_memo import RequestMemo
+
+
+@pytest.fixture
+def emulator(monkeypatch):
+    """
+    Returns a function serving a synthetic organization by the GitHub API emulator,
+    with the requests of github_api sent to it and no cache, cassette or metrics.
+    The function returns the server, whose handler has the "org" and the "state" of the requests.
+    """
+    servers = []
+
+    def serve(rate_limit=5000, rate_limit_window=3600, **org_options):
+        org = SyntheticOrg(**org_options)
+        server = create_server(org, rate_limit=rate_limit, rate_limit_window=rate_limit_window)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+
+        monkeypatch.setattr(github_api, "api_url", f"http://127.0.0.1:{server.server_port}")
+        # The emulator does not limit the pace
+        monkeypatch.setattr(github_api, "rate_limit_scheduler", RateLimitScheduler(10000, 10000))
+        monkeypatch.setattr(github_api, "request_memo", RequestMemo())
+        monkeypatch.setattr(github_api, "http_cache", None)
+        monkeypatch.setattr(github_api, "cassette", None)
+        monkeypatch.setattr(github_api, "request_metrics", None)
+        return server
+
+    yield serve
+
+    for server in servers:
+        server.shutdown()
+        server.server_close()
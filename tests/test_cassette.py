@@ -0,0 +1,35 @@
+import requests
+
+from github_influence import github_api
+from github_influence.cassette import MODE_RECORD, MODE_REPLAY, Cassette, get_interaction_key
+from github_influence.rate_limit import RateLimitScheduler
+from github_influence.request_metrics import RequestMetrics
+
+
+def test_replayed_search_is_not_limited_and_uses_no_quota(tmp_path, monkeypatch):
+    path = str(tmp_path / "run.jsonl.gz")
+    query = "repo:org/repo is:pr is:closed"
+    response = requests.models.Response()
+    response.status_code = 200
+    response.url = github_api.SEARCH_ISSUES_API_URL
+    response.headers["X-RateLimit-Resource"] = "search"
+    response.headers["X-RateLimit-Remaining"] = "29"
+    response._content = b'{"total_count": 7, "incomplete_results": false, "items": []}'
+
+    key = get_interaction_key("GET", github_api.SEARCH_ISSUES_API_URL, {"q": query, "per_page": "1"})
+    recording = Cassette(path, MODE_RECORD)
+    recording.record(key, response)
+    recording.close()
+
+    metrics = RequestMetrics()
+    monkeypatch.setattr(github_api, "api_url", github_api.GITHUB_API_URL)
+    monkeypatch.setattr(github_api, "cassette", Cassette(path, MODE_REPLAY))
+    monkeypatch.setattr(github_api, "request_metrics", metrics)
+    monkeypatch.setattr(github_api, "request_memo", None)
+    monkeypatch.setattr(github_api, "http_cache", None)
+    # A second search request would wait for a minute
+    monkeypatch.setattr(github_api, "rate_limit_scheduler", RateLimitScheduler(search_requests_per_minute=1))
+
+    assert [github_api.search_issues_count(query) for _ in range(3)] == [7, 7, 7]
+    assert [endpoint["requests"] for endpoint in metrics.to_dict()["endpoints"]] == [3]
+    assert metrics.quotas == {}
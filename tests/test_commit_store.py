@@ -0,0 +1,89 @@
+import datetime
+
+from github_influence import orgs
+from github_influence.commit_store import CommitStore
+
+REPO = "emulated-org/repo-00000"
+
+
+def make_commit(sha, date):
+    return {
+        "sha": sha,
+        "author": {"login": "user"},
+        "commit": {"author": {"date": date}, "committer": {"date": date}},
+    }
+
+
+def test_coverage_is_merged_with_overlapping_and_adjacent_periods(tmp_path):
+    store = CommitStore(str(tmp_path / "commits.sqlite"))
+
+    store.add_commits(REPO, [], "2023-03-01", "2023-06-01")
+    # Overlapping
+    store.add_commits(REPO, [], "2023-05-01", "2023-07-01")
+    assert store.get_coverage(REPO) == ("2023-03-01T00:00:00Z", "2023-07-01T00:00:00Z")
+    # Adjacent at both ends
+    store.add_commits(REPO, [], "2023-07-01", "2023-08-01")
+    store.add_commits(REPO, [], "2023-02-01", "2023-03-01")
+    assert store.get_coverage(REPO) == ("2023-02-01T00:00:00Z", "2023-08-01T00:00:00Z")
+    # Within the stored period
+    store.add_commits(REPO, [], "2023-04-01", "2023-05-01")
+    assert store.get_coverage(REPO) == ("2023-02-01T00:00:00Z", "2023-08-01T00:00:00Z")
+
+    # A gap in between is not stored, so the new period replaces the stored one
+    store.add_commits(REPO, [], "2023-09-01", "2023-10-01")
+    assert store.get_coverage(REPO) == ("2023-09-01T00:00:00Z", "2023-10-01T00:00:00Z")
+    store.close()
+
+
+def test_count_commits_includes_both_ends(tmp_path):
+    store = CommitStore(str(tmp_path / "commits.sqlite"))
+    commits = [
+        make_commit("a", "2023-06-30T23:59:59Z"),
+        make_commit("b", "2023-07-01T00:00:00Z"),
+        make_commit("c", "2023-09-30T00:00:00Z"),
+        make_commit("d", "2023-09-30T00:00:01Z"),
+    ]
+    store.add_commits(REPO, commits, "2023-06-01", "2023-10-01")
+    # The same commit fetched again is stored once
+    store.add_commits(REPO, commits[:2], "2023-06-01", "2023-07-01")
+
+    # A date is its midnight, the same as the 'since' and 'until' parameters of the API
+    assert store.count_commits(REPO, "2023-07-01", "2023-09-30") == 2
+    assert store.count_commits(REPO, "2023-07-01T00:00:00Z", "2023-09-30T00:00:01Z") == 3
+    assert store.count_commits(REPO, "2023-07-01T00:00:01Z", "2023-09-29T23:59:59Z") == 0
+    assert store.count_commits(REPO, "2023-06-01", "2023-10-01") == 4
+    assert store.get_commit_dates(REPO, "2023-07-01", "2023-09-30") == ["2023-07-01T00:00:00Z", "2023-09-30T00:00:00Z"]
+    store.close()
+
+
+def test_store_fetches_the_overlap_again(emulator, tmp_path, monkeypatch):
+    server = emulator(repos=1, commits=365)
+    org = server.RequestHandlerClass.org
+    commits_url = orgs.REPOS_API_URL + REPO + "/commits"
+    store = CommitStore(str(tmp_path / "commits.sqlite"))
+    monkeypatch.setattr(orgs, "commit_store", store)
+    monkeypatch.setattr(orgs, "overlap_days", 7)
+    fetches = []
+    iter_projected_items = orgs.iter_projected_items
+
+    def iter_fetched_items(url, fields, params=None, page_workers=None):
+        fetches.append((params["since"], params["until"]))
+        return iter_projected_items(url, fields, params, page_workers)
+
+    monkeypatch.setattr(orgs, "iter_projected_items", iter_fetched_items)
+
+    first = orgs.count_commits_from_store(REPO, datetime.date(2023, 1, 1), datetime.date(2023, 12, 31))
+    # Commits pushed later, dated within the overlap of the stored period and before it
+    org.push_commits(0, ["2023-12-28T12:00:00Z", "2023-06-15T12:00:00Z"])
+    second = orgs.count_commits_from_store(REPO, datetime.date(2023, 1, 1), datetime.date(2023, 12, 31))
+    # A period before the overlap is answered from the store
+    third_quarter = orgs.count_commits_from_store(REPO, datetime.date(2023, 7, 1), datetime.date(2023, 9, 30))
+
+    full_rescan = orgs.get_commits_during_the_period(commits_url, "2023-01-01", "2023-12-31")
+    assert fetches == [
+        ("2023-01-01T00:00:00Z", "2023-12-31T00:00:00Z"),
+        ("2023-12-24T00:00:00Z", "2023-12-31T00:00:00Z"),
+    ]
+    assert second == first + 1 == full_rescan - 1
+    assert third_quarter == orgs.get_commits_during_the_period(commits_url, "2023-07-01", "2023-09-30")
+    store.close()
@@ -0,0 +1,72 @@
+import json
+import re
+import time
+
+import requests
+
+from github_influence import count_unique_contributors, github_api
+from github_influence.cassette import MODE_RECORD, MODE_REPLAY, Cassette
+from github_influence.request_memo import RequestMemo
+
+
+def make_response(payload):
+    response = requests.models.Response()
+    response.status_code = 200
+    response._content = json.dumps(payload).encode()
+    return response
+
+
+def test_pipelined_run_equals_the_sequential_run(emulator, monkeypatch):
+    emulator(repos=6, contributors_per_repo=15, users=40)
+    monkeypatch.setattr(count_unique_contributors, "user_cache", None)
+    monkeypatch.setattr(count_unique_contributors, "users_backend", count_unique_contributors.USERS_BACKEND_REST)
+    repositories = [f"repo-{index:05d}" for index in range(6)]
+
+    sequential = count_unique_contributors.collect_unique_contributors("emulated-org", repositories)
+    pipelined = count_unique_contributors.collect_unique_contributors_pipelined("emulated-org", repositories, 4)
+
+    unique_contributors, repo_contributor_counts, failed_users = sequential
+    assert len(unique_contributors) > 15
+    assert repo_contributor_counts == {repo_name: 15 for repo_name in repositories}
+    assert pipelined == sequential
+    assert list(pipelined[0]) == list(unique_contributors)
+
+
+def test_pipelined_graphql_run_is_replayed(emulator, tmp_path, monkeypatch):
+    emulator(repos=6, contributors_per_repo=15, users=40)
+    monkeypatch.setattr(count_unique_contributors, "user_cache", None)
+    monkeypatch.setattr(count_unique_contributors, "users_backend", count_unique_contributors.USERS_BACKEND_GRAPHQL)
+    repositories = [f"repo-{index:05d}" for index in range(6)]
+    request = github_api.gh_session.request
+
+    def send_live(method, url, **kwargs):
+        if method == "POST":
+            # The emulator serves REST only, so answer the GraphQL query of the users here
+            data = {}
+            for alias, login in re.findall(r'(user\d+): user\(login: "([^"]+)"\)', kwargs["json"]["query"]):
+                data[alias] = {"login": login, "name": f"Name of {login}", "email": ""}
+            return make_response({"data": data})
+        # The later repositories arrive first in the recorded run
+        match = re.search(r"repo-(\d+)/contributors", url)
+        if match:
+            time.sleep(0.05 * (len(repositories) - int(match.group(1))))
+        return request(method, url, **kwargs)
+
+    def send_offline(method, url, **kwargs):
+        raise Exception(f"Not replayed: {method} {url}")
+
+    path = str(tmp_path / "run.jsonl.gz")
+    monkeypatch.setattr(github_api.gh_session, "request", send_live)
+    monkeypatch.setattr(github_api, "cassette", Cassette(path, MODE_RECORD))
+    recorded = count_unique_contributors.collect_unique_contributors_pipelined("emulated-org", repositories, 4)
+    github_api.cassette.close()
+
+    monkeypatch.setattr(github_api.gh_session, "request", send_offline)
+    monkeypatch.setattr(github_api, "cassette", Cassette(path, MODE_REPLAY))
+    monkeypatch.setattr(github_api, "request_memo", RequestMemo())
+    replayed = count_unique_contributors.collect_unique_contributors_pipelined("emulated-org", repositories, 4)
+
+    unique_contributors, _, failed_users = recorded
+    assert failed_users == []
+    assert unique_contributors["user-00001"]["name"] == "Name of user-00001"
+    assert replayed == recorded
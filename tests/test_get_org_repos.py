@@ -0,0 +1,51 @@
+import threading
+import time
+
+from github_influence import github_api
+from github_influence.get_org_repos import get_organization_repos
+
+
+def record_page_fetches(monkeypatch, delays):
+    """
+    Records the pages of the requests in the order they finish, and the most requests in flight,
+    with a page delayed by the seconds in delays.
+    """
+    fetches = {"finished": [], "in_flight": 0, "most_in_flight": 0}
+    lock = threading.Lock()
+    fetch_github_api_response = github_api.fetch_github_api_response
+
+    def fetch_with_delay(url, params=None):
+        page = int((params or {}).get("page", 1))
+        with lock:
+            fetches["in_flight"] += 1
+            fetches["most_in_flight"] = max(fetches["most_in_flight"], fetches["in_flight"])
+        time.sleep(delays.get(page, 0))
+        response = fetch_github_api_response(url, params)
+        with lock:
+            fetches["in_flight"] -= 1
+            fetches["finished"].append(page)
+        return response
+
+    monkeypatch.setattr(github_api, "fetch_github_api_response", fetch_with_delay)
+    return fetches
+
+
+def test_repos_in_page_order_while_later_pages_are_fetched(emulator, monkeypatch):
+    emulator(repos=350)
+    # The second page arrives after the later ones
+    fetches = record_page_fetches(monkeypatch, {2: 0.3})
+
+    repos = get_organization_repos("emulated-org")
+
+    assert repos == ["repo-%05d" % index for index in range(350)]
+    assert sorted(fetches["finished"]) == [1, 2, 3, 4]
+    assert fetches["finished"][-1] == 2
+    assert fetches["most_in_flight"] == 3
+
+
+def test_repos_of_a_single_page_org(emulator, monkeypatch):
+    emulator(repos=5)
+    fetches = record_page_fetches(monkeypatch, {})
+
+    assert get_organization_repos("emulated-org") == ["repo-%05d" % index for index in range(5)]
+    assert fetches["finished"] == [1]
@@ -0,0 +1,121 @@
+import json
+
+import requests
+
+from github_influence import github_api
+from github_influence.rate_limit import RateLimitScheduler
+
+ORG_URL = "https://api.github.com/orgs/emulated-org"
+ISSUES_URL = "https://api.github.com/repos/emulated-org/repo-00000/issues"
+
+
+def make_response(items, link=None):
+    response = requests.models.Response()
+    response.status_code = 200
+    response._content = json.dumps(items).encode()
+    if link:
+        response.headers["Link"] = link
+    return response
+
+
+def test_resolve_url_of_enterprise_server(monkeypatch):
+    monkeypatch.setattr(github_api, "api_url", "https://ghe.example.com/api/v3")
+
+    assert github_api.resolve_url("http://api.github.com/repos/a/b") == "https://ghe.example.com/api/v3/repos/a/b"
+    assert github_api.resolve_url(github_api.GRAPHQL_API_URL) == "https://ghe.example.com/api/graphql"
+
+
+def test_count_items_reads_the_last_page(emulator, monkeypatch):
+    emulator(members=123)
+    requests_sent = []
+    send_github_request = github_api.send_github_request
+
+    def send_and_count(method, url, **kwargs):
+        requests_sent.append(kwargs["params"])
+        return send_github_request(method, url, **kwargs)
+
+    monkeypatch.setattr(github_api, "send_github_request", send_and_count)
+
+    assert github_api.count_items(ORG_URL + "/members") == 123
+    assert requests_sent == [{"page": "1", "per_page": "1"}]
+
+
+def test_count_items_without_the_last_page(monkeypatch):
+    # A single page without the Link header
+    monkeypatch.setattr(github_api, "request_github_api_response", lambda url, params=None: make_response([1, 2]))
+    assert github_api.count_items(ORG_URL + "/members") == 2
+
+    # A "next" link without "last" falls back to full pagination
+    next_link = '<https://api.github.com/orgs/emulated-org/members?page=2>; rel="next"'
+    monkeypatch.setattr(
+        github_api, "request_github_api_response", lambda url, params=None: make_response([1], next_link)
+    )
+    monkeypatch.setattr(github_api, "get_all_pages", lambda url, params=None: [[1, 2], [3, 4], [5]])
+    assert github_api.count_items(ORG_URL + "/members") == 5
+
+
+def test_iter_all_pages_in_page_order(emulator):
+    emulator(issues_per_repo=450)
+
+    pages = list(github_api.iter_all_pages(ISSUES_URL, {"state": "closed"}, page_workers=4))
+
+    assert [len(page) for page in pages] == [100, 100, 100, 100, 50]
+    # The emulator lists the newest issue first
+    assert [issue["number"] for page in pages for issue in page] == list(range(450, 0, -1))
+
+
+def test_rejected_requests_are_retried(monkeypatch):
+    rejected = make_response({"message": "You have exceeded a secondary rate limit"})
+    rejected.status_code = 403
+    rejected.headers["Retry-After"] = "0"
+    server_error = make_response({})
+    server_error.status_code = 502
+    responses = [rejected, server_error, make_response({"login": "emulated-org"})]
+    monkeypatch.setattr(github_api.gh_session, "request", lambda *args, **kwargs: responses.pop(0))
+    monkeypatch.setattr(github_api, "get_retry_backoff", lambda retry: 0)
+    monkeypatch.setattr(github_api, "rate_limit_scheduler", RateLimitScheduler(10000, 10000))
+
+    attempts = {"retries": 0}
+    response = github_api.send_with_retries("GET", ORG_URL, "core", attempts)
+
+    assert response.status_code == 200
+    assert attempts["retries"] == 2
+
+
+def test_exhausted_token_waits_for_the_reset(emulator, monkeypatch):
+    server = emulator(rate_limit=1, rate_limit_window=1)
+    monkeypatch.setattr(github_api, "rate_limit_scheduler", RateLimitScheduler(10000, 10000, tokens=["token"]))
+
+    for _ in range(2):
+        assert github_api.request_github_api(ORG_URL)["login"] == "emulated-org"
+
+    # The scheduler waits for the reset instead of sending a request to be rejected
+    assert server.RequestHandlerClass.state.get_stats()["rate_limited"] == 0
+
+
+def test_requests_rotate_across_the_tokens(emulator, monkeypatch):
+    server = emulator(rate_limit=2, rate_limit_window=3600)
+    scheduler = RateLimitScheduler(10000, 10000, tokens=["token1", "token2"])
+    monkeypatch.setattr(github_api, "rate_limit_scheduler", scheduler)
+
+    # Two requests of each token, none of them is rejected
+    for _ in range(4):
+        github_api.send_github_request("GET", ORG_URL)
+
+    assert server.RequestHandlerClass.state.get_stats()["rate_limited"] == 0
+    assert scheduler.remaining == {("token1", "core"): 0, ("token2", "core"): 0}
+
+
+def test_http_options_do_not_grow_the_transient_errors(monkeypatch):
+    monkeypatch.setattr(github_api, "http2_client", None)
+    monkeypatch.setattr(github_api, "request_errors", github_api.request_errors)
+    monkeypatch.setattr(github_api, "transient_errors", github_api.transient_errors)
+
+    github_api.set_http_options(http2=True)
+    transient_errors = github_api.transient_errors
+    github_api.set_http_options(http2=True)
+    assert github_api.transient_errors == transient_errors
+
+    github_api.set_http_options(http2=False)
+    assert github_api.request_errors == github_api.REQUESTS_ERRORS
+    assert github_api.transient_errors == github_api.REQUESTS_TRANSIENT_ERRORS
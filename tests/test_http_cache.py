@@ -0,0 +1,80 @@
+import pytest
+import requests
+
+from github_influence import github_api
+from github_influence.http_cache import HttpCache
+
+ORG_URL = "https://api.github.com/orgs/emulated-org"
+USER_URL = "https://api.github.com/users/user-00042"
+
+
+def make_response(body, etag=None):
+    response = requests.models.Response()
+    response.status_code = 200
+    response._content = body
+    if etag:
+        response.headers["ETag"] = etag
+    return response
+
+
+def serve_with_http_cache(emulator, monkeypatch, path, **org_options):
+    server = emulator(**org_options)
+    cache = HttpCache(str(path))
+    monkeypatch.setattr(github_api, "http_cache", cache)
+    # Every request reaches the cache, not the in-run memo
+    monkeypatch.setattr(github_api, "request_memo", None)
+    return server, cache
+
+
+def test_not_modified_response_is_served_from_the_cache(emulator, monkeypatch, tmp_path):
+    server, http_cache = serve_with_http_cache(emulator, monkeypatch, tmp_path / "http-cache.sqlite")
+
+    first = github_api.request_github_api(ORG_URL)
+    cached = http_cache.get(ORG_URL)
+    second = github_api.request_github_api(ORG_URL)
+
+    assert cached.conditional_headers() == {"If-None-Match": cached.etag}
+    assert second == first
+    # The emulator answers the If-None-Match of the second request with 304
+    assert server.RequestHandlerClass.state.get_stats()["not_modified"] == 1
+    http_cache.close()
+
+
+def test_error_responses_are_not_cached(emulator, monkeypatch, tmp_path):
+    server, http_cache = serve_with_http_cache(emulator, monkeypatch, tmp_path / "http-cache.sqlite", users=100)
+
+    github_api.request_github_api(USER_URL)
+    # The user is deleted, so the revalidation gets 404 instead of the cached profile
+    server.RequestHandlerClass.org.users = 10
+    with pytest.raises(Exception, match="404"):
+        github_api.request_github_api(USER_URL)
+    with pytest.raises(Exception, match="404"):
+        github_api.request_github_api("https://api.github.com/users/nobody")
+
+    # The stale profile is not returned, and the errors are not stored
+    assert http_cache.get(USER_URL).etag is not None
+    assert http_cache.get("https://api.github.com/users/nobody") is None
+    assert server.RequestHandlerClass.state.get_stats()["not_modified"] == 0
+    http_cache.close()
+
+
+def test_least_recently_used_responses_are_evicted_by_size(tmp_path):
+    cache = HttpCache(str(tmp_path / "http-cache.sqlite"), max_megabytes=3000 / (1024 * 1024))
+
+    cache.put("a", make_response(b"a" * 1000, etag='"a"'))
+    cache.put("b", make_response(b"b" * 1000, etag='"b"'))
+    # Without a validator, a response cannot be revalidated, so it is not stored
+    cache.put("c", make_response(b"c" * 1000))
+    # "a" is used, so "b" is the least recently used one
+    assert cache.get("a").body == b"a" * 1000
+    cache.put("d", make_response(b"d" * 1500, etag='"d"'))
+
+    assert cache.get("b") is None
+    assert cache.get("c") is None
+    assert [cache.get(url).etag for url in ["a", "d"]] == ['"a"', '"d"']
+    assert cache.total_bytes == 2500
+
+    # A response larger than the cache is not stored
+    cache.put("e", make_response(b"e" * 4000, etag='"e"'))
+    assert cache.get("e") is None
+    cache.close()
@@ -0,0 +1,83 @@
+import datetime
+
+from github_influence import orgs
+from github_influence.watermarks import WATERMARK_FORMAT, WatermarkStore
+
+
+def test_reclosed_issue_is_counted_once_and_reopened_issue_is_dropped(tmp_path, monkeypatch):
+    pages = [
+        # The first run: issues 1, 5 and pull request 2 are closed since 'since', issue 3 before it
+        [
+            {"number": 1, "state": "closed", "closed_at": "2023-02-01T00:00:00Z"},
+            {"number": 2, "state": "closed", "closed_at": "2023-03-01T00:00:00Z", "pull_request": {}},
+            {"number": 3, "state": "closed", "closed_at": "2022-12-31T00:00:00Z"},
+            {"number": 5, "state": "closed", "closed_at": "2023-03-02T00:00:00Z"},
+        ],
+        # The next run: issue 1 is reopened and closed again after the watermark, issue 4 is new,
+        # and issue 5 is reopened and still open
+        [
+            {"number": 1, "state": "closed", "closed_at": "2023-05-01T00:00:00Z"},
+            {"number": 4, "state": "closed", "closed_at": "2023-05-02T00:00:00Z"},
+            {"number": 5, "state": "open", "closed_at": None},
+        ],
+    ]
+    scans = []
+
+    def iter_projected_items(url, fields, params=None, page_workers=None):
+        scans.append((params["state"], params["since"]))
+        return iter(pages[len(scans) - 1])
+
+    window = {"since": "2023-01-01", "until": "2023-12-31", "issues-backend": "rest"}
+    store = WatermarkStore(str(tmp_path / "watermarks.json"), window)
+    monkeypatch.setattr(orgs, "iter_projected_items", iter_projected_items)
+    monkeypatch.setattr(orgs, "watermark_store", store)
+    monkeypatch.setattr(orgs, "since", datetime.date(2023, 1, 1))
+    monkeypatch.setattr(orgs, "until", datetime.date(2023, 12, 31))
+    monkeypatch.setattr(orgs, "issues_backend", orgs.ISSUES_BACKEND_REST)
+
+    first = orgs.count_closed_issues_incrementally("org/repo", "2023-04-01T00:00:00Z")
+    store.save()
+    store = WatermarkStore(str(tmp_path / "watermarks.json"), window)
+    monkeypatch.setattr(orgs, "watermark_store", store)
+    second = orgs.count_closed_issues_incrementally("org/repo", "2023-06-01T00:00:00Z")
+
+    assert first == {"issues": 2, "prs": 1}
+    assert second == {"issues": 2, "prs": 1}
+    assert scans == [("closed", "2023-01-01T00:00:00Z"), ("all", "2023-04-01T00:00:00Z")]
+    assert store.get_numbers("org/repo", "issues") == ({1, 4}, "2023-06-01T00:00:00Z")
+
+
+def test_incremental_commits_equal_a_full_rescan(emulator, tmp_path, monkeypatch):
+    server = emulator(repos=1, commits=300)
+    org = server.RequestHandlerClass.org
+    full_name = "emulated-org/repo-00000"
+    commits_url = orgs.REPOS_API_URL + full_name + "/commits"
+    window = {"since": "2023-01-01", "until": "2030-01-01", "issues-backend": "rest"}
+    path = str(tmp_path / "watermarks.json")
+    monkeypatch.setattr(orgs, "since", datetime.date(2023, 1, 1))
+    monkeypatch.setattr(orgs, "until", datetime.date(2030, 1, 1))
+    monkeypatch.setattr(orgs, "overlap_days", 7)
+
+    def run():
+        store = WatermarkStore(path, window)
+        monkeypatch.setattr(orgs, "watermark_store", store)
+        now = datetime.datetime.now(datetime.timezone.utc)
+        count = orgs.count_commits_incrementally(full_name, now.strftime(WATERMARK_FORMAT))
+        store.save()
+        return count
+
+    def timestamp(moment):
+        return moment.strftime(WATERMARK_FORMAT)
+
+    now = datetime.datetime.now(datetime.timezone.utc)
+    # A commit dated after the watermark of the first run, which fetches it
+    org.push_commits(0, [timestamp(now + datetime.timedelta(hours=1))])
+    first = run()
+    # Commits pushed after the first run, one dated before its watermark, e.g., of a merged branch
+    org.push_commits(0, [timestamp(now + datetime.timedelta(hours=2)), timestamp(now - datetime.timedelta(days=2))])
+    second = run()
+    third = run()
+
+    assert first == 301
+    assert second == 303
+    assert third == second == orgs.get_commits_during_the_period(commits_url, orgs.since, orgs.until)
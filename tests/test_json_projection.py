@@ -0,0 +1,49 @@
+import gc
+import tracemalloc
+
+from github_influence import github_api
+from github_influence.commit_store import COMMIT_FIELDS
+from github_influence.json_projection import iter_array_items, iter_projected_items, project
+
+
+def test_project_keeps_the_nesting_and_nulls():
+    commit = {"sha": "a", "author": None, "commit": {"author": {"date": "d", "name": "n"}, "message": "m"}}
+
+    assert project(commit, ["sha", "author.login", "commit.author.date", "missing"]) == {
+        "sha": "a",
+        "author": None,
+        "commit": {"author": {"date": "d"}},
+    }
+
+
+def test_iter_projected_items_does_not_change_the_items():
+    items = [{"a": 1, "b": 2}, {"a": 3, "b": 4}]
+
+    assert list(iter_projected_items(items, ["a"])) == [{"a": 1}, {"a": 3}]
+    assert items == [{"a": 1, "b": 2}, {"a": 3, "b": 4}]
+
+
+def test_iter_array_items():
+    assert list(iter_array_items(b'[{"a": 1.5}, {"b": null}]')) == [{"a": 1.5}, {"b": None}]
+
+
+def measure_peak(function):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = function()
+        return result, tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_projected_commits_take_less_than_half_the_memory(emulator):
+    emulator(repos=1, commits=5000)
+    commits_url = "https://api.github.com/repos/emulated-org/repo-00000/commits"
+
+    commits, full_peak = measure_peak(lambda: list(github_api.iter_all_items(commits_url)))
+    projected, projected_peak = measure_peak(lambda: list(github_api.iter_projected_items(commits_url, COMMIT_FIELDS)))
+
+    assert len(projected) == len(commits) == 5000
+    assert projected == [project(commit, COMMIT_FIELDS) for commit in commits]
+    assert projected_peak < full_peak / 2
@@ -0,0 +1,174 @@
+import csv
+import datetime
+import os
+import time
+
+from github_influence import github_api, orgs
+
+ISSUES_URL = "https://api.github.com/repos/emulated-org/repo-00000/issues"
+
+
+def test_scan_issues_since_counts_issues_and_prs(emulator):
+    # Every third one of the emulator is a pull request
+    emulator(issues_per_repo=300)
+
+    assert orgs.scan_issues_since(ISSUES_URL, "closed", "2023-01-01") == {"issues": 200, "prs": 100}
+    assert orgs.get_issues_since(ISSUES_URL, "closed", "2023-01-01") == 200
+    assert orgs.get_prs_since(ISSUES_URL, "closed", "2023-01-01") == 100
+
+
+def test_rows_in_the_order_of_the_repos(emulator, monkeypatch):
+    server = emulator(repos=4, commits=400, issues_per_repo=30, contributors_per_repo=3)
+    org = server.RequestHandlerClass.org
+    repos = [org.get_repo(github_api.api_url, index) for index in range(4)]
+    get_commits_during_the_period = orgs.get_commits_during_the_period
+
+    def get_commits_with_delay(url, since, until):
+        # The first repository is the last one to finish
+        if "/repo-00000/" in url:
+            time.sleep(0.2)
+        return get_commits_during_the_period(url, since, until)
+
+    monkeypatch.setattr(orgs, "get_commits_during_the_period", get_commits_with_delay)
+    monkeypatch.setattr(orgs, "since", datetime.date(2023, 1, 1))
+    monkeypatch.setattr(orgs, "until", datetime.date(2023, 12, 31))
+
+    rows = orgs.collect_repos_statistics(repos, 4).get_rows()
+
+    assert [row[0] for row in rows] == ["repo-%05d" % index for index in range(4)]
+    assert orgs.collect_repos_statistics(repos, 1).get_rows() == rows
+
+
+def test_search_backend_counts_closed_issues_and_prs_in_the_period(monkeypatch):
+    queries = []
+
+    def request_github_api(url, params=None):
+        queries.append(params)
+        return {"total_count": 7 if "is:issue" in params["q"] else 3, "incomplete_results": False, "items": []}
+
+    monkeypatch.setattr(github_api, "request_github_api", request_github_api)
+
+    assert orgs.search_closed_issues("org/repo", "2023-01-01", "2023-12-31") == {"issues": 7, "prs": 3}
+    # A request of a single item per count
+    assert queries == [
+        {"q": "repo:org/repo is:issue is:closed closed:2023-01-01..2023-12-31", "per_page": "1"},
+        {"q": "repo:org/repo is:pr is:closed closed:2023-01-01..2023-12-31", "per_page": "1"},
+    ]
+
+
+def test_graphql_backend_falls_back_to_rest_for_a_repo_without_data(emulator, monkeypatch):
+    server = emulator(repos=3, commits=300, issues_per_repo=30, contributors_per_repo=5)
+    org = server.RequestHandlerClass.org
+    # repo-00099 is deleted after the listing
+    repos = [org.get_repo(github_api.api_url, index) for index in range(3)]
+    repos.append(dict(repos[0], name="repo-00099", full_name="emulated-org/repo-00099"))
+    queries = []
+
+    def request_github_graphql(query, variables=None):
+        queries.append(query)
+        data = {}
+        for index in [0, 2]:
+            data[f"repo{index}"] = {
+                "name": repos[index]["name"],
+                "nameWithOwner": repos[index]["full_name"],
+                "forkCount": index + 1,
+                "stargazerCount": index + 2,
+                "defaultBranchRef": {"target": {"history": {"totalCount": index + 3}}},
+            }
+            data[f"repo{index}_issues"] = {"issueCount": index + 4}
+            data[f"repo{index}_prs"] = {"issueCount": index + 5}
+        # Not found: repo-00001 is renamed and repo-00099 is deleted
+        data.update({"repo1": None, "repo1_issues": None, "repo1_prs": None})
+        data.update({"repo3": None, "repo3_issues": None, "repo3_prs": None})
+        return data
+
+    monkeypatch.setattr(orgs, "request_github_graphql", request_github_graphql)
+    monkeypatch.setattr(orgs, "since", datetime.date(2023, 1, 1))
+    monkeypatch.setattr(orgs, "until", datetime.date(2023, 7, 1))
+    monkeypatch.setattr(orgs, "issues_backend", orgs.ISSUES_BACKEND_REST)
+
+    table = orgs.collect_repos_statistics_by_graphql(iter(repos), 4)
+
+    repo_1 = repos[1]
+    commits_url = orgs.REPOS_API_URL + repo_1["full_name"] + "/commits"
+    issues_url = orgs.REPOS_API_URL + repo_1["full_name"] + "/issues"
+    closed_counts = orgs.scan_issues_since(issues_url, "closed", orgs.since)
+    assert len(queries) == 1
+    assert 'repo3: repository(owner: "emulated-org", name: "repo-00099")' in queries[0]
+    assert table.get_rows() == [
+        ["repo-00000", "https://github.com/emulated-org/repo-00000", 3, 1, 2, 4, 5, 5],
+        [
+            "repo-00001",
+            "https://github.com/emulated-org/repo-00001",
+            orgs.get_commits_during_the_period(commits_url, orgs.since, orgs.until),
+            repo_1["forks_count"],
+            repo_1["stargazers_count"],
+            closed_counts["issues"],
+            closed_counts["prs"],
+            5,
+        ],
+        ["repo-00002", "https://github.com/emulated-org/repo-00002", 5, 3, 4, 6, 7, 5],
+    ]
+
+
+def test_monthly_commits_equal_a_commits_query_per_month(emulator, tmp_path, monkeypatch):
+    from dateutil.relativedelta import relativedelta
+
+    # A commit at the midnight of every day, so the month boundaries have commits
+    emulator(repos=2, commits=730)
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("results")
+    monkeypatch.setattr(orgs, "since", datetime.date(2023, 1, 1))
+    monkeypatch.setattr(orgs, "until", datetime.date(2023, 12, 31))
+    monkeypatch.setattr(orgs, "commit_store", None)
+    monkeypatch.setattr(orgs, "max_workers", 2)
+
+    orgs.get_monthly_commits(orgs.BASE_URL_OF_ORGS_API + "emulated-org/repos", [])
+
+    with open("results/org-monthly-commits.csv") as csv_file:
+        rows = list(csv.reader(csv_file))
+
+    # A commits query per month, from a month start until the next month start
+    expected_rows = []
+    for repo_name in ["repo-00000", "repo-00001"]:
+        commits_url = orgs.REPOS_API_URL + "emulated-org/" + repo_name + "/commits"
+        month_start = orgs.since
+        counts = []
+        while month_start + relativedelta(months=1) < orgs.until:
+            month_end = month_start + relativedelta(months=1)
+            counts.append(orgs.get_commits_during_the_period(commits_url, month_start, month_end))
+            month_start = month_end
+        counts.append(orgs.get_commits_during_the_period(commits_url, month_start, orgs.until))
+        expected_rows.append([repo_name] + [str(count) for count in counts] + [str(sum(counts))])
+
+    assert rows[0] == ["YYYY-MM"] + [f"2023-{month:02d}" for month in range(1, 13)] + ["Sum"]
+    assert rows[1:] == expected_rows
+    # The commit at the midnight of February 1 is counted in January and February
+    assert expected_rows[0][1:3] == ["32", "29"]
+
+
+def test_rows_in_page_order_while_later_pages_are_fetched(emulator, monkeypatch):
+    emulator(repos=7, commits=70, issues_per_repo=6, contributors_per_repo=2)
+    # Pages of two repositories, the second page arrives after the later ones
+    monkeypatch.setattr(github_api, "PER_PAGE_100", "2")
+    fetch_github_api_response = github_api.fetch_github_api_response
+    finished_pages = []
+
+    def fetch_with_delay(url, params=None):
+        page = (params or {}).get("page")
+        if url == orgs.BASE_URL_OF_ORGS_API + "emulated-org/repos" and page == "2":
+            time.sleep(0.3)
+        response = fetch_github_api_response(url, params)
+        if url == orgs.BASE_URL_OF_ORGS_API + "emulated-org/repos":
+            finished_pages.append(page)
+        return response
+
+    monkeypatch.setattr(github_api, "fetch_github_api_response", fetch_with_delay)
+    monkeypatch.setattr(orgs, "since", datetime.date(2023, 1, 1))
+    monkeypatch.setattr(orgs, "until", datetime.date(2023, 7, 1))
+
+    repos = github_api.iter_all_items(orgs.BASE_URL_OF_ORGS_API + "emulated-org/repos", page_workers=3)
+    table = orgs.collect_repos_statistics(repos, 4)
+
+    assert finished_pages[-1] == "2"
+    assert [row[0] for row in table.get_rows()] == ["repo-%05d" % index for index in range(7)]
@@ -0,0 +1,69 @@
+import argparse
+import datetime
+import json
+import os
+
+from github_influence import github_api, orgs
+from github_influence.profiling import add_profile_arguments, start_profiling, stop_profiling
+
+REPOS_URL = orgs.BASE_URL_OF_ORGS_API + "emulated-org/repos"
+
+
+def profile(collect, job):
+    """Runs collect with --profile, and returns the events of the written trace."""
+    parser = argparse.ArgumentParser()
+    add_profile_arguments(parser)
+    start_profiling(parser.parse_args(["--profile"]))
+    collect()
+    paths = stop_profiling("emulated-org", job)
+
+    assert len(paths) == 1
+    assert os.path.basename(paths[0]).startswith(f"(emulated-org)profile-{job}-")
+    assert paths[0].endswith(".trace.json")
+    with open(paths[0]) as trace_file:
+        trace = json.load(trace_file)
+    return trace["traceEvents"]
+
+
+def request_github_graphql(query, variables=None):
+    """Answers the repository queries of the GraphQL backend, with the same counts for every repository."""
+    data = {}
+    for index in range(query.count(": repository(")):
+        data[f"repo{index}"] = {
+            "name": "repo-%05d" % index,
+            "nameWithOwner": "emulated-org/repo-%05d" % index,
+            "forkCount": 1,
+            "stargazerCount": 2,
+            "defaultBranchRef": {"target": {"history": {"totalCount": 3}}},
+        }
+        data[f"repo{index}_issues"] = {"issueCount": 4}
+        data[f"repo{index}_prs"] = {"issueCount": 5}
+    return data
+
+
+def test_profile_is_a_chrome_trace_with_the_spans_of_both_backends(emulator, tmp_path, monkeypatch):
+    emulator(repos=3, commits=30, issues_per_repo=6, contributors_per_repo=2)
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("results")
+    monkeypatch.setattr(orgs, "since", datetime.date(2023, 1, 1))
+    monkeypatch.setattr(orgs, "until", datetime.date(2023, 7, 1))
+    monkeypatch.setattr(orgs, "request_github_graphql", request_github_graphql)
+
+    rest_events = profile(lambda: orgs.collect_repos_statistics(github_api.iter_all_items(REPOS_URL), 4), "rest")
+    graphql_events = profile(
+        lambda: orgs.collect_repos_statistics_by_graphql(github_api.iter_all_items(REPOS_URL), 4), "graphql"
+    )
+
+    for events in [rest_events, graphql_events]:
+        spans = [event for event in events if event["ph"] == "X"]
+        # A complete event on a named thread
+        thread_ids = {event["tid"] for event in events if event["ph"] == "M" and event["name"] == "thread_name"}
+        assert all(event["dur"] >= 0 and event["ts"] >= 0 and event["tid"] in thread_ids for event in spans)
+        assert [event["name"] for event in spans].count("repo listing") == 1
+        assert [event["name"] for event in spans].count("contributors") == 3
+
+    rest_spans = {event["name"] for event in rest_events if event["ph"] == "X"}
+    graphql_spans = {event["name"] for event in graphql_events if event["ph"] == "X"}
+    assert rest_spans == {"repo listing", "commits", "issues and prs", "contributors"}
+    assert graphql_spans == {"repo listing", "graphql chunk", "contributors"}
+    assert [event["args"] for event in graphql_events if event["name"] == "graphql chunk"] == [{"repos": 3}]
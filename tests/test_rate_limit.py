@@ -0,0 +1,135 @@
+import time
+
+import pytest
+import requests
+
+from github_influence import github_api
+from github_influence.rate_limit import RESOURCE_CORE, RESOURCE_SEARCH, RateLimitScheduler
+
+ORG_URL = "https://api.github.com/orgs/org"
+
+
+def make_response(status_code, headers, text=""):
+    response = requests.models.Response()
+    response.status_code = status_code
+    response.headers.update(headers)
+    response._content = text.encode()
+    return response
+
+
+def test_requests_are_paced_by_the_token_bucket():
+    scheduler = RateLimitScheduler(20, burst=2)
+
+    start = time.monotonic()
+    for _ in range(2):
+        scheduler.acquire()
+    assert time.monotonic() - start < 0.05
+
+    # The bucket is empty, so the next requests wait for a token each
+    for _ in range(2):
+        scheduler.acquire()
+    assert time.monotonic() - start >= 0.09
+
+
+def test_exhausted_resource_waits_until_the_reset():
+    scheduler = RateLimitScheduler()
+    headers = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(int(time.time()) + 10)}
+    scheduler.update(None, make_response(200, dict(headers, **{"X-RateLimit-Resource": "search"})))
+
+    assert 10 < scheduler._choose_token(RESOURCE_SEARCH)[1] <= 11
+    # Other resources have their own limits
+    assert scheduler._choose_token(RESOURCE_CORE)[1] == 0
+
+
+def test_token_with_the_most_remaining_is_chosen():
+    scheduler = RateLimitScheduler(10000, 10000, tokens=["a", "b"])
+    reset = int(time.time()) + 3600
+    scheduler.remaining = {("a", RESOURCE_CORE): 10, ("b", RESOURCE_CORE): 20}
+    scheduler.reset_at = {("a", RESOURCE_CORE): reset, ("b", RESOURCE_CORE): reset}
+
+    assert scheduler.acquire() == "b"
+    assert scheduler.remaining[("b", RESOURCE_CORE)] == 19
+
+
+def test_exhausted_and_paused_tokens_are_out_of_rotation():
+    scheduler = RateLimitScheduler(10000, 10000, tokens=["a", "b", "c"])
+    scheduler.remaining = {("a", RESOURCE_CORE): 0}
+    scheduler.reset_at = {("a", RESOURCE_CORE): int(time.time()) + 3600}
+    scheduler.pause("b", RESOURCE_CORE, 3600)
+
+    assert [scheduler.acquire() for _ in range(3)] == ["c", "c", "c"]
+
+
+def test_searches_are_limited_per_token():
+    scheduler = RateLimitScheduler(10000, 10000, tokens=["a", "b"], search_requests_per_minute=2)
+
+    tokens = [scheduler.acquire(RESOURCE_SEARCH) for _ in range(4)]
+
+    assert sorted(tokens) == ["a", "a", "b", "b"]
+    # Every token has used its searches of the minute, while the core requests are not limited
+    _, wait = scheduler._choose_token(RESOURCE_SEARCH)
+    assert 55 < wait <= 60
+    assert scheduler._choose_token(RESOURCE_CORE)[1] == 0
+
+
+def send_to(monkeypatch, get_response, scheduler=None):
+    """
+    Sends the requests of github_api to get_response instead of the network, without the memo,
+    and returns the headers of the requests sent.
+    get_response is called with the number of the request and returns a response, or raises an error.
+    """
+    monkeypatch.setattr(github_api, "rate_limit_scheduler", scheduler or RateLimitScheduler(10000, 10000))
+    monkeypatch.setattr(github_api, "request_memo", None)
+    monkeypatch.setattr(github_api, "get_retry_backoff", lambda retry: 0)
+    sent_headers = []
+
+    def request(method, url, headers=None, **kwargs):
+        sent_headers.append(headers)
+        return get_response(len(sent_headers))
+
+    monkeypatch.setattr(github_api.gh_session, "request", request)
+    return sent_headers
+
+
+def test_rate_limited_request_is_retried_with_another_token(monkeypatch):
+    def get_response(number):
+        if number == 1:
+            return make_response(429, {"Retry-After": "3600"}, "secondary rate limit")
+        return make_response(200, {}, '{"login": "org"}')
+
+    sent_headers = send_to(monkeypatch, get_response, RateLimitScheduler(tokens=["a", "b"]))
+
+    assert github_api.request_github_api(ORG_URL) == {"login": "org"}
+    # The token rejected by the rate limit is paused, so the retry does not wait for it
+    assert sorted(headers["Authorization"] for headers in sent_headers) == ["token a", "token b"]
+
+
+def test_forbidden_request_is_not_retried(monkeypatch):
+    sent_headers = send_to(monkeypatch, lambda number: make_response(403, {}, "Must have admin rights to Repository."))
+
+    with pytest.raises(Exception, match="API error: 403"):
+        github_api.request_github_api(ORG_URL)
+    assert len(sent_headers) == 1
+
+
+def test_server_errors_and_timeouts_are_retried(monkeypatch):
+    def get_response(number):
+        if number == 1:
+            return make_response(502, {}, "Bad Gateway")
+        if number == 2:
+            raise requests.exceptions.ReadTimeout("Read timed out.")
+        return make_response(200, {}, '{"login": "org"}')
+
+    sent_headers = send_to(monkeypatch, get_response)
+
+    assert github_api.request_github_api(ORG_URL) == {"login": "org"}
+    assert len(sent_headers) == 3
+
+
+def test_server_errors_fail_after_the_retries(monkeypatch):
+    monkeypatch.setattr(github_api, "server_error_retries", 2)
+    sent_headers = send_to(monkeypatch, lambda number: make_response(503, {}, "Service Unavailable"))
+
+    with pytest.raises(Exception, match="API error: 503"):
+        github_api.request_github_api(ORG_URL)
+    assert len(sent_headers) == 3
@@ -0,0 +1,70 @@
+import threading
+
+import pytest
+import requests
+
+from github_influence.request_memo import RequestMemo
+
+
+def make_response(size, link=None):
+    response = requests.models.Response()
+    response.status_code = 200
+    response._content = b"x" * size
+    if link:
+        response.headers["Link"] = link
+    return response
+
+
+def test_concurrent_callers_share_the_request_in_flight():
+    memo = RequestMemo()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        started.set()
+        release.wait()
+        return make_response(10, '<https://api.github.com/x?page=2>; rel="next"')
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(memo.get_or_fetch("key", fetch)))
+    leader.start()
+    started.wait()
+    follower = threading.Thread(target=lambda: results.append(memo.get_or_fetch("key", fetch)))
+    follower.start()
+    while memo.hits == 0:
+        pass
+    release.set()
+    leader.join()
+    follower.join()
+
+    assert len(calls) == 1
+    assert results[0] is results[1]
+    # A page of a listing is not kept after it is finished
+    assert memo.in_flight == {}
+    assert memo.responses == {}
+
+
+def test_keeps_only_small_responses_within_the_bytes():
+    memo = RequestMemo(max_bytes=100, max_response_bytes=60)
+    memo.get_or_fetch("a", lambda: make_response(50))
+    memo.get_or_fetch("b", lambda: make_response(50))
+    memo.get_or_fetch("large", lambda: make_response(70))
+    assert list(memo.responses) == ["a", "b"]
+
+    memo.get_or_fetch("a", lambda: make_response(50))
+    memo.get_or_fetch("c", lambda: make_response(20))
+    assert list(memo.responses) == ["a", "c"]
+    assert memo.size == 70
+
+
+def test_failed_request_is_not_kept():
+    memo = RequestMemo()
+
+    def fail():
+        raise Exception("API error: 502")
+
+    with pytest.raises(Exception):
+        memo.get_or_fetch("key", fail)
+    assert memo.get_or_fetch("key", lambda: make_response(1)).content == b"x"
@@ -0,0 +1,67 @@
+import requests
+
+from github_influence.request_metrics import RequestMetrics, get_endpoint_and_repo, get_token_label
+
+GRAPHQL_URL = "https://api.github.com/graphql"
+COMMITS_URL = "https://api.github.com/repos/org/repo/commits"
+
+
+def make_response(resource, used, remaining, reset, status_code=200):
+    response = requests.models.Response()
+    response.status_code = status_code
+    response._content = b"{}"
+    response.headers.update(
+        {
+            "X-RateLimit-Resource": resource,
+            "X-RateLimit-Limit": str(used + remaining),
+            "X-RateLimit-Remaining": str(remaining),
+            "X-RateLimit-Used": str(used),
+            "X-RateLimit-Reset": str(reset),
+        }
+    )
+    return response
+
+
+def test_get_endpoint_and_repo():
+    assert get_endpoint_and_repo("https://ghe.example.com/api/v3/repos/org/repo/commits", {"page": "2"}) == (
+        "/repos/{owner}/{repo}/commits",
+        "org/repo",
+    )
+    assert get_endpoint_and_repo("https://api.github.com/search/issues", {"q": "repo:org/repo is:pr"}) == (
+        "/search/issues",
+        "org/repo",
+    )
+
+
+def test_quota_used_per_token_and_resource():
+    metrics = RequestMetrics()
+    # GraphQL queries of 1 and 25 points, and a response of the previous window arriving late
+    metrics.record_request(GRAPHQL_URL, None, make_response("graphql", 10, 4990, 2000), 0.1, 0, token="a")
+    metrics.record_request(GRAPHQL_URL, None, make_response("graphql", 35, 4965, 2000), 0.1, 0, token="a")
+    metrics.record_request(GRAPHQL_URL, None, make_response("graphql", 4, 4996, 1000), 0.1, 0, token="a")
+    # Two tokens of the core resource, a 304 response costs nothing
+    metrics.record_request(COMMITS_URL, None, make_response("core", 100, 4900, 2000), 0.1, 0, token="a")
+    metrics.record_request(COMMITS_URL, None, make_response("core", 101, 4899, 2000), 0.1, 0, token="a")
+    metrics.record_request(COMMITS_URL, None, make_response("core", 101, 4899, 2000, 304), 0.1, 0, token="a")
+    metrics.record_request(COMMITS_URL, None, make_response("core", 7, 4993, 2000), 0.1, 0, token="b")
+
+    rate_limits = {(item["token"], item["resource"]): item for item in metrics.to_dict()["rate_limits"]}
+
+    assert rate_limits[(get_token_label("a"), "graphql")]["quota_used"] == 26 + 1
+    assert rate_limits[(get_token_label("a"), "graphql")]["remaining"] == 4965
+    assert rate_limits[(get_token_label("a"), "core")]["quota_used"] == 2
+    assert rate_limits[(get_token_label("b"), "core")]["quota_used"] == 1
+    assert rate_limits[(get_token_label("b"), "core")]["remaining"] == 4993
+
+
+def test_prometheus_quota_is_labeled_by_resource_and_token(tmp_path):
+    metrics = RequestMetrics()
+    metrics.record_request(COMMITS_URL, None, make_response("core", 1, 4999, 2000), 0.1, 0, token="a")
+    path = tmp_path / "metrics.prom"
+
+    metrics.write_prometheus(str(path), "orgs")
+
+    label = get_token_label("a")
+    lines = path.read_text().splitlines()
+    assert f'github_api_quota_used_total{{job="orgs",resource="core",token="{label}"}} 1' in lines
+    assert f'github_api_rate_limit_remaining{{job="orgs",resource="core",token="{label}"}} 4999' in lines
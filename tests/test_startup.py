@@ -0,0 +1,37 @@
+import os
+import subprocess
+import sys
+
+ROOT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+COMMAND_MODULES = [
+    "github_influence.orgs",
+    "github_influence.count_unique_contributors",
+    "github_influence.get_org_repos",
+    "github_influence.commit_store",
+]
+# Prints the heavy libraries imported with a module
+IMPORT_CODE = """
+import sys
+import {module}
+print(",".join(name for name in ["pandas", "numpy", "dateutil"] if name in sys.modules))
+"""
+
+
+def test_commands_are_imported_without_configs_and_heavy_libraries(tmp_path):
+    # A directory without auth.json and config.json
+    env = dict(os.environ, PYTHONPATH=ROOT_DIRECTORY)
+
+    for module in COMMAND_MODULES:
+        output = subprocess.run(
+            [sys.executable, "-c", IMPORT_CODE.format(module=module)],
+            cwd=tmp_path,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+
+        assert output.strip() == "", module
+
+    # Neither results/ nor app.log is written by an import
+    assert list(tmp_path.iterdir()) == []
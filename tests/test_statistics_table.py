@@ -0,0 +1,26 @@
+from github_influence.statistics_table import StatisticsTable
+
+
+def test_sum_row():
+    table = StatisticsTable(["Repo", "Repo link", "Commits", "Stars"])
+    table.append(["a", "https://github.com/org/a", 3, 10])
+    table.append(["b", "https://github.com/org/b", 4, 0])
+
+    assert table.get_rows() == [["a", "https://github.com/org/a", 3, 10], ["b", "https://github.com/org/b", 4, 0]]
+    assert table.get_sum_row() == ["Sum", "-", 7, 10]
+
+
+def test_sum_row_of_no_rows():
+    table = StatisticsTable(["Repo", "Repo link", "Commits"])
+
+    assert table.get_sum_row() == ["Sum", "-", 0]
+
+
+def test_write_csv(tmp_path):
+    table = StatisticsTable(["Repo", "Repo link", "Commits"])
+    table.append(["a", "link", 3])
+    path = tmp_path / "statistics.csv"
+
+    table.write_csv(str(path))
+
+    assert path.read_text().splitlines() == ["Repo,Repo link,Commits", "a,link,3", "Sum,-,3"]
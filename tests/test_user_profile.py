@@ -0,0 +1,142 @@
+import json
+import logging
+import re
+import time
+
+import pytest
+import requests
+
+from github_influence import count_unique_contributors, github_api
+from github_influence.user_cache import UserCache
+
+
+def make_response(status_code, headers=None):
+    response = requests.models.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response._content = b'{"login": "user", "name": "User", "email": null, "type": "User"}'
+    return response
+
+
+@pytest.fixture
+def user_cache(tmp_path, monkeypatch):
+    cache = UserCache(str(tmp_path / "users.sqlite"))
+    monkeypatch.setattr(count_unique_contributors, "user_cache", cache)
+    return cache
+
+
+def test_profile_is_revalidated_after_its_ttl(user_cache, monkeypatch):
+    sent_headers = []
+
+    def send_github_request(method, url, headers=None):
+        sent_headers.append(headers)
+        if headers and headers.get("If-None-Match") == '"v1"':
+            return make_response(304)
+        return make_response(200, {"ETag": '"v1"'})
+
+    monkeypatch.setattr(count_unique_contributors, "send_github_request", send_github_request)
+
+    assert count_unique_contributors.get_user_profile("user")["name"] == "User"
+    # Within the TTL, no request
+    assert count_unique_contributors.get_user_profile("user")["name"] == "User"
+    assert len(sent_headers) == 1
+
+    user_cache.ttl = 0
+    assert count_unique_contributors.get_user_profile("user")["name"] == "User"
+    assert sent_headers[1] == {"If-None-Match": '"v1"'}
+    # The 304 restarts the TTL
+    user_cache.ttl = 60
+    assert count_unique_contributors.get_user_profile("user")["name"] == "User"
+    assert len(sent_headers) == 2
+
+
+def test_least_recently_used_users_are_evicted(tmp_path):
+    cache = UserCache(str(tmp_path / "users.sqlite"), max_entries=2)
+
+    # Apart in time, so the users have distinct access times
+    cache.put("a", {"login": "a"})
+    time.sleep(0.01)
+    cache.put("b", {"login": "b"})
+    time.sleep(0.01)
+    cache.get("a")
+    time.sleep(0.01)
+    cache.put("c", {"login": "c"})
+
+    assert cache.get("b") is None
+    assert cache.get("a").profile == {"login": "a", "name": None, "email": None, "type": None}
+    assert cache.get("c") is not None
+
+
+def test_not_found_user_is_cached(user_cache, monkeypatch):
+    monkeypatch.setattr(count_unique_contributors, "send_github_request", lambda *args, **kwargs: make_response(404))
+
+    with pytest.raises(Exception, match="404"):
+        count_unique_contributors.get_user_profile("deleted")
+    assert user_cache.get("deleted").failed
+
+
+def test_transient_errors_are_not_cached(user_cache, monkeypatch):
+    def fail(*args, **kwargs):
+        raise Exception("API request rate limit exceeded.")
+
+    monkeypatch.setattr(count_unique_contributors, "send_github_request", fail)
+    with pytest.raises(Exception, match="rate limit"):
+        count_unique_contributors.get_user_profile("user")
+    assert user_cache.get("user") is None
+
+    monkeypatch.setattr(count_unique_contributors, "send_github_request", lambda *args, **kwargs: make_response(502))
+    with pytest.raises(Exception, match="502"):
+        count_unique_contributors.get_user_profile("user")
+    assert user_cache.get("user") is None
+
+    monkeypatch.setattr(count_unique_contributors, "send_github_request", lambda *args, **kwargs: make_response(200))
+    assert count_unique_contributors.get_user_profile("user")["name"] == "User"
+
+
+def test_not_found_graphql_users_are_not_logged_as_errors(user_cache, monkeypatch, caplog):
+    graphql_response = requests.models.Response()
+    graphql_response.status_code = 200
+    graphql_response._content = json.dumps(
+        {
+            "data": {"user0": {"login": "user", "name": "User", "email": ""}, "user1": None},
+            "errors": [
+                {
+                    "type": "NOT_FOUND",
+                    "path": ["user1"],
+                    "message": "Could not resolve to a User with the login of 'renamed'.",
+                }
+            ],
+        }
+    ).encode()
+    monkeypatch.setattr(github_api, "send_github_request", lambda *args, **kwargs: graphql_response)
+    monkeypatch.setattr(count_unique_contributors, "send_github_request", lambda *args, **kwargs: make_response(404))
+
+    with caplog.at_level(logging.DEBUG, logger="my_logger"):
+        profiles = count_unique_contributors.get_user_profiles_by_graphql(["user", "renamed"])
+
+    assert profiles["user"]["email"] is None
+    assert isinstance(profiles["renamed"], Exception)
+    assert not [record for record in caplog.records if record.levelno >= logging.ERROR]
+    assert "User renamed not found by GraphQL, fall back to REST" in caplog.messages
+
+
+def test_graphql_users_are_queried_in_chunks_and_cached(user_cache, monkeypatch):
+    queries = []
+
+    def request_github_graphql(query, variables=None, handled_error_types=None):
+        queries.append(query)
+        return {
+            f"user{index}": {"login": login, "name": f"Name of {login}", "email": ""}
+            for index, login in enumerate(re.findall(r'user\(login: "([^"]+)"\)', query))
+        }
+
+    monkeypatch.setattr(count_unique_contributors, "request_github_graphql", request_github_graphql)
+    usernames = [f"user{index}" for index in range(150)]
+
+    profiles = count_unique_contributors.get_user_profiles_by_graphql(usernames)
+
+    assert len(queries) == 2
+    assert profiles["user149"] == {"login": "user149", "name": "Name of user149", "email": None, "type": "User"}
+    # The fresh profiles in the user cache are used without a query
+    assert count_unique_contributors.get_user_profiles_by_graphql(usernames) == profiles
+    assert len(queries) == 2